@@ -3,7 +3,6 @@ from __future__ import annotations
 from poke_team import Trainer
 from battle_mode import BattleMode
 from math import ceil
-from data_structures.sorted_list_adt import ListItem
 
 class Battle:
     def __init__(self, trainer_1: Trainer, trainer_2: Trainer, battle_mode: BattleMode, criterion = "health") -> None:
@@ -20,6 +19,26 @@ class Battle:
         self.trainer_2: Trainer = trainer_2
         self.battle_mode: Trainer = battle_mode
         self.criterion: Trainer = criterion
+        self.rounds: int = 0 # rounds fought in the last commence_battle()
+        self.evolutions: int = 0 # pokemons evolved in the last commence_battle()
+
+    @staticmethod
+    def profile():
+        """
+        __description__: Times the phases of the battles run inside a with block: effectiveness lookups, damage,
+                         container operations, levelling up, printing and team setup. Costs nothing outside of the block.
+
+        __returns__:
+                    A context manager yielding a profiling.phases.PhaseProfile; its as_dict() gives the calls and
+                    nanoseconds per phase once the block has ended.
+
+        Usage:
+            with Battle.profile() as phases:
+                battle.commence_battle()
+            phases.as_dict()
+        """
+        from profiling.phases import profile
+        return profile()
 
     def commence_battle(self) -> Trainer | None:
         """
@@ -31,16 +50,36 @@ class Battle:
         __complexity__: Please refer to the docstrings of the methods called.
         """
         
+        stages: int = self._evolution_stages()
+        
         # if the battle mode is a SET
         if self.battle_mode == BattleMode.SET:
-            return self._set_battle()
+            winner = self._set_battle()
 
         # if the battle mode is ROTATE
         elif self.battle_mode == BattleMode.ROTATE:
-            return self._rotate_battle()
+            winner = self._rotate_battle()
         
         else:
-            return self._optimise_battle()
+            winner = self._optimise_battle()
+        
+        self.evolutions = self._evolution_stages() - stages
+        return winner
+    
+    def _evolution_stages(self) -> int:
+        """
+        __description__: Sums the evolution stages of both trainers' chosen pokemons, so the difference across a battle is the
+                         number of evolutions in it.
+        
+        __complexity__: BEST CASE: O(N), for N chosen pokemons, their stages being cached in Pokemon.EVOLUTION_STAGES.
+                        WORST CASE: O(N), for the same reason.
+        """
+        total: int = 0
+        for trainer in (self.trainer_1, self.trainer_2):
+            team = trainer.get_team()
+            for index in range(team.team_count):
+                total += team.selected_pokemons[index].get_evolution_stage()
+        return total
         
     def _create_teams(self, method: str = 'Random') -> None:
         """
@@ -90,6 +129,8 @@ class Battle:
             print(f'\nROUND {index + 1} OVER\n')
             index += 1
         
+        self.rounds = index
+        
         if set_team_1.is_empty() and not set_team_2.is_empty():
             return self.trainer_2
         elif set_team_2.is_empty() and not set_team_1.is_empty():
@@ -127,6 +168,8 @@ class Battle:
             print(f'\nROUND {index + 1} OVER\n')
             index += 1
         
+        self.rounds = index
+        
         if queue_team_1.is_empty() and not queue_team_2.is_empty():
             return self.trainer_2
         elif queue_team_2.is_empty() and not queue_team_1.is_empty():
@@ -142,7 +185,7 @@ class Battle:
                      Trainer | None: Winning trainer or draw.
                      
         __complexity__: Deleting at index: O(1) best case for having one element to shift to the left, O(N) for worst case
-                        for having N elements to be shifted to the left after removal. 
+                        for having N elements to be shifted to the left after removal. O(log N) if the teams are ArrayMinHeaps.
                         
                         For updating the list, check the _update_optimise_mode docstring.
         """ 
@@ -159,8 +202,8 @@ class Battle:
             
             # deleting takes O(1) as best case as there is only one element to shift to the left but in general,
             # all case scenarios involve O(N), where N is the number of elements to shift to the left.
-            pokemon_1 = self.trainer_1.get_trainer_team().delete_at_index(0).value
-            pokemon_2 = self.trainer_2.get_trainer_team().delete_at_index(0).value
+            pokemon_1 = self.trainer_1.get_trainer_team().delete_value_at_index(0)
+            pokemon_2 = self.trainer_2.get_trainer_team().delete_value_at_index(0)
             
             # registering pokemons
             self.trainer_1.register_pokemon(pokemon_2)
@@ -173,6 +216,8 @@ class Battle:
             print(f'\nROUND {index + 1} OVER\n')
             index += 1
         
+        self.rounds = index
+        
         if list_team_1.is_empty() and not list_team_2.is_empty():
             return self.trainer_2
         elif list_team_2.is_empty() and not list_team_1.is_empty():
@@ -185,11 +230,10 @@ class Battle:
         """
         __description__: Battle logic for a single round in a battle.
         
-        __complexity__: BEST CASE: O(1), where the trainers have little experience because they have not
-                        seen a lot of Pokemons and hence the complexity of O(len(BSet)) is minimal.
+        __complexity__: BEST CASE: O(N), where N is the number of poketypes. The pokedex completions come from len(BSet),
+                        which counts the bits of an integer holding one bit per poketype, and the effectiveness table is loaded.
                         
-                        WORST CASE: O(N), where the trainers have a lot of experience because they have seen
-                        a lot of Pokemons and hence the complexity of O(len(BSet)) is closer to O(N).
+                        WORST CASE: O(N^2), where the effectiveness table is not loaded yet and the first attack populates it.
         """
         
         # if p1 speed > p2 speed, p1 attacks first.
@@ -229,6 +273,10 @@ class Battle:
     def _update_set_mode(self, p1, p2):
         """
         __description__: Updating the stacks of the two trainer teams in SET mode.
+        
+        __complexity__: BEST CASE: O(1), when both pokemons faint and nothing is pushed.
+                        
+                        WORST CASE: O(1), pushing onto an ArrayStack does not depend on the team size.
         """
         
         # if both pokemons have fainted, leave them.
@@ -256,6 +304,10 @@ class Battle:
     def _update_rotate_mode(self, p1, p2):
         """
         __description__: Logic for ROTATE battles. Updates the queues.
+        
+        __complexity__: BEST CASE: O(1), when both pokemons faint and nothing is appended.
+                        
+                        WORST CASE: O(1), appending to a CircularQueue does not depend on the team size.
         """
         
         # if both pokemons are not alive, leave them.
@@ -289,6 +341,7 @@ class Battle:
                          - BEST CASE: O(log N) for adding an element to the far right of the list.
                          - WORST CASE: O(N) for adding an element to the far left of the list and shuffling
                         elements to the right as a result.
+                        Both cases are O(log N) if the teams are ArrayMinHeaps.
         """
         
         # if both pokemons faint, leave them.
@@ -298,32 +351,17 @@ class Battle:
         # if p1 is not alive, level up p2 and add back to the list.
         elif not p1.is_alive():
             p2.level_up()
-            if self.trainer_2.get_team().list_reversed:
-                self.trainer_2.get_trainer_team().add( ListItem(value= p2, key=1 / p2.get_health()))
-            else:
-                self.trainer_2.get_trainer_team().add( ListItem(value= p2, key=p2.get_health()))
-                
+            self.trainer_2.get_trainer_team().add_pair(p2, self.trainer_2.get_team().get_team_key(p2))
             print(f'{p1.get_name()} faints')
         
         # if p2 is not alive, level up p1 and add back to the list.
         elif not p2.is_alive():
             p1.level_up()
-            if self.trainer_1.get_team().list_reversed:
-                self.trainer_1.get_trainer_team().add(ListItem(value=p1, key=1 /p1.get_health()))
-            else:
-                self.trainer_1.get_trainer_team().add(ListItem(value=p1, key=p1.get_health()))
+            self.trainer_1.get_trainer_team().add_pair(p1, self.trainer_1.get_team().get_team_key(p1))
             print(f'{p2.get_name()} faints')
         
         # add both back to list.
         else:
             print("Both Pokemons are still alive. Going back to their teams")
-            
-            if self.trainer_2.get_team().list_reversed:
-                self.trainer_2.get_trainer_team().add( ListItem(value= p2, key=1 / p2.get_health()))
-            else:
-                self.trainer_2.get_trainer_team().add( ListItem(value= p2, key=p2.get_health()))
-            
-            if self.trainer_1.get_team().list_reversed:
-                self.trainer_1.get_trainer_team().add(ListItem(value=p1, key=1 /p1.get_health()))
-            else:
-                self.trainer_1.get_trainer_team().add(ListItem(value=p1, key=p1.get_health()))
\ No newline at end of file
+            self.trainer_2.get_trainer_team().add_pair(p2, self.trainer_2.get_team().get_team_key(p2))
+            self.trainer_1.get_trainer_team().add_pair(p1, self.trainer_1.get_team().get_team_key(p1))
\ No newline at end of file
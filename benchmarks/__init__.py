@@ -0,0 +1,9 @@
+"""
+Benchmarks for the simulation and its data structures.
+
+Each module can be run on its own, e.g. ``python -m benchmarks.bench_sorted_list``.
+The suite registered in benchmarks.suite also runs through
+``python run_tests.py --bench``, which writes JSON results and compares
+them with benchmarks/baseline.json. The baseline is not tracked, since
+timings only compare on one machine: the first run records it.
+"""
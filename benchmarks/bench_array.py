@@ -0,0 +1,92 @@
+"""
+Speed and memory benchmark of the ArrayR storage backends.
+
+For each backend this times construction, element-by-element reads and
+writes through ArrayR, and a block copy_from, and measures with tracemalloc
+the bytes per slot retained by the array and the peak while building it
+(the ctypes backend also builds a throwaway list of None). It then compares
+the memory taken by float payloads, such as HP values, in an ArrayR against
+a typed ArrayT.
+
+Usage: python -m benchmarks.bench_array [size ...]
+"""
+import sys
+import time
+import tracemalloc
+
+from data_structures.referential_array import ArrayR
+from data_structures.typed_array import ArrayT
+
+SIZES = [1_000, 100_000, 1_000_000]
+
+
+def measure_memory(size: int, backend: str) -> tuple:
+    """ Returns (retained bytes per slot, peak bytes per slot) for building one array. """
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        array = ArrayR(size, backend)
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del array
+    return (after - before) / size, (peak - before) / size
+
+
+def measure_speed(size: int, backend: str) -> dict:
+    """ Returns nanoseconds per slot for construction, reads, writes and a block copy. """
+    timings = {}
+
+    start = time.perf_counter_ns()
+    array = ArrayR(size, backend)
+    timings["init"] = (time.perf_counter_ns() - start) / size
+
+    start = time.perf_counter_ns()
+    for i in range(size):
+        array[i] = i
+    timings["set"] = (time.perf_counter_ns() - start) / size
+
+    start = time.perf_counter_ns()
+    for i in range(size):
+        array[i]
+    timings["get"] = (time.perf_counter_ns() - start) / size
+
+    target = ArrayR(size, backend)
+    start = time.perf_counter_ns()
+    target.copy_from(array)
+    timings["copy"] = (time.perf_counter_ns() - start) / size
+    return timings
+
+
+def measure_payload_memory(size: int, array_class: type) -> float:
+    """ Returns the bytes per slot retained by an array filled with distinct floats. """
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        array = array_class(size)
+        for i in range(size):
+            array[i] = i + 0.5
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del array
+    return (after - before) / size
+
+
+def main(sizes: list) -> None:
+    print(f"{'size':>10} | {'backend':>7} | {'init ns':>8} | {'set ns':>7} | {'get ns':>7} | {'copy ns':>8} | {'B/slot':>7} | {'peak B/slot':>11}")
+    for size in sizes:
+        for backend in ArrayR.BACKENDS:
+            timings = measure_speed(size, backend)
+            retained, peak = measure_memory(size, backend)
+            print(f"{size:>10} | {backend:>7} | {timings['init']:>8.2f} | {timings['set']:>7.2f} | {timings['get']:>7.2f} | "
+                  f"{timings['copy']:>8.2f} | {retained:>7.2f} | {peak:>11.2f}")
+
+    print(f"\n{'size':>10} | {'float payload B/slot, ArrayR':>28} | {'ArrayT':>6}")
+    for size in sizes:
+        print(f"{size:>10} | {measure_payload_memory(size, ArrayR):>28.2f} | {measure_payload_memory(size, ArrayT):>6.2f}")
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
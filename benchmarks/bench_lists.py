@@ -0,0 +1,73 @@
+"""
+Benchmark of the concrete List ADT implementations against a Python list.
+
+For each size a list is built by appending, then it times a batch of
+inserts and deletes at random middle positions, indexed reads at random
+positions, and a front-to-back scan by index. ArrayList moves the tail as a
+block on every middle update, so those are O(N); UnrolledList only moves
+items inside one block of about sqrt(N), but pays O(sqrt(N)) to walk to it on
+every access.
+
+Usage: python -m benchmarks.bench_lists [size ...]
+"""
+import random
+import sys
+import time
+
+from data_structures.array_list import ArrayList
+from data_structures.unrolled_list import UnrolledList
+
+SIZES = [1_000, 10_000, 100_000]
+OPERATIONS = 1_000
+LIST_CLASSES = {"python list": list, "ArrayList": ArrayList, "UnrolledList": UnrolledList}
+
+
+def build(list_class: type, size: int):
+    """ Returns a list_class instance holding 0 .. size - 1. """
+    lst = list_class()
+    for i in range(size):
+        lst.append(i)
+    return lst
+
+
+def measure(list_class: type, size: int, seed: int = 0) -> dict:
+    """ Returns microseconds per operation for append, middle insert/delete, random get and a scan. """
+    rng = random.Random(seed)
+    timings = {}
+
+    start = time.perf_counter_ns()
+    lst = build(list_class, size)
+    timings["append"] = (time.perf_counter_ns() - start) / size / 1000
+
+    positions = [rng.randrange(size) for _ in range(OPERATIONS)]
+    start = time.perf_counter_ns()
+    for position in positions:
+        lst.insert(position, -1)
+    for position in positions:
+        lst.pop(position) if list_class is list else lst.delete_at_index(position)
+    timings["insert+delete"] = (time.perf_counter_ns() - start) / (2 * OPERATIONS) / 1000
+
+    start = time.perf_counter_ns()
+    for position in positions:
+        lst[position]
+    timings["get"] = (time.perf_counter_ns() - start) / OPERATIONS / 1000
+
+    scan = min(size, OPERATIONS)
+    start = time.perf_counter_ns()
+    for i in range(scan):
+        lst[i]
+    timings["scan"] = (time.perf_counter_ns() - start) / scan / 1000
+    return timings
+
+
+def main(sizes: list) -> None:
+    print(f"{'size':>8} | {'implementation':>14} | {'append us':>9} | {'insert+delete us':>16} | {'get us':>7} | {'scan us':>7}")
+    for size in sizes:
+        for name, list_class in LIST_CLASSES.items():
+            timings = measure(list_class, size)
+            print(f"{size:>8} | {name:>14} | {timings['append']:>9.3f} | {timings['insert+delete']:>16.3f} | "
+                  f"{timings['get']:>7.3f} | {timings['scan']:>7.3f}")
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
@@ -0,0 +1,63 @@
+"""
+Memory of concurrently held battles.
+
+For each count, that many battles are created with their teams assembled
+and kept alive together, as a batch simulation holding them would. It
+reports the memory they hold (traced with tracemalloc, above what was in
+use before) in total and per battle, and the peak while all of them are
+fought one after the other. Memory per battle should stay flat as the
+count grows; a rising figure points at state shared between battles.
+
+Usage: python -m benchmarks.bench_memory [count ...] [--mode MODE]
+"""
+import argparse
+import contextlib
+import os
+import random
+import tracemalloc
+
+from battle import Battle
+from battle_mode import BattleMode
+from poke_team import Trainer
+
+COUNTS = [1, 10, 100, 1_000]
+SEED = 1008
+
+
+def measure(count: int, battle_mode: BattleMode, seed: int = SEED) -> dict:
+    """ Returns the bytes held by count battles, per battle, and the peak while fighting all of them. """
+    random.seed(seed)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        tracemalloc.start()
+        try:
+            start = tracemalloc.get_traced_memory()[0]
+            battles = []
+            for i in range(count):
+                battle = Battle(Trainer(f"Trainer {2 * i}"), Trainer(f"Trainer {2 * i + 1}"), battle_mode)
+                battle._create_teams()
+                battles.append(battle)
+            held = tracemalloc.get_traced_memory()[0] - start
+            tracemalloc.reset_peak()
+            for battle in battles:
+                battle.commence_battle()
+            peak = tracemalloc.get_traced_memory()[1] - start
+        finally:
+            tracemalloc.stop()
+    return {"held": held, "per_battle": held / count, "peak": peak}
+
+
+def main(counts: list, battle_mode: BattleMode) -> None:
+    print(f"{battle_mode.name}")
+    print(f"{'battles':>8} | {'held KiB':>9} | {'KiB/battle':>10} | {'peak KiB':>9}")
+    for count in counts:
+        result = measure(count, battle_mode)
+        print(f"{count:>8} | {result['held'] / 1024:>9.1f} | {result['per_battle'] / 1024:>10.2f} | "
+              f"{result['peak'] / 1024:>9.1f}")
+
+
+if __name__ == '__main__':
+    p = argparse.ArgumentParser(prog="python -m benchmarks.bench_memory")
+    p.add_argument("counts", help="Numbers of battles held at once.", type=int, nargs="*")
+    p.add_argument("--mode", help="The battle mode.", choices=["SET", "ROTATE", "OPTIMISE"], default="ROTATE")
+    args = p.parse_args()
+    main(args.counts or COUNTS, BattleMode[args.mode])
@@ -0,0 +1,97 @@
+"""
+Scaling benchmark for ArraySortedList insertion, deletion and membership.
+
+Compares the block-move implementation against the original element-by-element
+shuffles, for lists holding from 10 up to 1,000,000 items. The workload mirrors
+OPTIMISE mode: take the item at index 0 and add a survivor back in key order.
+
+Usage: python -m benchmarks.bench_sorted_list [max_size]
+"""
+import random
+import sys
+import time
+
+from data_structures.array_sorted_list import ArraySortedList
+from data_structures.referential_array import ArrayR
+from data_structures.sorted_list_adt import ListItem
+
+SIZES = [10, 100, 1_000, 10_000, 100_000, 1_000_000]
+LOOP_MAX_SIZE = 100_000 # the per-element baseline is too slow to be worth timing above this
+MAX_OPERATIONS = 200 # operations timed per size, scaled down for the largest lists
+
+
+class LoopShuffleSortedList(ArraySortedList):
+    """ ArraySortedList with the original per-element moves and linear membership, used as the baseline. """
+
+    def __contains__(self, item: ListItem):
+        for i in range(len(self)):
+            if self.array[i] == item:
+                return True
+        return False
+
+    def _shuffle_right(self, index: int) -> None:
+        for i in range(len(self), index, -1):
+            self.array[i] = self.array[i - 1]
+
+    def _shuffle_left(self, index: int) -> None:
+        for i in range(index, len(self)):
+            self.array[i] = self.array[i + 1]
+
+    def _resize(self) -> None:
+        new_array = ArrayR(2 * len(self.array))
+        for i in range(self.length):
+            new_array[i] = self.array[i]
+        self.array = new_array
+
+
+def build(list_class: type, size: int) -> ArraySortedList:
+    """ Builds a list of the given size. Keys are added in ascending order so building stays cheap. """
+    sorted_list = list_class(1)
+    for key in range(size):
+        sorted_list.add(ListItem(value=key, key=float(key)))
+    return sorted_list
+
+
+def time_operations(sorted_list: ArraySortedList, size: int) -> dict:
+    """ Times OPTIMISE-style rounds, worst-case front insertions and membership tests (in microseconds per operation). """
+    rng = random.Random(size)
+    operations = max(5, min(MAX_OPERATIONS, 2_000_000 // size))
+    timings = {}
+
+    # delete the front item and re-add it with a random key, as Battle._optimise_battle does.
+    start = time.perf_counter()
+    for _ in range(operations):
+        item = sorted_list.delete_at_index(0)
+        sorted_list.add(ListItem(value=item.value, key=rng.uniform(0, size)))
+    timings["round"] = (time.perf_counter() - start) / operations * 1e6
+
+    # worst case: every insertion goes to the front and moves the whole list.
+    start = time.perf_counter()
+    for _ in range(operations):
+        sorted_list.add(ListItem(value=None, key=-1.0))
+        sorted_list.delete_at_index(0)
+    timings["front"] = (time.perf_counter() - start) / operations * 1e6
+
+    # membership of items that are present.
+    probes = [sorted_list[rng.randrange(len(sorted_list))] for _ in range(operations)]
+    start = time.perf_counter()
+    for item in probes:
+        assert item in sorted_list
+    timings["contains"] = (time.perf_counter() - start) / operations * 1e6
+    return timings
+
+
+def main(max_size: int = SIZES[-1]) -> None:
+    print(f"{'size':>10} | {'impl':>5} | {'round us':>10} | {'front us':>10} | {'contains us':>11}")
+    for size in SIZES:
+        if size > max_size:
+            break
+        for name, list_class in (("block", ArraySortedList), ("loop", LoopShuffleSortedList)):
+            if list_class is LoopShuffleSortedList and size > LOOP_MAX_SIZE:
+                continue
+            timings = time_operations(build(list_class, size), size)
+            print(f"{size:>10} | {name:>5} | {timings['round']:>10.2f} | {timings['front']:>10.2f} | {timings['contains']:>11.2f}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else SIZES[-1])
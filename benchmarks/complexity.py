@@ -0,0 +1,350 @@
+"""
+Empirical check of the complexities documented in docstrings.
+
+Each ComplexityCase times one method over growing input sizes, fits the
+timings against the growth models 1, log n, sqrt n, n, n log n and n^2, and compares
+the best fitting model with the WORST CASE (or :complexity:) class written
+in the method's docstring. A case that times a method's best case, e.g. a
+lookup once its table is loaded, compares with the BEST CASE class instead,
+and a case timing one mode of a method reads the bound under that mode's
+heading. A case is flagged when the measured class is
+higher than the documented one, e.g. a method documented as O(N) whose
+timings grow quadratically. Measuring lower than documented is fine: the
+documented bound is only an upper bound.
+
+A model is fitted by scaling it to the timings, and scored by the spread of
+log(time / model) over the sizes. The simplest model scoring within
+TOLERANCE of the best one is reported, so noise does not push a result up
+a class.
+
+Usage: python -m benchmarks.complexity [case name ...], or
+python run_tests.py --complexity. Exits with status 1 if any case is flagged.
+The timings are too slow and noisy for the unit suite, so the cases only run here.
+"""
+import contextlib
+import gc
+import math
+import os
+import random
+import re
+import statistics
+import sys
+import time
+from typing import Callable
+
+from battle import Battle
+from battle_mode import BattleMode
+from data_structures.array_min_heap import ArrayMinHeap
+from data_structures.hash_table import LinearProbeTable
+from data_structures.referential_array import ArrayR
+from data_structures.sorted_list_adt import ListItem
+from data_structures.unrolled_list import UnrolledList
+from poke_team import PokeTeam, Trainer
+from pokemon_base import Pokemon, TypeEffectiveness
+from tower import BattleTower
+
+# growth models, simplest first
+MODELS = {
+    "1": lambda n: 1.0,
+    "log n": lambda n: math.log2(n),
+    "sqrt n": lambda n: math.sqrt(n),
+    "n": lambda n: float(n),
+    "n log n": lambda n: n * math.log2(n),
+    "n^2": lambda n: float(n) * n,
+}
+# how documented complexities are written, after removing spaces and lower-casing
+NOTATIONS = {
+    "1": "1",
+    "logn": "log n", "log(n)": "log n",
+    "sqrt(n)": "sqrt n", "sqrtn": "sqrt n",
+    "n": "n",
+    "nlogn": "n log n", "n*logn": "n log n", "nlog(n)": "n log n", "n*log(n)": "n log n",
+    "n^2": "n^2", "n**2": "n^2", "n*n": "n^2",
+}
+SIZES = (250, 500, 1000, 2000, 4000, 8000)
+ROUNDS = 500 # rounds per run of a battle case, so each run takes long enough to time
+REPEATS = 5
+TOLERANCE = 0.08
+
+
+def fit_growth(sizes: list, times: list, tolerance: float = TOLERANCE) -> str:
+    """ Returns the name of the simplest model of MODELS that fits times(sizes) about as well as the best one. """
+    scores = {}
+    for name, model in MODELS.items():
+        ratios = [math.log(max(t, 1e-12) / model(n)) for n, t in zip(sizes, times)]
+        scores[name] = statistics.pstdev(ratios)
+    best = min(scores.values())
+    return next(name for name, score in scores.items() if score <= best + tolerance)
+
+
+def parse_complexity(docstring: str, bound: str = "WORST CASE", section: str = None) -> str:
+    """ Returns the model name of the first bound: O(...) in docstring, e.g. WORST CASE: O(N), or of its
+    :complexity: O(...) if it has no such bound. If section is given, only the docstring after the
+    first line mentioning section (e.g. "OPTIMISE MODE") is searched. None if there is no bound,
+    or the class is not one of MODELS (e.g. O(N * comp(concatenation))).
+    """
+    if not docstring:
+        return None
+    if section is not None:
+        heading = re.search(rf"^.*{re.escape(section)}.*$", docstring, re.MULTILINE)
+        if heading is None:
+            return None
+        docstring = docstring[heading.end():]
+    match = re.search(rf"{re.escape(bound)}:\s*O\(", docstring) or re.search(r":complexity:\s*O\(", docstring)
+    if match is None:
+        return None
+
+    # the class may itself contain parentheses, e.g. O(N*log(N))
+    depth, start = 1, match.end()
+    end = start
+    while end < len(docstring) and depth > 0:
+        depth += {"(": 1, ")": -1}.get(docstring[end], 0)
+        end += 1
+    notation = re.sub(r"\s+", "", docstring[start:end - 1]).lower()
+    return NOTATIONS.get(notation)
+
+
+def exceeds(measured: str, documented: str) -> bool:
+    """ True if the measured model grows faster than the documented one. """
+    order = list(MODELS)
+    return order.index(measured) > order.index(documented)
+
+
+class ComplexityCase:
+    """ A method timed over growing input sizes.
+
+    Attributes:
+         name (str): name of the case
+         target (Callable): the method whose docstring documents the complexity
+         setup (Callable): setup(n) prepares an input of size n, untimed, and returns the zero-argument callable to time
+         documented (str): model name of the complexity documented in target's docstring, under bound and section
+         sizes (tuple): input sizes to time
+    """
+
+    def __init__(self, name: str, target: Callable, setup: Callable, sizes: tuple = SIZES,
+                 bound: str = "WORST CASE", section: str = None) -> None:
+        self.name = name
+        self.target = target
+        self.setup = setup
+        self.documented = parse_complexity(target.__doc__, bound, section)
+        self.sizes = sizes
+
+    def measure(self, repeats: int = REPEATS) -> list:
+        """ Returns the fastest of repeats timings, in seconds, for every size.
+        The garbage collector is paused while timing, as in timeit, since its passes
+        over the whole heap would otherwise add growth that is not the method's.
+        """
+        times = []
+        for size in self.sizes:
+            best = math.inf
+            for _ in range(repeats):
+                run = self.setup(size)
+                gc_was_enabled = gc.isenabled()
+                gc.disable()
+                try:
+                    start = time.perf_counter()
+                    run()
+                    best = min(best, time.perf_counter() - start)
+                finally:
+                    if gc_was_enabled:
+                        gc.enable()
+            times.append(best)
+        return times
+
+
+class ComplexityResult:
+    """ The outcome of checking one ComplexityCase. """
+
+    def __init__(self, case: ComplexityCase, times: list) -> None:
+        self.name = case.name
+        self.documented = case.documented
+        self.sizes = case.sizes
+        self.times = times
+        self.measured = fit_growth(case.sizes, times)
+        self.flagged = self.documented is not None and exceeds(self.measured, self.documented)
+
+    def __str__(self) -> str:
+        verdict = "EXCEEDS DOCUMENTED" if self.flagged else "ok"
+        return f"{self.name:<40} documented O({self.documented}) measured O({self.measured}): {verdict}"
+
+
+def check(case: ComplexityCase, repeats: int = REPEATS) -> ComplexityResult:
+    """ Times case and compares its growth with the documented one. """
+    return ComplexityResult(case, case.measure(repeats))
+
+
+# inputs
+
+def _pokemons(n: int, seed: int = 0) -> ArrayR:
+    """ Returns an array of n random Pokemon. """
+    rng = random.Random(seed)
+    return ArrayR.from_iterable(rng.choice(PokeTeam.POKE_LIST)() for _ in range(n))
+
+
+def _team(n: int, container: type = None, battle_mode: BattleMode = None, seed: int = 0) -> PokeTeam:
+    """ Returns a PokeTeam of n random Pokemon, assembled for battle_mode if one is given. """
+    team = PokeTeam()
+    team.selected_pokemons = _pokemons(n, seed)
+    team.team_count = n
+    if battle_mode is not None:
+        team.assemble_team(battle_mode, container=container)
+    return team
+
+
+def _assemble(battle_mode: BattleMode) -> Callable:
+    def setup(n):
+        team = _team(n)
+        return lambda: team.assemble_team(battle_mode, "health")
+    return setup
+
+
+def _on_team(method: Callable, battle_mode: BattleMode) -> Callable:
+    def setup(n):
+        team = _team(n, battle_mode=battle_mode)
+        return lambda: method(team)
+    return setup
+
+
+def _heap_add(n: int) -> Callable:
+    heap = ArrayMinHeap(n + 1)
+    rng = random.Random(n)
+    for _ in range(n):
+        heap.add(ListItem(None, rng.random()))
+
+    def run():
+        for _ in range(200):
+            heap.add(ListItem(None, rng.random()))
+            heap.delete_at_index(0)
+    return run
+
+
+def _table_lookup(n: int) -> Callable:
+    table = LinearProbeTable.from_pairs((i, i) for i in range(n))
+    keys = [random.Random(n).randrange(n) for _ in range(5000)]
+    return lambda: [table[key] for key in keys]
+
+
+def _unrolled_insert(n: int) -> Callable:
+    lst = UnrolledList()
+    for i in range(n):
+        lst.append(i)
+
+    def run():
+        for _ in range(100):
+            lst.insert(len(lst) // 2, 0)
+            lst.delete_at_index(len(lst) // 2)
+    return run
+
+
+def _battle(n: int, battle_mode: BattleMode) -> Battle:
+    """ Returns a battle between two trainers with teams of n random Pokemon, all registered in their pokedexes. """
+    trainers = []
+    for seed in range(2):
+        trainer = Trainer(f"Trainer {seed}")
+        trainer.poketeam = _team(n, battle_mode=battle_mode, seed=seed)
+        for pokemon in trainer.poketeam.selected_pokemons:
+            trainer.register_pokemon(pokemon)
+        trainers.append(trainer)
+    return Battle(trainers[0], trainers[1], battle_mode)
+
+
+def _pairs(n: int) -> list:
+    """ Returns ROUNDS pairs of Pokemon drawn from n random Pokemon. """
+    pokemons = _pokemons(n)
+    rng = random.Random(n)
+    return [(pokemons[rng.randrange(n)], pokemons[rng.randrange(n)]) for _ in range(ROUNDS)]
+
+
+def _battle_logic(n: int) -> Callable:
+    battle = _battle(n, BattleMode.ROTATE)
+    pairs = list(zip(_pokemons(ROUNDS, 2), _pokemons(ROUNDS, 3)))
+
+    def run():
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            for p1, p2 in pairs:
+                Battle._battle_logic(p1, p2, battle.trainer_1, battle.trainer_2)
+    return run
+
+
+def _update_mode(update: Callable, take: Callable, battle_mode: BattleMode) -> Callable:
+    """ Returns a setup timing ROUNDS rounds of taking a pokemon from each team with take(team)
+    and handing both back with update(battle, p1, p2).
+    """
+    def setup(n):
+        battle = _battle(n, battle_mode)
+        team_1, team_2 = battle.trainer_1.get_trainer_team(), battle.trainer_2.get_trainer_team()
+
+        def run():
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                for _ in range(ROUNDS):
+                    update(battle, take(team_1), take(team_2))
+        return run
+    return setup
+
+
+def _effectiveness(n: int) -> Callable:
+    pairs = [(attacker.get_poketype(), defender.get_poketype()) for attacker, defender in _pairs(n)]
+    TypeEffectiveness.get_effectiveness(*pairs[0]) # loads the table before timing
+    return lambda: [TypeEffectiveness.get_effectiveness(attack, defend) for attack, defend in pairs]
+
+
+def _attack(n: int) -> Callable:
+    pairs = _pairs(n)
+    TypeEffectiveness.get_effectiveness(pairs[0][0].get_poketype(), pairs[0][1].get_poketype())
+    return lambda: [attacker.attack(defender) for attacker, defender in pairs]
+
+
+def _generate_trainers(n: int) -> Callable:
+    random.seed(n)
+    tower = BattleTower()
+    return lambda: tower.generate_enemy_trainers(n)
+
+
+CASES = [
+    ComplexityCase("PokeTeam.assemble_team[SET]", PokeTeam.assemble_team, _assemble(BattleMode.SET)),
+    ComplexityCase("PokeTeam.assemble_team[OPTIMISE]", PokeTeam.assemble_team, _assemble(BattleMode.OPTIMISE),
+                   section="OPTIMISE MODE"),
+    ComplexityCase("PokeTeam.assign_team", PokeTeam.assign_team,
+                   lambda n: (lambda team: lambda: team.assign_team("health"))(_team(n, battle_mode=BattleMode.OPTIMISE))),
+    ComplexityCase("PokeTeam._retrieve_stack_elements", PokeTeam._retrieve_stack_elements,
+                   _on_team(PokeTeam._retrieve_stack_elements, BattleMode.SET)),
+    ComplexityCase("PokeTeam._retrieve_queue_elements", PokeTeam._retrieve_queue_elements,
+                   _on_team(PokeTeam._retrieve_queue_elements, BattleMode.ROTATE)),
+    ComplexityCase("PokeTeam._special_method_set", PokeTeam._special_method_set,
+                   _on_team(PokeTeam._special_method_set, BattleMode.SET)),
+    ComplexityCase("PokeTeam._special_method_rotate", PokeTeam._special_method_rotate,
+                   _on_team(PokeTeam._special_method_rotate, BattleMode.ROTATE)),
+    ComplexityCase("PokeTeam._special_method_optimise", PokeTeam._special_method_optimise,
+                   _on_team(PokeTeam._special_method_optimise, BattleMode.OPTIMISE)),
+    ComplexityCase("Battle._battle_logic", Battle._battle_logic, _battle_logic),
+    ComplexityCase("Battle._update_set_mode", Battle._update_set_mode,
+                   _update_mode(Battle._update_set_mode, lambda team: team.pop(), BattleMode.SET)),
+    ComplexityCase("Battle._update_rotate_mode", Battle._update_rotate_mode,
+                   _update_mode(Battle._update_rotate_mode, lambda team: team.serve(), BattleMode.ROTATE)),
+    ComplexityCase("Battle._update_optimise_mode", Battle._update_optimise_mode,
+                   _update_mode(Battle._update_optimise_mode, lambda team: team.delete_value_at_index(0), BattleMode.OPTIMISE)),
+    # the table is loaded before timing, so these time the documented BEST CASE
+    ComplexityCase("TypeEffectiveness.get_effectiveness", TypeEffectiveness.get_effectiveness, _effectiveness,
+                   bound="BEST CASE"),
+    ComplexityCase("Pokemon.attack", Pokemon.attack, _attack, bound="BEST CASE"),
+    ComplexityCase("BattleTower.generate_enemy_trainers", BattleTower.generate_enemy_trainers, _generate_trainers,
+                   sizes=(50, 100, 200, 400, 800)),
+    ComplexityCase("ArrayMinHeap.add", ArrayMinHeap.add, _heap_add),
+    ComplexityCase("LinearProbeTable.__getitem__", LinearProbeTable.__getitem__, _table_lookup),
+    ComplexityCase("UnrolledList.insert", UnrolledList.insert, _unrolled_insert, sizes=(1000, 4000, 16000, 64000)),
+]
+
+
+def main(names: list) -> int:
+    """ Checks the named cases (all by default), prints the results and returns 1 if any was flagged. """
+    cases = [case for case in CASES if not names or case.name in names]
+    flagged = False
+    for case in cases:
+        result = check(case)
+        print(result)
+        flagged = flagged or result.flagged
+    return 1 if flagged else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
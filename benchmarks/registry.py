@@ -0,0 +1,124 @@
+"""
+Registry, runner and baseline comparison for the benchmark suite.
+
+A benchmark is a setup function registered with @benchmark(name). Each call
+of setup prepares fresh, untimed state and returns the zero-argument
+callable to time, so benchmarks that mutate their state (battles, towers)
+time the same work on every run. As in timeit, each repeat times enough
+runs to take at least MIN_SECONDS, with the garbage collector paused, and
+the median of the repeats, per run, is kept.
+
+Results are written as JSON, {"benchmarks": {name: {"seconds": ...}}}, and
+can be compared against a baseline file of the same shape: a benchmark
+regresses when it is slower than its baseline by more than the threshold
+(0.25 means 25% slower), or by more than its own threshold if it was
+registered with a wider one. Timings depend on the machine, so a baseline
+is only meaningful on the machine it was recorded on.
+"""
+import gc
+import json
+import platform
+import statistics
+import time
+from typing import Callable
+
+BENCHMARKS = {} # name -> setup function, in registration order
+THRESHOLDS = {} # name -> threshold, for benchmarks noisier than THRESHOLD allows
+REPEATS = 9
+MIN_SECONDS = 0.1 # least time taken by each repeat
+THRESHOLD = 0.25
+
+
+def benchmark(name: str, threshold: float = None) -> Callable:
+    """ Decorator registering a setup function as the benchmark called name.
+    threshold, if given, replaces THRESHOLD for this benchmark when it is wider.
+    :raises ValueError: if a benchmark of that name is already registered
+    """
+    def register(setup: Callable) -> Callable:
+        if name in BENCHMARKS:
+            raise ValueError(f"Benchmark {name!r} is already registered")
+        BENCHMARKS[name] = setup
+        if threshold is not None:
+            THRESHOLDS[name] = threshold
+        return setup
+    return register
+
+
+def _time_runs(setup: Callable, loops: int) -> float:
+    """ Returns the time, in seconds, taken by loops runs, each of the callable returned by its own setup(). """
+    runs = [setup() for _ in range(loops)]
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for run in runs:
+            run()
+        return time.perf_counter() - start
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def calibrate(setup: Callable, min_seconds: float = MIN_SECONDS) -> int:
+    """ Returns the number of runs taking at least min_seconds, trying 1, 2, 5, 10, 20, 50, ... as timeit does. """
+    scale = 1
+    while True:
+        for multiplier in (1, 2, 5):
+            loops = scale * multiplier
+            if _time_runs(setup, loops) >= min_seconds:
+                return loops
+        scale *= 10
+
+
+def time_benchmark(setup: Callable, repeats: int = REPEATS, loops: int = None) -> tuple:
+    """ Times repeats repeats of loops runs of the callable returned by setup() (calibrated by default).
+    :returns: (the median time of a run in seconds, loops)
+    """
+    loops = loops or calibrate(setup)
+    return statistics.median(_time_runs(setup, loops) for _ in range(repeats)) / loops, loops
+
+
+def run_benchmarks(names: list = None, repeats: int = REPEATS, report: Callable = None) -> dict:
+    """ Runs the registered benchmarks whose names start with one of names (all by default).
+    report, if given, is called with (name, seconds) after each one.
+    :returns: the results, ready for write_results()
+    """
+    results = {}
+    for name, setup in BENCHMARKS.items():
+        if names and not any(name.startswith(prefix) for prefix in names):
+            continue
+        seconds, loops = time_benchmark(setup, repeats)
+        results[name] = {"seconds": seconds, "loops": loops}
+        if name in THRESHOLDS:
+            results[name]["threshold"] = THRESHOLDS[name]
+        if report is not None:
+            report(name, seconds)
+    return {"python": platform.python_version(), "repeats": repeats, "benchmarks": results}
+
+
+def write_results(results: dict, path: str) -> None:
+    """ Writes results as JSON to path. """
+    with open(path, "w") as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+
+def load_results(path: str) -> dict:
+    """ Reads results written by write_results(). """
+    with open(path) as file:
+        return json.load(file)
+
+
+def compare(results: dict, baseline: dict, threshold: float = THRESHOLD) -> list:
+    """ Returns (name, baseline seconds, seconds, ratio) for every benchmark of results that is more than
+    threshold, or its own wider threshold, slower than in baseline. Benchmarks missing from either side are skipped.
+    """
+    regressions = []
+    for name, result in results["benchmarks"].items():
+        base = baseline["benchmarks"].get(name)
+        if base is None:
+            continue
+        ratio = result["seconds"] / base["seconds"]
+        if ratio > 1 + max(threshold, result.get("threshold", threshold)):
+            regressions.append((name, base["seconds"], result["seconds"], ratio))
+    return regressions
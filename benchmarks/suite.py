@@ -0,0 +1,161 @@
+"""
+The benchmark suite: type effectiveness lookups, battles in each
+BattleMode, BattleTower runs at several sizes, and ADT operations.
+
+Importing this module registers the benchmarks with benchmarks.registry.
+Battle output is discarded while timing. Run it with
+``python run_tests.py --bench`` or ``python -m benchmarks.suite``.
+"""
+import contextlib
+import io
+import random
+import sys
+
+from battle import Battle
+from battle_mode import BattleMode
+from benchmarks.registry import benchmark, run_benchmarks
+from data_structures.array_sorted_list import ArraySortedList
+from data_structures.bset import BSet
+from data_structures.hash_table import LinearProbeTable
+from data_structures.queue_adt import CircularQueue
+from data_structures.sorted_list_adt import ListItem
+from data_structures.stack_adt import ArrayStack
+from poke_team import Trainer
+from pokemon_base import PokeType, TypeEffectiveness
+from tower import BattleTower
+
+SEED = 1008
+BATTLES = 20 # battles per run of a battle benchmark
+TOWER_SIZES = (10, 40, 160)
+OPERATIONS = 10_000 # operations per run of an ADT benchmark
+MICRO_THRESHOLD = 0.5 # benchmarks of cheap operations vary more with the machine's state
+
+
+@benchmark("effectiveness.lookup", threshold=MICRO_THRESHOLD)
+def effectiveness_lookup():
+    pairs = [(attack, defend) for attack in PokeType for defend in PokeType]
+
+    def run():
+        for _ in range(20):
+            for attack, defend in pairs:
+                TypeEffectiveness.get_effectiveness(attack, defend)
+    return run
+
+
+def _battles(battle_mode: BattleMode):
+    """ Returns a setup function building BATTLES seeded battles in battle_mode. """
+    def setup():
+        random.seed(SEED)
+        battles = []
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(BATTLES):
+                battle = Battle(Trainer("Gary"), Trainer("Ash"), battle_mode)
+                battle._create_teams()
+                battles.append(battle)
+
+        def run():
+            with contextlib.redirect_stdout(io.StringIO()):
+                for battle in battles:
+                    battle.commence_battle()
+        return run
+    return setup
+
+
+for mode in BattleMode:
+    benchmark(f"battle.{mode.name.lower()}")(_battles(mode))
+
+
+def _tower(size: int):
+    """ Returns a setup function building a seeded tower of size enemies.
+    My trainer gets size lives, so a run goes through about size battles.
+    """
+    def setup():
+        random.seed(SEED)
+        tower = BattleTower()
+        with contextlib.redirect_stdout(io.StringIO()):
+            trainer = Trainer("Ash")
+            trainer.pick_team("Random")
+            trainer.get_team().assemble_team(BattleTower.BATTLE_MODE)
+            tower.set_my_trainer(trainer)
+            tower.my_lives = size
+            tower.generate_enemy_trainers(size)
+
+        def run():
+            with contextlib.redirect_stdout(io.StringIO()):
+                while tower.battles_remaining():
+                    tower.next_battle()
+        return run
+    return setup
+
+
+for size in TOWER_SIZES:
+    benchmark(f"tower.{size}")(_tower(size))
+
+
+@benchmark("adt.stack.push_pop", threshold=MICRO_THRESHOLD)
+def stack_push_pop():
+    stack = ArrayStack(OPERATIONS)
+
+    def run():
+        for i in range(OPERATIONS):
+            stack.push(i)
+        while not stack.is_empty():
+            stack.pop()
+    return run
+
+
+@benchmark("adt.queue.append_serve", threshold=MICRO_THRESHOLD)
+def queue_append_serve():
+    queue = CircularQueue(OPERATIONS)
+
+    def run():
+        for i in range(OPERATIONS):
+            queue.append(i)
+        while not queue.is_empty():
+            queue.serve()
+    return run
+
+
+@benchmark("adt.sorted_list.add_delete")
+def sorted_list_add_delete():
+    # every delete from the front shifts the whole list, so fewer operations are used here
+    rng = random.Random(SEED)
+    items = [ListItem(i, rng.random()) for i in range(OPERATIONS // 5)]
+    sorted_list = ArraySortedList(len(items))
+
+    def run():
+        for item in items:
+            sorted_list.add(item)
+        while not sorted_list.is_empty():
+            sorted_list.delete_at_index(0)
+    return run
+
+
+@benchmark("adt.bset.add_contains", threshold=MICRO_THRESHOLD)
+def bset_add_contains():
+    items = [i % len(PokeType) + 1 for i in range(OPERATIONS)]
+
+    def run():
+        bset = BSet()
+        for item in items:
+            bset.add(item)
+        for item in items:
+            item in bset
+    return run
+
+
+@benchmark("adt.hash_table.set_get", threshold=MICRO_THRESHOLD)
+def hash_table_set_get():
+    keys = [f"Pokemon {i}" for i in range(OPERATIONS)]
+
+    def run():
+        table = LinearProbeTable()
+        for key in keys:
+            table[key] = key
+        for key in keys:
+            table[key]
+    return run
+
+
+if __name__ == '__main__':
+    run_benchmarks(sys.argv[1:], report=lambda name, seconds: print(f"{name:<30} {seconds * 1000:>10.3f} ms"))
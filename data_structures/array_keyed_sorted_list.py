@@ -0,0 +1,258 @@
+""" Array-based implementation of the SortedList ADT with parallel key and value arrays.
+
+Keys live in a typed numeric array (array('d')) and values in an ArrayR, so
+add_pair(), key_at(), value_at() and delete_value_at_index() never create
+ListItem objects, and comparisons read raw floats instead of dereferencing
+ListItem.key. ListItems are still accepted and returned by add(),
+__getitem__() and delete_at_index() so the class works wherever an
+ArraySortedList does. Keys must be real numbers. Also defines UnitTests for
+the class.
+"""
+__docformat__ = 'reStructuredText'
+
+import unittest
+from array import array
+from data_structures.referential_array import ArrayR
+from data_structures.sorted_list_adt import SortedList, ListItem, T
+
+
+class ArrayKeyedSortedList(SortedList[T]):
+    """ SortedList ADT implemented with a typed key array and a parallel value array.
+
+    Attributes:
+         length (int): number of items in the list (inherited)
+         keys (array): sorting keys, as C doubles, in ascending order
+         values (ArrayR[T]): the value stored with the key at the same position
+
+    Items with equal keys are placed exactly where ArraySortedList would place them.
+    """
+    MIN_CAPACITY = 1
+    KEY_TYPECODE = 'd'
+
+    def __init__(self, max_capacity: int) -> None:
+        """ ArrayKeyedSortedList object initialiser. """
+        SortedList.__init__(self)
+        size = max(self.MIN_CAPACITY, max_capacity)
+        self.keys = array(self.KEY_TYPECODE, [0]) * size
+        self.values = ArrayR(size)
+
+    def __getitem__(self, index: int) -> ListItem:
+        """ Magic method. Return the element at a given position, as a new ListItem.
+            Use key_at() and value_at() to avoid the allocation.
+        """
+        index = self._check_index(index)
+        return ListItem(self.values[index], self.keys[index])
+
+    def __setitem__(self, index: int, item: ListItem) -> None:
+        """ Magic method. Insert the item at a given position,
+            if possible (!). Shift the following elements to the right.
+        """
+        key = item.key
+        if self.is_empty() or \
+                (index == 0 and key <= self.keys[index]) or \
+                (index == len(self) and self.keys[index - 1] <= key) or \
+                (index > 0 and self.keys[index - 1] <= key <= self.keys[index]):
+
+            if self.is_full():
+                self._resize()
+
+            self._shuffle_right(index)
+            self.keys[index] = key
+            self.values[index] = item.value
+        else:
+            # the list isn't empty and the item's position is wrong wrt. its neighbours
+            raise IndexError('Element should be inserted in sorted order')
+
+    def __contains__(self, item: ListItem) -> bool:
+        """ Checks if an element with the item's key and value is in the list. """
+        return self._find(item.value, item.key) >= 0
+
+    def key_at(self, index: int) -> float:
+        """ Return the key at a given position.
+        :complexity: O(1)
+        """
+        index = self._check_index(index)
+        return self.keys[index]
+
+    def value_at(self, index: int) -> T:
+        """ Return the value at a given position.
+        :complexity: O(1)
+        """
+        index = self._check_index(index)
+        return self.values[index]
+
+    def is_full(self) -> bool:
+        """ Check if the list is full. """
+        return len(self) >= len(self.keys)
+
+    def add(self, item: ListItem) -> None:
+        """ Add new element to the list. """
+        self.add_pair(item.value, item.key)
+
+    def add_pair(self, value: T, key: float) -> None:
+        """ Add a value with its sorting key, without creating a ListItem.
+        :complexity: O(log N) to find the position plus one block move of the following elements
+        """
+        if self.is_full():
+            self._resize()
+
+        position = self._index_for_key(key)
+        self._shuffle_right(position)
+        self.keys[position] = key
+        self.values[position] = value
+        self.length += 1
+
+    def delete_at_index(self, index: int) -> ListItem:
+        """ Delete item at a given position and return it as a new ListItem. """
+        index = self._check_index(index)
+        key = self.keys[index]
+        return ListItem(self.delete_value_at_index(index), key)
+
+    def delete_value_at_index(self, index: int) -> T:
+        """ Delete item at a given position and return its value, without creating a ListItem. """
+        index = self._check_index(index)
+        value = self.values[index]
+        self.length -= 1
+        self._shuffle_left(index)
+        return value
+
+    def index(self, item: ListItem) -> int:
+        """ Find the position of an element with the item's key and value. """
+        pos = self._find(item.value, item.key)
+        if pos >= 0:
+            return pos
+        raise ValueError('item not in list')
+
+    def _check_index(self, index: int) -> int:
+        """ Return the position of index, counting from the end if it is negative.
+        :raises IndexError: if there is no element at index
+        """
+        if not -len(self) <= index < len(self):
+            raise IndexError('No such index in the list')
+        return index + len(self) if index < 0 else index
+
+    def _find(self, value: T, key: float) -> int:
+        """ Find the position of value stored under key, or -1 if it is not in the list. """
+        pos = self._index_for_key(key)
+
+        # scanning the equal-key run to the left, starting at pos
+        i = pos
+        while 0 <= i < len(self) and self.keys[i] == key:
+            if self.values[i] == value:
+                return i
+            i -= 1
+
+        # scanning the equal-key run to the right
+        i = pos + 1
+        while i < len(self) and self.keys[i] == key:
+            if self.values[i] == value:
+                return i
+            i += 1
+        return -1
+
+    def _index_for_key(self, key: float) -> int:
+        """ Find the position where a new element with this key should be placed. """
+        keys = self.keys
+        low = 0
+        high = len(self) - 1
+
+        while low <= high:
+            mid = (low + high) // 2
+            if keys[mid] < key:
+                low = mid + 1
+            elif keys[mid] > key:
+                high = mid - 1
+            else:
+                return mid
+
+        return low
+
+    def _shuffle_right(self, index: int) -> None:
+        """ Shuffle elements to the right up to a given position, as one block move per array. """
+        if index < len(self):
+            self.keys[index + 1:len(self) + 1] = self.keys[index:len(self)]
+            self.values.copy_from(self.values, index, index + 1, len(self) - index)
+
+    def _shuffle_left(self, index: int) -> None:
+        """ Shuffle elements starting at a given position to the left, as one block move per array. """
+        if index < len(self):
+            self.keys[index:len(self)] = self.keys[index + 1:len(self) + 1]
+            self.values.copy_from(self.values, index + 1, index, len(self) - index)
+
+    def _resize(self) -> None:
+        """ Double the capacity of both arrays. """
+        capacity = len(self.keys)
+        self.keys.extend(array(self.KEY_TYPECODE, [0]) * capacity)
+
+        new_values = ArrayR(2 * capacity)
+        new_values.copy_from(self.values, count=self.length)
+        self.values = new_values
+
+
+class TestArrayKeyedSortedList(unittest.TestCase):
+    """ Tests for the above class."""
+    KEYS = [5, 3, 8, 1, 9, 2, 7, 2]
+
+    def setUp(self):
+        self.list = ArrayKeyedSortedList(2)
+        for key in self.KEYS:
+            self.list.add_pair(str(key), key)
+
+    def test_sorted(self):
+        self.assertEqual([self.list.key_at(i) for i in range(len(self.list))], sorted(self.KEYS))
+        self.assertEqual([self.list[i].value for i in range(len(self.list))], [str(k) for k in sorted(self.KEYS)])
+
+    def test_delete(self):
+        self.assertEqual(self.list.delete_value_at_index(0), '1')
+        item = self.list.delete_at_index(len(self.list) - 1)
+        self.assertEqual((item.value, item.key), ('9', 9))
+        self.assertEqual(len(self.list), len(self.KEYS) - 2)
+        self.assertRaises(IndexError, self.list.delete_at_index, len(self.list))
+
+    def test_index_and_contains(self):
+        self.assertEqual(self.list.index(ListItem('8', 8)), len(self.KEYS) - 2)
+        self.assertIn(ListItem('2', 2), self.list)
+        self.assertNotIn(ListItem('4', 4), self.list)
+        self.list.remove(ListItem('7', 7))
+        self.assertNotIn(ListItem('7', 7), self.list)
+
+    def test_matches_array_sorted_list(self):
+        from data_structures.array_sorted_list import ArraySortedList
+        reference = ArraySortedList(2)
+        for key in self.KEYS:
+            reference.add(ListItem(str(key), key))
+        self.assertEqual([reference[i].value for i in range(len(reference))],
+                         [self.list.value_at(i) for i in range(len(self.list))])
+
+    def test_negative_indices(self):
+        self.assertEqual((self.list.key_at(-1), self.list.value_at(-1)), (9, '9'))
+        self.assertEqual(self.list[-2].value, '8')
+        self.assertEqual(self.list.delete_value_at_index(-1), '9')
+        item = self.list.delete_at_index(-len(self.list))
+        self.assertEqual((item.value, item.key), ('1', 1))
+        self.assertEqual([self.list.value_at(i) for i in range(len(self.list))], ['2', '2', '3', '5', '7', '8'])
+
+    def test_failed_delete_leaves_list_unchanged(self):
+        small = ArrayKeyedSortedList(4)
+        for value, key in (('a', 1), ('b', 2), ('c', 3)):
+            small.add_pair(value, key)
+        for index in (3, -4):
+            self.assertRaises(IndexError, small.delete_value_at_index, index)
+            self.assertRaises(IndexError, small.delete_at_index, index)
+            self.assertRaises(IndexError, small.key_at, index)
+        self.assertEqual([(small.key_at(i), small.value_at(i)) for i in range(len(small))],
+                         [(1.0, 'a'), (2.0, 'b'), (3.0, 'c')])
+        self.assertEqual(small.delete_value_at_index(-1), 'c')
+        self.assertEqual(len(small), 2)
+
+    def test_setitem_order(self):
+        self.assertRaises(IndexError, self.list.__setitem__, 0, ListItem('100', 100))
+
+    def test_non_numeric_key(self):
+        self.assertRaises(TypeError, self.list.add_pair, 'x', (1, 2))
+
+
+if __name__ == '__main__':
+    testtorun = TestArrayKeyedSortedList()
+    suite = unittest.TestLoader().loadTestsFromModule(testtorun)
+    unittest.TextTestRunner().run(suite)
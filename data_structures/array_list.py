@@ -0,0 +1,98 @@
+""" Array-based implementation of the List ADT.
+
+ArrayList doubles its array when it runs out of room, so append is O(1)
+amortised, and insert and delete_at_index move the following items as one
+block instead of one at a time.
+"""
+__docformat__ = 'reStructuredText'
+
+from data_structures.abstract_list import List, T
+from data_structures.referential_array import ArrayR
+
+
+class ArrayList(List[T]):
+    """ List ADT implemented with a growable array.
+
+    Attributes:
+         length (int): number of items in the list (inherited)
+         array (ArrayR[T]): array storing the items, positions length and above are unused
+
+    ArrayR cannot create empty arrays. So MIN_CAPACITY used to avoid this.
+    """
+    MIN_CAPACITY = 1
+
+    def __init__(self, max_capacity: int = 1) -> None:
+        """ ArrayList object initialiser. max_capacity is only the initial size of the array. """
+        List.__init__(self)
+        self.array = ArrayR(max(self.MIN_CAPACITY, max_capacity))
+
+    def __getitem__(self, index: int) -> T:
+        """ Magic method. Return the element at a given position.
+        :complexity: O(1)
+        :raises IndexError: if there is no such position
+        """
+        return self.array[self._position(index)]
+
+    def __setitem__(self, index: int, item: T) -> None:
+        """ Magic method. Replace the element at a given position.
+        :complexity: O(1)
+        :raises IndexError: if there is no such position
+        """
+        self.array[self._position(index)] = item
+
+    def insert(self, index: int, item: T) -> None:
+        """ Insert an item at a given position, moving the following items one place right.
+        Indices past the end append the item.
+        :complexity: O(N - index) for the block move, plus O(N) when the array has to grow
+        """
+        index = max(0, min(index + len(self) if index < 0 else index, len(self)))
+        if self.is_full():
+            self._resize(2 * len(self.array))
+        self.array.copy_from(self.array, index, index + 1, len(self) - index)
+        self.array[index] = item
+        self.length += 1
+
+    def delete_at_index(self, index: int) -> T:
+        """ Delete the item at a given position, moving the following items one place left.
+        :complexity: O(N - index) for the block move
+        :raises IndexError: if there is no such position
+        """
+        index = self._position(index)
+        item = self.array[index]
+        self.length -= 1
+        self.array.copy_from(self.array, index + 1, index, len(self) - index)
+        self.array[len(self)] = None
+        return item
+
+    def index(self, item: T) -> int:
+        """ Find the position of a given item in the list.
+        :complexity: O(N)
+        :raises ValueError: if the item is not in the list
+        """
+        for i in range(len(self)):
+            if self.array[i] == item:
+                return i
+        raise ValueError('Item not in list')
+
+    def is_full(self) -> bool:
+        """ Check if the array has no room left. """
+        return len(self) >= len(self.array)
+
+    def clear(self) -> None:
+        """ Clear the list, dropping the references to its items. """
+        self.array.fill(None, 0, len(self))
+        List.clear(self)
+
+    def _position(self, index: int) -> int:
+        """ Return the array position of index, allowing negative indices.
+        :raises IndexError: if there is no such position
+        """
+        if not -len(self) <= index < len(self):
+            raise IndexError('Index out of range')
+        return index % len(self)
+
+    def _resize(self, capacity: int) -> None:
+        """ Move the items to a new array of the given capacity, as one block. """
+        new_array = ArrayR(capacity)
+        new_array.copy_from(self.array, count=len(self))
+        self.array = new_array
@@ -0,0 +1,197 @@
+""" Array-based binary min-heap exposing the SortedList ADT interface.
+
+Items to store should be of type ListItem. Only position 0 is ordered: it
+always holds an item with the smallest key, which is all OPTIMISE battles
+ever take. The rest of the array is kept in heap order, so adding an item
+and deleting at any position are O(log N) instead of the O(N) shifts of
+ArraySortedList. Also defines UnitTests for the class.
+"""
+__docformat__ = 'reStructuredText'
+
+import unittest
+from data_structures.referential_array import ArrayR
+from data_structures.sorted_list_adt import SortedList, ListItem, T
+
+
+class ArrayMinHeap(SortedList[T]):
+    """ Min-heap implementation of the SortedList ADT with arrays.
+
+    Attributes:
+         length (int): number of items in the heap (inherited)
+         array (ArrayR[ListItem]): array storing the items in heap order,
+            the children of position k are at 2k+1 and 2k+2
+
+    ArrayR cannot create empty arrays. So MIN_CAPACITY used to avoid this.
+    """
+    MIN_CAPACITY = 1
+
+    def __init__(self, max_capacity: int) -> None:
+        """ ArrayMinHeap object initialiser. The heap grows past max_capacity if needed. """
+        SortedList.__init__(self)
+        self.array = ArrayR(max(self.MIN_CAPACITY, max_capacity))
+
+    def __getitem__(self, index: int) -> ListItem:
+        """ Magic method. Return the item at a given position of the heap.
+            Position 0 holds an item with the smallest key, the others follow heap order.
+        :complexity: O(1)
+        :raises IndexError: if there is no such position
+        """
+        if not 0 <= index < len(self):
+            raise IndexError('No such index in the heap')
+        return self.array[index]
+
+    def __setitem__(self, index: int, item: ListItem) -> None:
+        """ Magic method. Replace the item at a given position and restore the heap order.
+            Setting the position just past the end adds the item.
+        :complexity: O(log N)
+        :raises IndexError: if there is no such position
+        """
+        if index == len(self):
+            self.add(item)
+        elif 0 <= index < len(self):
+            self.array[index] = item
+            self._restore(index)
+        else:
+            raise IndexError('No such index in the heap')
+
+    def __contains__(self, item: ListItem) -> bool:
+        """ Checks if item is in the heap.
+        :complexity: O(N), heap order does not allow searching
+        """
+        for i in range(len(self)):
+            if self.array[i] == item:
+                return True
+        return False
+
+    def is_full(self) -> bool:
+        """ Check if the backing array is full. """
+        return len(self) >= len(self.array)
+
+    def add(self, item: ListItem) -> None:
+        """ Add new item to the heap.
+        :complexity: O(log N) amortised, O(N) when the array has to grow
+        """
+        if self.is_full():
+            self._resize()
+        self.array[self.length] = item
+        self.length += 1
+        self._rise(self.length - 1)
+
+    def delete_at_index(self, index: int) -> ListItem:
+        """ Delete the item at a given position. Index 0 removes an item with the smallest key.
+        :complexity: O(log N)
+        :raises IndexError: if there is no such position
+        """
+        if not 0 <= index < len(self):
+            raise IndexError('No such index in the heap')
+        item = self.array[index]
+        self.length -= 1
+        if index < self.length:
+            # the last item fills the hole, then moves up or down to its place
+            self.array[index] = self.array[self.length]
+            self._restore(index)
+        return item
+
+    def index(self, item: ListItem) -> int:
+        """ Find the position of a given item in the heap.
+        :complexity: O(N), heap order does not allow searching
+        :raises ValueError: if the item is not in the heap
+        """
+        for i in range(len(self)):
+            if self.array[i] == item:
+                return i
+        raise ValueError('item not in heap')
+
+    def _restore(self, index: int) -> None:
+        """ Move the item at index up or down until the heap order holds again. """
+        if index > 0 and self.array[index].key < self.array[(index - 1) // 2].key:
+            self._rise(index)
+        else:
+            self._sink(index)
+
+    def _rise(self, index: int) -> None:
+        """ Move the item at index up while its key is smaller than its parent's. """
+        item = self.array[index]
+        while index > 0:
+            parent = (index - 1) // 2
+            if not item.key < self.array[parent].key:
+                break
+            self.array[index] = self.array[parent]
+            index = parent
+        self.array[index] = item
+
+    def _sink(self, index: int) -> None:
+        """ Move the item at index down while a child has a smaller key. """
+        item = self.array[index]
+        while 2 * index + 1 < self.length:
+            child = self._smallest_child(index)
+            if not self.array[child].key < item.key:
+                break
+            self.array[index] = self.array[child]
+            index = child
+        self.array[index] = item
+
+    def _smallest_child(self, index: int) -> int:
+        """ Return the position of the child of index with the smallest key.
+        :pre: index has at least one child
+        """
+        left = 2 * index + 1
+        right = left + 1
+        if right < self.length and self.array[right].key < self.array[left].key:
+            return right
+        return left
+
+    def _resize(self) -> None:
+        """ Double the size of the backing array. """
+        new_array = ArrayR(2 * len(self.array))
+        new_array.copy_from(self.array, count=self.length)
+        self.array = new_array
+
+
+class TestArrayMinHeap(unittest.TestCase):
+    """ Tests for the above class."""
+    KEYS = [5, 3, 8, 1, 9, 2, 7, 2]
+
+    def setUp(self):
+        self.heap = ArrayMinHeap(2)
+        for key in self.KEYS:
+            self.heap.add(ListItem(value=str(key), key=key))
+
+    def test_len(self):
+        self.assertEqual(len(self.heap), len(self.KEYS))
+        self.assertTrue(ArrayMinHeap(0).is_empty())
+
+    def test_delete_front_is_sorted(self):
+        keys = [self.heap.delete_at_index(0).key for _ in range(len(self.KEYS))]
+        self.assertEqual(keys, sorted(self.KEYS))
+        self.assertTrue(self.heap.is_empty())
+
+    def test_delete_any_index(self):
+        removed = self.heap.delete_at_index(len(self.heap) - 1)
+        removed2 = self.heap.delete_at_index(2)
+        remaining = sorted(self.KEYS)
+        remaining.remove(removed.key)
+        remaining.remove(removed2.key)
+        self.assertEqual([self.heap.delete_at_index(0).key for _ in range(len(self.heap))], remaining)
+
+    def test_index_and_remove(self):
+        item = self.heap[3]
+        self.assertEqual(self.heap.index(item), 3)
+        self.assertIn(item, self.heap)
+        self.heap.remove(item)
+        self.assertNotIn(item, self.heap)
+        self.assertRaises(ValueError, self.heap.index, item)
+
+    def test_setitem_reorders(self):
+        self.heap[len(self.heap) - 1] = ListItem(value='0', key=0)
+        self.assertEqual(self.heap[0].key, 0)
+
+    def test_bad_index(self):
+        self.assertRaises(IndexError, self.heap.delete_at_index, len(self.heap))
+        self.assertRaises(IndexError, self.heap.__getitem__, len(self.heap))
+
+
+if __name__ == '__main__':
+    testtorun = TestArrayMinHeap()
+    suite = unittest.TestLoader().loadTestsFromModule(testtorun)
+    unittest.TextTestRunner().run(suite)
@@ -1,8 +1,10 @@
 """
     Array-based implementation of SortedList ADT.
     Items to store should be of time ListItem.
+    Also defines UnitTests for the class.
 """
 
+import unittest
 from data_structures.referential_array import ArrayR
 from data_structures.sorted_list_adt import *
 
@@ -50,30 +52,55 @@ class ArraySortedList(SortedList[T]):
             raise IndexError('Element should be inserted in sorted order')
 
     def __contains__(self, item: ListItem):
-        """ Checks if value is in the list. """
-        for i in range(len(self)):
+        """ Checks if value is in the list.
+            Uses binary search on the key, so only the items sharing the
+            key of item are compared against it.
+        """
+        return self._find(item) >= 0
+
+    def _find(self, item: ListItem) -> int:
+        """ Find the position of a given item, or -1 if it is not in the list.
+            Binary search lands somewhere inside the run of items with an equal
+            key, so that run is scanned in both directions for the item itself.
+        """
+        pos = self._index_to_add(item)
+
+        # scanning the equal-key run to the left, starting at pos
+        i = pos
+        while 0 <= i < len(self) and self.array[i].key == item.key:
+            if self.array[i] == item:
+                return i
+            i -= 1
+
+        # scanning the equal-key run to the right
+        i = pos + 1
+        while i < len(self) and self.array[i].key == item.key:
             if self.array[i] == item:
-                return True
-        return False
+                return i
+            i += 1
+        return -1
 
     def _shuffle_right(self, index: int) -> None:
-        """ Shuffle items to the right up to a given position. """
-        for i in range(len(self), index, -1):
-            self.array[i] = self.array[i - 1]
+        """ Shuffle items to the right up to a given position.
+            The items are moved as one block on the backing array.
+        """
+        if index < len(self):
+            self.array.copy_from(self.array, index, index + 1, len(self) - index)
 
     def _shuffle_left(self, index: int) -> None:
-        """ Shuffle items starting at a given position to the left. """
-        for i in range(index, len(self)):
-            self.array[i] = self.array[i + 1]
+        """ Shuffle items starting at a given position to the left.
+            The items are moved as one block on the backing array.
+        """
+        if index < len(self):
+            self.array.copy_from(self.array, index + 1, index, len(self) - index)
 
     def _resize(self) -> None:
         """ Resize the list. """
         # doubling the size of our list
         new_array = ArrayR(2 * len(self.array))
 
-        # copying the contents
-        for i in range(self.length):
-            new_array[i] = self.array[i]
+        # copying the contents as one block
+        new_array.copy_from(self.array, count=self.length)
 
         # referring to the new array
         self.array = new_array
@@ -89,8 +116,8 @@ class ArraySortedList(SortedList[T]):
 
     def index(self, item: ListItem) -> int:
         """ Find the position of a given item in the list. """
-        pos = self._index_to_add(item)
-        if pos < len(self) and self[pos] == item:
+        pos = self._find(item)
+        if pos >= 0:
             return pos
         raise ValueError('item not in list')
 
@@ -124,3 +151,61 @@ class ArraySortedList(SortedList[T]):
                 return mid
 
         return low
+
+
+class TestArraySortedList(unittest.TestCase):
+    """ Tests for the above class."""
+
+    def setUp(self):
+        self.list = ArraySortedList(2)
+        self.run = [ListItem(f"two {i}", 2) for i in range(5)]
+        for item in [ListItem("one", 1)] + self.run + [ListItem("three", 3)]:
+            self.list.add(item)
+
+    def contents(self):
+        return [self.list[i].value for i in range(len(self.list))]
+
+    def test_equal_key_run(self):
+        for item in (self.run[0], self.run[2], self.run[-1]):
+            self.assertIn(item, self.list)
+            self.assertIs(self.list[self.list.index(item)], item)
+        self.assertNotIn(ListItem("two 0", 2), self.list)
+        # equal keys stay together, in no particular order
+        self.assertEqual(sorted(self.contents()[1:6]), [item.value for item in self.run])
+
+    def test_insert_and_delete_at_ends(self):
+        self.list.add(ListItem("zero", 0))
+        self.list.add(ListItem("four", 4))
+        self.assertEqual((self.list[0].value, self.list[len(self.list) - 1].value), ("zero", "four"))
+        self.assertEqual(self.list.delete_at_index(0).value, "zero")
+        self.assertEqual(self.list.delete_at_index(len(self.list) - 1).value, "four")
+        self.assertEqual((self.contents()[0], self.contents()[-1], len(self.list)), ("one", "three", 7))
+        self.assertRaises(IndexError, self.list.delete_at_index, len(self.list))
+
+    def test_resize_boundary(self):
+        resized = ArraySortedList(2)
+        resized.add(ListItem("b", 2))
+        resized.add(ListItem("c", 3))
+        self.assertTrue(resized.is_full())
+        resized.add(ListItem("a", 1))
+        self.assertEqual(len(resized.array), 4)
+        self.assertEqual([resized[i].value for i in range(len(resized))], ["a", "b", "c"])
+        resized.add(ListItem("d", 4))
+        self.assertTrue(resized.is_full())
+        self.assertEqual(resized.delete_at_index(len(resized) - 1).value, "d")
+        self.assertEqual(resized.delete_at_index(0).value, "a")
+        self.assertEqual([resized[i].value for i in range(len(resized))], ["b", "c"])
+
+    def test_remove(self):
+        self.list.remove(self.run[2])
+        self.assertNotIn(self.run[2], self.list)
+        self.assertEqual(len(self.list), 6)
+        self.assertRaises(ValueError, self.list.remove, self.run[2])
+        self.assertRaises(ValueError, self.list.remove, ListItem("four", 4))
+        self.assertEqual(len(self.list), 6)
+
+
+if __name__ == '__main__':
+    testtorun = TestArraySortedList()
+    suite = unittest.TestLoader().loadTestsFromModule(testtorun)
+    unittest.TextTestRunner().run(suite)
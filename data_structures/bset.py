@@ -1,8 +1,16 @@
 """
     Bivector-based implementation of Set ADT.
+
+    The public methods check that items are positive integers. Trusted
+    callers that already guarantee this (e.g. Trainer.register_pokemon,
+    whose items come from PokeType values) can use add_unchecked and
+    contains_unchecked to skip the check on hot paths.
+
+    Also defines UnitTests for the class.
 """
 
 from __future__ import annotations
+import unittest
 from data_structures.set_adt import Set
 
 class BSet(Set[int]):
@@ -32,18 +40,23 @@ class BSet(Set[int]):
         """
         if not isinstance(item, int) or item <= 0:
             raise TypeError('Set elements should be integers')
-        return (self.elems >> (item - 1)) & 1
+        return (self.elems >> (item - 1)) & 1 == 1
 
-    def __len__(self) -> int:
+    def contains_unchecked(self, item: int) -> bool:
+        """ True if the set contains the item, which must be a positive integer.
+        :pre: item is a positive integer (not checked)
         """
-        Size computation. The most expensive operation.
-        Use int.bit_length(your_integer) to calculate the bit length.
+        return (self.elems >> (item - 1)) & 1 == 1
+
+    def __iter__(self):
+        """ Iterates over the elements in increasing order, visiting set bits only.
+        :complexity: O(1) per element, independent of the gaps between them
         """
-        res = 0
-        for item in range(1, int.bit_length(self.elems) + 1):
-            if item in self:
-                res += 1
-        return res
+        bits = self.elems
+        while bits:
+            lowest = bits & -bits
+            yield lowest.bit_length()
+            bits ^= lowest
 
     def add(self, item: int) -> None:
         """ Adds an element to the set.
@@ -53,6 +66,27 @@ class BSet(Set[int]):
             raise TypeError('Set elements should be integers')
         self.elems |= 1 << (item - 1)
 
+    def add_unchecked(self, item: int) -> None:
+        """ Adds an element to the set.
+        :pre: item is a positive integer (not checked)
+        """
+        self.elems |= 1 << (item - 1)
+
+    def update(self, items) -> None:
+        """ Adds every element of items, an iterable of positive integers or another BSet.
+        The elements are collected into one mask, which is merged into the set at once.
+        :raises TypeError: if an item is not integer or if not positive, in which case the set is unchanged.
+        """
+        if isinstance(items, BSet):
+            self.elems |= items.elems
+            return
+        mask = 0
+        for item in items:
+            if not isinstance(item, int) or item <= 0:
+                raise TypeError('Set elements should be integers')
+            mask |= 1 << (item - 1)
+        self.elems |= mask
+
     def remove(self, item: int) -> None:
         """ Removes an element from the set.
         :raises TypeError: if the item is not integer or if not positive.
@@ -60,8 +94,9 @@ class BSet(Set[int]):
         """
         if not isinstance(item, int) or item <= 0:
             raise TypeError('Set elements should be integers')
-        if item in self:
-            self.elems ^= 1 << (item - 1)
+        bit = 1 << (item - 1)
+        if self.elems & bit:
+            self.elems ^= bit
         else:
             raise KeyError(item)
 
@@ -91,24 +126,89 @@ class BSet(Set[int]):
         res.elems = self.elems & ~other.elems
         return res
 
+    def __ior__(self, other: BSet[int]) -> BSet[int]:
+        """ In-place union with another set. """
+        self.elems |= other.elems
+        return self
+
+    def __iand__(self, other: BSet[int]) -> BSet[int]:
+        """ In-place intersection with another set. """
+        self.elems &= other.elems
+        return self
+
     def __len__(self) -> int:
         """
-        Size computation. The most expensive operation.
-        Use int.bit_length(your_integer) to calculate the bit length.
+        Size computation, counting the set bits with int.bit_count().
         """
-        return bin(self.elems).count('1')
+        return self.elems.bit_count()
 
     def __str__(self):
         """ Construct a nice string representation. """
-        bit_elems = self.elems
-        out_elems = []
-        current = 0
-        while bit_elems:
-            if bit_elems & (1 << current):
-                out_elems.append(str(current+1))
-                bit_elems &= ~(1 << current)
-            current += 1
-        return '{' + ', '.join(out_elems) + '}'
+        return '{' + ', '.join(str(item) for item in self) + '}'
+
+class TestBSet(unittest.TestCase):
+    """ Tests for the above class."""
+
+    def make(self, *items: int) -> BSet:
+        s = BSet()
+        for item in items:
+            s.add(item)
+        return s
+
+    def test_iter_sparse(self):
+        s = self.make(70, 1, 3, 200, 64, 65)
+        self.assertEqual(list(s), [1, 3, 64, 65, 70, 200])
+        self.assertEqual(list(BSet()), [])
+        self.assertEqual(str(s), '{1, 3, 64, 65, 70, 200}')
+
+    def test_len(self):
+        self.assertEqual(len(BSet()), 0)
+        s = self.make(1, 500, 500, 2)
+        self.assertEqual(len(s), 3)
+        s.remove(500)
+        self.assertEqual(len(s), 2)
+
+    def test_contains(self):
+        s = self.make(2, 100)
+        self.assertIs(2 in s, True)
+        self.assertIs(1 in s, False)
+        self.assertIs(101 in s, False)
+        self.assertIs(s.contains_unchecked(100), True)
+        self.assertIs(s.contains_unchecked(3), False)
+        for item in (0, -1, 1.0, '1'):
+            self.assertRaises(TypeError, s.__contains__, item)
+
+    def test_add_unchecked(self):
+        items = [5, 1, 64, 5, 129]
+        checked, unchecked = BSet(), BSet()
+        for item in items:
+            checked.add(item)
+            unchecked.add_unchecked(item)
+        self.assertEqual(unchecked.elems, checked.elems)
+        self.assertEqual(list(unchecked), [1, 5, 64, 129])
+
+    def test_update(self):
+        s = self.make(1)
+        s.update([3, 70, 3])
+        self.assertEqual(list(s), [1, 3, 70])
+        s.update(self.make(2, 70))
+        self.assertEqual(list(s), [1, 2, 3, 70])
+        self.assertRaises(TypeError, s.update, [4, 0])
+        self.assertEqual(list(s), [1, 2, 3, 70])
+
+    def test_in_place_union_intersection(self):
+        s, t = self.make(1, 3, 80), self.make(3, 4, 80)
+        u = s
+        u |= t
+        self.assertIs(u, s)
+        self.assertEqual(list(s), [1, 3, 4, 80])
+        self.assertEqual(list(t), [3, 4, 80])
+        s &= self.make(4, 80, 90)
+        self.assertIs(u, s)
+        self.assertEqual(list(s), [4, 80])
+        s &= BSet()
+        self.assertTrue(s.is_empty())
+
 
 if __name__ == '__main__':
     s = BSet(3)
@@ -123,3 +223,7 @@ if __name__ == '__main__':
 
     print(f'S union T = {s.union(t)}')
     print(f'S intersect T = {s.intersection(t)}')
+
+    testtorun = TestBSet()
+    suite = unittest.TestLoader().loadTestsFromModule(testtorun)
+    unittest.TextTestRunner().run(suite)
@@ -0,0 +1,231 @@
+""" Open-addressing hash table implementation of a map ADT.
+
+LinearProbeTable stores (key, value) pairs directly in an ArrayR and
+resolves collisions by linear probing. The array size is a power of two,
+so a key's home slot is its hash masked to the table size. The array
+doubles once the number of pairs would exceed load_factor of its size, and
+deletion shifts the following pairs of the probe run back instead of
+leaving tombstones, so lookups never scan dead slots. Lookup, insertion and
+deletion are O(1) on average. Also defines UnitTests for the class.
+"""
+__docformat__ = 'reStructuredText'
+
+import unittest
+from typing import Generic, Iterator, TypeVar
+from data_structures.referential_array import ArrayR
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+
+class LinearProbeTable(Generic[K, V]):
+    """ Map from hashable keys to values, using open addressing with linear probing.
+
+    Attributes:
+         length (int): number of pairs in the table
+         array (ArrayR[tuple]): the slots, each None or a (key, value) pair
+         load_factor (float): the array doubles before more than this fraction of it is used
+    """
+    MIN_CAPACITY = 8
+    DEFAULT_LOAD_FACTOR = 0.5
+
+    def __init__(self, capacity: int = MIN_CAPACITY, load_factor: float = DEFAULT_LOAD_FACTOR) -> None:
+        """ Creates a table with room for capacity pairs before its first resize.
+        :raises ValueError: if load_factor is not strictly between 0 and 1
+        """
+        if not 0 < load_factor < 1:
+            raise ValueError('load_factor must be between 0 and 1')
+        self.load_factor = load_factor
+        self.length = 0
+        self.array = ArrayR(self._table_size(capacity))
+
+    @classmethod
+    def from_pairs(cls, pairs, load_factor: float = DEFAULT_LOAD_FACTOR) -> 'LinearProbeTable[K, V]':
+        """ Creates a table holding the given (key, value) pairs; later pairs overwrite earlier equal keys. """
+        pairs = list(pairs)
+        table = cls(len(pairs), load_factor)
+        for key, value in pairs:
+            table[key] = value
+        return table
+
+    def __len__(self) -> int:
+        """ Returns the number of pairs in the table. """
+        return self.length
+
+    def is_empty(self) -> bool:
+        """ True if the table holds no pairs. """
+        return self.length == 0
+
+    def __contains__(self, key: K) -> bool:
+        """ True if key is in the table.
+        :complexity: O(1) on average
+        """
+        return self.array[self._find_slot(key)] is not None
+
+    def __getitem__(self, key: K) -> V:
+        """ Returns the value stored for key.
+        :complexity: O(1) on average
+        :raises KeyError: if key is not in the table
+        """
+        pair = self.array[self._find_slot(key)]
+        if pair is None:
+            raise KeyError(key)
+        return pair[1]
+
+    def get(self, key: K, default: V = None) -> V:
+        """ Returns the value stored for key, or default if key is not in the table. """
+        pair = self.array[self._find_slot(key)]
+        return default if pair is None else pair[1]
+
+    def __setitem__(self, key: K, value: V) -> None:
+        """ Stores value for key, replacing any previous value.
+        :complexity: O(1) amortised, O(N) when the array has to grow
+        """
+        slot = self._find_slot(key)
+        if self.array[slot] is None:
+            if self.length + 1 > self.load_factor * len(self.array):
+                self._rehash(2 * len(self.array))
+                slot = self._find_slot(key)
+            self.length += 1
+        self.array[slot] = (key, value)
+
+    def __delitem__(self, key: K) -> None:
+        """ Removes key and its value, shifting back later pairs of the same probe run.
+        :complexity: O(1) on average
+        :raises KeyError: if key is not in the table
+        """
+        mask = len(self.array) - 1
+        hole = self._find_slot(key)
+        if self.array[hole] is None:
+            raise KeyError(key)
+        self.array[hole] = None
+        self.length -= 1
+
+        # a pair may move into the hole only if its home slot is not between the hole and its current slot
+        slot = (hole + 1) & mask
+        while self.array[slot] is not None:
+            home = hash(self.array[slot][0]) & mask
+            if (slot - home) & mask >= (slot - hole) & mask:
+                self.array[hole] = self.array[slot]
+                self.array[slot] = None
+                hole = slot
+            slot = (slot + 1) & mask
+
+    def __iter__(self) -> Iterator[K]:
+        """ Iterates over the keys, in no particular order. """
+        return self.keys()
+
+    def keys(self) -> Iterator[K]:
+        """ Iterates over the keys, in no particular order. """
+        for key, _ in self.items():
+            yield key
+
+    def values(self) -> Iterator[V]:
+        """ Iterates over the values, in the same order as keys(). """
+        for _, value in self.items():
+            yield value
+
+    def items(self) -> Iterator[tuple]:
+        """ Iterates over the (key, value) pairs, in the same order as keys(). """
+        for pair in self.array:
+            if pair is not None:
+                yield pair
+
+    def clear(self) -> None:
+        """ Removes all pairs, keeping the current array size. """
+        self.array.fill(None)
+        self.length = 0
+
+    def __str__(self) -> str:
+        """ Returns the pairs as {key: value, ...}. """
+        return '{' + ', '.join(f'{key!r}: {value!r}' for key, value in self.items()) + '}'
+
+    def _table_size(self, capacity: int) -> int:
+        """ Returns the smallest power of two that holds capacity pairs within the load factor. """
+        size = self.MIN_CAPACITY
+        while capacity > self.load_factor * size:
+            size *= 2
+        return size
+
+    def _find_slot(self, key: K) -> int:
+        """ Returns the slot holding key, or the empty slot that ends its probe run.
+        The load factor guarantees an empty slot exists.
+        """
+        mask = len(self.array) - 1
+        slot = hash(key) & mask
+        while True:
+            pair = self.array[slot]
+            if pair is None or pair[0] == key:
+                return slot
+            slot = (slot + 1) & mask
+
+    def _rehash(self, size: int) -> None:
+        """ Moves all pairs to a new array of the given size.
+        :complexity: O(N)
+        """
+        old_array = self.array
+        self.array = ArrayR(size)
+        self.length = 0
+        for pair in old_array:
+            if pair is not None:
+                self.array[self._find_slot(pair[0])] = pair
+                self.length += 1
+
+
+class TestLinearProbeTable(unittest.TestCase):
+    """ Tests for the above class."""
+
+    def setUp(self):
+        self.table = LinearProbeTable()
+        for i, name in enumerate(['Fire', 'Water', 'Grass', 'Bug', 'Dragon']):
+            self.table[name] = i
+
+    def test_get_and_set(self):
+        self.assertEqual(len(self.table), 5)
+        self.assertEqual(self.table['Grass'], 2)
+        self.table['Grass'] = 20
+        self.assertEqual(self.table['Grass'], 20)
+        self.assertEqual(len(self.table), 5)
+        self.assertRaises(KeyError, self.table.__getitem__, 'Rock')
+        self.assertIsNone(self.table.get('Rock'))
+        self.assertEqual(self.table.get('Rock', -1), -1)
+
+    def test_contains(self):
+        self.assertIn('Dragon', self.table)
+        self.assertNotIn('dragon', self.table)
+
+    def test_resize_keeps_pairs(self):
+        for i in range(1000):
+            self.table[i] = str(i)
+        self.assertEqual(len(self.table), 1005)
+        self.assertLessEqual(len(self.table), self.table.load_factor * len(self.table.array))
+        self.assertEqual([self.table[i] for i in range(1000)], [str(i) for i in range(1000)])
+
+    def test_delete_keeps_probe_runs(self):
+        # keys 0, 8, 16 ... share home slot 0 in a size 8 table
+        table = LinearProbeTable(load_factor=0.9)
+        for key in [0, 8, 16, 1, 24]:
+            table[key] = key
+        del table[8]
+        self.assertRaises(KeyError, table.__delitem__, 8)
+        self.assertEqual(sorted(table.keys()), [0, 1, 16, 24])
+        self.assertTrue(all(table[key] == key for key in [0, 1, 16, 24]))
+        for key in [0, 1, 16, 24]:
+            del table[key]
+        self.assertTrue(table.is_empty())
+
+    def test_iteration_and_from_pairs(self):
+        table = LinearProbeTable.from_pairs([('a', 1), ('b', 2), ('a', 3)])
+        self.assertEqual(sorted(table.items()), [('a', 3), ('b', 2)])
+        self.assertEqual(sorted(table.values()), [2, 3])
+        table.clear()
+        self.assertEqual(str(table), '{}')
+
+    def test_bad_load_factor(self):
+        self.assertRaises(ValueError, LinearProbeTable, 8, 1.0)
+
+
+if __name__ == '__main__':
+    testtorun = TestLinearProbeTable()
+    suite = unittest.TestLoader().loadTestsFromModule(testtorun)
+    unittest.TextTestRunner().run(suite)
@@ -0,0 +1,341 @@
+""" Opt-in operation counting for the ADTs in data_structures.
+
+Inside a counting() block, the methods of ArrayR and of the ADT classes are
+replaced by counting wrappers; on leaving the block the original methods
+are put back, so code run outside of it pays nothing at all. For every ADT
+instance touched inside the block, the log records
+
+- moves: elements written into array slots (one per __setitem__, count
+  per block copy or fill, one per BSet word operation),
+- comparisons: item keys read while ordering ListItems (ArraySortedList,
+  ArrayMinHeap) and BSet membership tests; ArrayKeyedSortedList compares
+  raw numbers and is not counted,
+- resizes: times the instance replaced its backing array (or re-packed its
+  blocks, for UnrolledList),
+- allocations and allocated_slots: arrays created and their total length.
+
+Array work done inside an ADT method is attributed to that ADT rather than
+to the array, so e.g. the block move of an ArraySortedList insertion shows
+up under the list. Typical use, per battle:
+
+    with counting() as log:
+        Battle(trainer_1, trainer_2, BattleMode.OPTIMISE).commence_battle()
+    print(log.by_class())
+
+patch_methods() is the helper doing the replacement and restoring, and can
+be reused to instrument other classes.
+"""
+__docformat__ = 'reStructuredText'
+
+import functools
+import unittest
+import weakref
+from contextlib import contextmanager
+from types import FunctionType
+
+from data_structures.referential_array import ArrayR
+from data_structures.typed_array import ArrayT, TypedArrayStack, TypedCircularQueue
+from data_structures.stack_adt import ArrayStack
+from data_structures.queue_adt import CircularQueue
+from data_structures.ring_buffer import RingBuffer
+from data_structures.sorted_list_adt import ListItem, SortedList
+from data_structures.array_sorted_list import ArraySortedList
+from data_structures.array_min_heap import ArrayMinHeap
+from data_structures.array_keyed_sorted_list import ArrayKeyedSortedList
+from data_structures.abstract_list import List
+from data_structures.array_list import ArrayList
+from data_structures.unrolled_list import UnrolledList
+from data_structures.bset import BSet
+from data_structures.hash_table import LinearProbeTable
+
+# classes whose methods make their instance the owner of the array work they do
+ADT_CLASSES = (ArrayStack, TypedArrayStack, CircularQueue, RingBuffer, TypedCircularQueue, SortedList, ArraySortedList,
+               ArrayMinHeap, ArrayKeyedSortedList, List, ArrayList, UnrolledList, LinearProbeTable)
+# attributes holding an ADT's backing array, a new object there is a resize
+ARRAY_ATTRIBUTES = ('array', 'values')
+# methods that resize without replacing a backing array
+RESIZE_METHODS = {UnrolledList: '_repack'}
+# BSet methods and the counter each call adds one to
+BSET_OPERATIONS = {'add': 'moves', 'add_unchecked': 'moves', 'remove': 'moves', 'update': 'moves',
+                   '__ior__': 'moves', '__iand__': 'moves', 'union': 'moves', 'intersection': 'moves',
+                   'difference': 'moves', '__contains__': 'comparisons', 'contains_unchecked': 'comparisons'}
+
+_MISSING = object()
+
+
+class OperationCounts:
+    """ Operation counters of one ADT instance, or totals over several. """
+    FIELDS = ('moves', 'comparisons', 'resizes', 'allocations', 'allocated_slots')
+
+    def __init__(self) -> None:
+        for field in self.FIELDS:
+            setattr(self, field, 0)
+
+    def merge(self, other: 'OperationCounts') -> None:
+        """ Adds the counters of other to these. """
+        for field in self.FIELDS:
+            setattr(self, field, getattr(self, field) + getattr(other, field))
+
+    def as_dict(self) -> dict:
+        """ Returns the counters as a dict. """
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def __repr__(self) -> str:
+        return 'OperationCounts(' + ', '.join(f'{field}={value}' for field, value in self.as_dict().items()) + ')'
+
+
+class OperationLog:
+    """ The counters recorded by one counting() block.
+
+    Attributes:
+         instances (list[tuple]): (class name, OperationCounts) of every instance counted, kept after the instance is gone
+    """
+
+    def __init__(self) -> None:
+        self.instances = []
+        self._by_object = weakref.WeakKeyDictionary()
+
+    def counts_for(self, obj) -> OperationCounts:
+        """ Returns the counters of obj, zero if nothing was counted for it. """
+        counts = self._by_object.get(obj)
+        if counts is None:
+            counts = OperationCounts()
+            self._by_object[obj] = counts
+            self.instances.append((type(obj).__name__, counts))
+        return counts
+
+    def by_class(self) -> dict:
+        """ Returns the counters summed per ADT class name. """
+        totals = {}
+        for name, counts in self.instances:
+            totals.setdefault(name, OperationCounts()).merge(counts)
+        return totals
+
+    def total(self) -> OperationCounts:
+        """ Returns the counters summed over every instance. """
+        total = OperationCounts()
+        for _, counts in self.instances:
+            total.merge(counts)
+        return total
+
+
+_log = None     # the OperationLog of the active counting() block, if any
+_owners = []    # stack of ADT instances whose methods are running
+
+
+def is_enabled() -> bool:
+    """ True inside a counting() block. """
+    return _log is not None
+
+
+def _charge(array, field: str, amount: int = 1) -> None:
+    """ Adds amount to a counter of the running ADT, or of array itself if no ADT method is running. """
+    counts = _log.counts_for(_owners[-1] if _owners else array)
+    setattr(counts, field, getattr(counts, field) + amount)
+
+
+@contextmanager
+def patch_methods(patches: dict):
+    """ Replaces class attributes while the block runs and restores them afterwards, even on error.
+    patches maps each class to a dict of attribute name -> replacement. Attributes the class
+    inherited are removed again on exit rather than copied down.
+    """
+    saved = []
+    try:
+        for cls, replacements in patches.items():
+            for name, replacement in replacements.items():
+                saved.append((cls, name, cls.__dict__.get(name, _MISSING)))
+                setattr(cls, name, replacement)
+        yield
+    finally:
+        for cls, name, original in reversed(saved):
+            if original is _MISSING:
+                delattr(cls, name)
+            else:
+                setattr(cls, name, original)
+
+
+def _owned(method, resize: bool = False):
+    """ Wraps an ADT method so array work inside it is charged to its instance, and resizes are counted. """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if resize:
+            _log.counts_for(self).resizes += 1
+        if _owners and _owners[-1] is self:
+            return method(self, *args, **kwargs)
+        arrays = [vars(self).get(name) for name in ARRAY_ATTRIBUTES]
+        _owners.append(self)
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            _owners.pop()
+            if any(old is not None and vars(self).get(name) is not old for name, old in zip(ARRAY_ATTRIBUTES, arrays)):
+                _log.counts_for(self).resizes += 1
+    return wrapper
+
+
+def _counted(method, field: str):
+    """ Wraps a method so each call adds one to a counter of its instance. """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        counts = _log.counts_for(self)
+        setattr(counts, field, getattr(counts, field) + 1)
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _array_patches(cls: type) -> dict:
+    """ Returns the counting replacements for the array methods cls itself defines. """
+    patches = {}
+    init = cls.__dict__['__init__']
+
+    @functools.wraps(init)
+    def counted_init(self, length, *args, **kwargs):
+        init(self, length, *args, **kwargs)
+        _charge(self, 'allocations')
+        _charge(self, 'allocated_slots', length)
+    patches['__init__'] = counted_init
+
+    from_iterable = cls.__dict__['from_iterable'].__func__
+
+    @functools.wraps(from_iterable)
+    def counted_from_iterable(array_class, *args, **kwargs):
+        result = from_iterable(array_class, *args, **kwargs)
+        _charge(result, 'moves', len(result))
+        return result
+    patches['from_iterable'] = classmethod(counted_from_iterable)
+
+    copy_from = cls.__dict__['copy_from']
+
+    @functools.wraps(copy_from)
+    def counted_copy_from(self, source, source_start=0, start=0, count=None):
+        copy_from(self, source, source_start, start, count)
+        _charge(self, 'moves', len(source) - source_start if count is None else count)
+    patches['copy_from'] = counted_copy_from
+
+    fill = cls.__dict__['fill']
+
+    @functools.wraps(fill)
+    def counted_fill(self, value, start=0, stop=None):
+        fill(self, value, start, stop)
+        _charge(self, 'moves', (len(self) if stop is None else stop) - start)
+    patches['fill'] = counted_fill
+
+    if '__setitem__' in cls.__dict__:
+        setitem = cls.__dict__['__setitem__']
+
+        @functools.wraps(setitem)
+        def counted_setitem(self, index, value):
+            setitem(self, index, value)
+            _charge(self, 'moves')
+        patches['__setitem__'] = counted_setitem
+    return patches
+
+
+def _counted_key() -> property:
+    """ Returns a ListItem.key property counting each read as a comparison of the running ADT. """
+    def get_key(item):
+        if _owners:
+            _charge(None, 'comparisons')
+        return item.__dict__['key']
+
+    def set_key(item, key):
+        item.__dict__['key'] = key
+    return property(get_key, set_key)
+
+
+def _all_patches() -> dict:
+    """ Returns the replacements for every instrumented class. """
+    patches = {ArrayR: _array_patches(ArrayR), ArrayT: _array_patches(ArrayT), ListItem: {'key': _counted_key()}}
+    for cls in ADT_CLASSES:
+        patches[cls] = {name: _owned(attribute, RESIZE_METHODS.get(cls) == name)
+                        for name, attribute in vars(cls).items() if isinstance(attribute, FunctionType)}
+    patches[BSet] = {name: _counted(BSet.__dict__[name], field) for name, field in BSET_OPERATIONS.items()}
+    return patches
+
+
+@contextmanager
+def counting():
+    """ Counts ADT operations while the block runs and yields the OperationLog they go to.
+    :raises RuntimeError: if a counting() block is already running
+    """
+    global _log
+    if _log is not None:
+        raise RuntimeError('Operation counting is already enabled')
+    log = OperationLog()
+    with patch_methods(_all_patches()):
+        _log = log
+        try:
+            yield log
+        finally:
+            _log = None
+            _owners.clear()
+
+
+class TestInstrumentation(unittest.TestCase):
+    """ Tests for the above module."""
+
+    def test_disabled_leaves_classes_untouched(self):
+        before = dict(vars(ArraySortedList)), dict(vars(ArrayR)), dict(vars(ListItem))
+        with counting():
+            self.assertTrue(is_enabled())
+            self.assertIsNot(vars(ArrayR)['__setitem__'], before[1]['__setitem__'])
+        self.assertFalse(is_enabled())
+        self.assertEqual((dict(vars(ArraySortedList)), dict(vars(ArrayR)), dict(vars(ListItem))), before)
+
+    def test_array_work_is_charged_to_owner(self):
+        with counting() as log:
+            stack = ArrayStack(2, growable=True)
+            stack.push(1)
+            stack.push_many([2, 3, 4])
+        counts = log.counts_for(stack)
+        self.assertEqual(counts.moves, 1 + 1 + 3)    # push, copy into the grown array, push_many
+        self.assertEqual((counts.allocations, counts.allocated_slots, counts.resizes), (2, 2 + 4, 1))
+        self.assertEqual(log.by_class()['ArrayStack'].moves, 5)
+        self.assertNotIn('ArrayR', log.by_class())
+
+    def test_resizes_and_comparisons(self):
+        with counting() as log:
+            sorted_list = ArraySortedList(1)
+            for key in [5, 1, 4, 2, 3]:
+                sorted_list.add(ListItem(key, key))
+        counts = log.counts_for(sorted_list)
+        self.assertEqual(counts.resizes, 3)     # capacity 1 -> 2 -> 4 -> 8
+        self.assertGreater(counts.comparisons, 0)
+        self.assertEqual(ListItem(1, 2).key, 2)
+
+    def test_hash_table_rehash(self):
+        with counting() as log:
+            table = LinearProbeTable()
+            for i in range(9):
+                table[i] = i
+            table.get(0)
+        self.assertEqual(log.counts_for(table).resizes, 1)
+
+    def test_unrolled_list_repacks(self):
+        with counting() as log:
+            lst = UnrolledList()
+            for i in range(200):
+                lst.append(i)
+        self.assertEqual(log.counts_for(lst).resizes, 1)    # re-packed once at 128 items
+
+    def test_bset_operations(self):
+        with counting() as log:
+            bset = BSet()
+            bset.add(3)
+            bset.update([1, 2])
+            self.assertIn(3, bset)
+        self.assertEqual((log.counts_for(bset).moves, log.counts_for(bset).comparisons), (2, 1))
+
+    def test_nested_counting_rejected(self):
+        with counting():
+            with self.assertRaises(RuntimeError):
+                with counting():
+                    pass
+        self.assertFalse(is_enabled())
+
+
+if __name__ == '__main__':
+    testtorun = TestInstrumentation()
+    suite = unittest.TestLoader().loadTestsFromModule(testtorun)
+    unittest.TextTestRunner().run(suite)
@@ -93,6 +93,59 @@ class CircularQueue(Queue[T]):
         """ True if the queue is full and no element can be appended. """
         return len(self) == len(self.array)
 
+    def peek_at(self, index: int = 0) -> T:
+        """ Returns the element at a given position from the front, without serving it.
+        :complexity: O(1)
+        :raises IndexError: if there is no such position
+        """
+        if not -len(self) <= index < len(self):
+            raise IndexError("No such index in the queue")
+        return self.array[(self.front + index % len(self)) % len(self.array)]
+
+    def extend(self, items) -> None:
+        """ Appends all the given elements to the rear of the queue, in order.
+        The elements are copied in at most two block moves.
+        :pre: queue has room for all the elements
+        :raises Exception: if the queue does not have room for all of them
+        """
+        values = list(items)
+        self._reserve(len(values))
+
+        # the free space may wrap around the end of the array
+        first = min(len(values), len(self.array) - self.rear)
+        self.array.copy_from(values, 0, self.rear, first)
+        self.array.copy_from(values, first, 0, len(values) - first)
+
+        self.length += len(values)
+        self.rear = (self.rear + len(values)) % len(self.array)
+
+    def drain(self, count: int = None) -> ArrayR[T]:
+        """ Serves count elements (all of them by default) and returns them in an array, front first.
+        The elements are copied out in at most two block moves.
+        :pre: 0 < count <= len(self)
+        :raises Exception: if the queue has fewer than count elements, or none at all
+        """
+        count = len(self) if count is None else count
+        if self.is_empty() or not 0 < count <= len(self):
+            raise Exception("Queue does not have enough elements")
+
+        # the served elements may wrap around the end of the array
+        result = ArrayR(count)
+        first = min(count, len(self.array) - self.front)
+        result.copy_from(self.array, self.front, 0, first)
+        result.copy_from(self.array, 0, first, count - first)
+
+        self.length -= count
+        self.front = (self.front + count) % len(self.array)
+        return result
+
+    def _reserve(self, count: int) -> None:
+        """ Makes sure count more elements fit in the queue.
+        :raises Exception: if they do not fit
+        """
+        if len(self) + count > len(self.array):
+            raise Exception("Queue is full")
+
     def clear(self) -> None:
         """ Clears all elements from the queue. """
         Queue.__init__(self)
@@ -184,6 +237,24 @@ class TestQueue(unittest.TestCase):
             self.assertEqual(len(queue), 0)
             self.assertTrue(queue.is_empty())
 
+    def test_peek_at(self):
+        for i in range(self.LARGE):
+            self.assertEqual(self.large_queue.peek_at(i), i)
+        self.assertEqual(self.large_queue.peek_at(-1), self.LARGE - 1)
+        self.assertRaises(IndexError, self.large_queue.peek_at, self.LARGE)
+        self.assertEqual(len(self.large_queue), self.LARGE)
+
+    def test_extend_and_drain(self):
+        queue = self.large_queue
+        for i in range(self.ROOMY):
+            queue.serve()
+        queue.extend(range(self.LARGE, self.LARGE + 15))  # wraps around the end of the array
+        self.assertTrue(queue.is_full())
+        drained = queue.drain()
+        self.assertEqual([drained[i] for i in range(len(drained))], list(range(self.ROOMY, self.LARGE + 15)))
+        self.assertTrue(queue.is_empty())
+        self.assertRaises(Exception, queue.extend, range(self.CAPACITY + 1))
+
 if __name__ == '__main__':
     testtorun = TestQueue()
     suite = unittest.TestLoader().loadTestsFromModule(testtorun)
@@ -12,25 +12,60 @@ space to hold the references.
 Note that while I do check the precondition in __init__ (noone else
 would), I do not check that of getitem or setitem, since that is already
 checked by self.array[index].
+
+The ctypes array is one of two storage backends. The default one is a
+plain Python list of the same length: it holds the same 8-byte references,
+but indexing it avoids the ctypes descriptor overhead on every access and
+it needs no throwaway list to initialise. ArrayR.BACKEND selects the
+backend for new arrays, and either can be requested per array.
+
+Slices are passed through to the storage, so array[i:j] returns a list and
+array[i:j] = values is a block move. The length of values must equal j - i,
+which __setitem__ checks for both backends, since a list would otherwise
+grow or shrink. The bulk methods (copy_from, fill) check their ranges too.
+
+Also defines UnitTests for the class.
 """
 __author__ = "Julian Garcia for the __init__ code, Maria Garcia de la Banda for the rest"
 __docformat__ = 'reStructuredText'
 
+import unittest
 from ctypes import py_object
 from typing import TypeVar, Generic
 
 T = TypeVar('T')
 
 class ArrayR(Generic[T]):
-    def __init__(self, length: int) -> None:
+    BACKEND = "list"
+    BACKENDS = ("list", "ctypes")
+
+    def __init__(self, length: int, backend: str = None) -> None:
         """ Creates an array of references to objects of the given length
         :complexity: O(length) for best/worst case to initialise to None
         :pre: length > 0
+        :raises ValueError: if length <= 0 or backend is not one of BACKENDS
         """
         if length <= 0:
             raise ValueError("Array length should be larger than 0.")
-        self.array = (length * py_object)() # initialises the space
-        self.array[:] =  [None for _ in range(length)]
+        backend = backend or self.BACKEND
+        if backend == "list":
+            self.array = [None] * length
+        elif backend == "ctypes":
+            self.array = (length * py_object)() # initialises the space
+            self.array[:] =  [None for _ in range(length)]
+        else:
+            raise ValueError(f"Unknown ArrayR backend {backend!r}, expected one of {self.BACKENDS}.")
+
+    @classmethod
+    def from_iterable(cls, iterable, backend: str = None) -> 'ArrayR[T]':
+        """ Creates an array holding the items of iterable, in order
+        :complexity: O(N) for best/worst case, N being the number of items
+        :pre: iterable has at least one item
+        """
+        values = list(iterable)
+        array = cls(len(values), backend)
+        array.array[:] = values
+        return array
 
     def __len__(self) -> int:
         """ Returns the length of the array
@@ -46,12 +81,47 @@ class ArrayR(Generic[T]):
         return self.array[index]
 
     def __setitem__(self, index: int, value: T) -> None:
-        """ Sets the object in position index to value
-        :complexity: O(1)
+        """ Sets the object in position index to value, or the positions of a slice index to the items of value
+        :complexity: O(1) for an index, O(length of the slice) for a slice
         :pre: index in between 0 and length - self.array[] checks it
+        :raises ValueError: if a slice index is given a number of items other than its length
         """
+        if isinstance(index, slice) and len(value) != len(range(*index.indices(len(self.array)))):
+            raise ValueError("Slice assignment would change the array length")
         self.array[index] = value
     
+    def __iter__(self):
+        """ Iterates over every position of the array, including the ones still set to None
+        :complexity: O(1) per item
+        """
+        return iter(self.array)
+
+    def copy_from(self, source, source_start: int = 0, start: int = 0, count: int = None) -> None:
+        """ Copies count items of source, from source_start on, into this array from start on.
+        source can be any sliceable sequence, including this array (overlapping copies are safe)
+        :complexity: O(count), done as a single block move
+        :raises IndexError: if either range does not fit in its array
+        """
+        if count is None:
+            count = len(source) - source_start
+        if count < 0 or source_start < 0 or start < 0 or \
+                source_start + count > len(source) or start + count > len(self.array):
+            raise IndexError("Copy range out of bounds")
+        block = source[source_start:source_start + count]
+        if len(block) != count:
+            raise IndexError("Copy range out of bounds")
+        self.array[start:start + count] = block
+
+    def fill(self, value: T, start: int = 0, stop: int = None) -> None:
+        """ Sets every position from start up to (excluding) stop to value
+        :complexity: O(stop - start), done as a single block move
+        :raises IndexError: if the range does not fit in the array
+        """
+        stop = len(self.array) if stop is None else stop
+        if not 0 <= start <= stop <= len(self.array):
+            raise IndexError("Fill range out of bounds")
+        self.array[start:stop] = [value] * (stop - start)
+
     def index(self, item: T) -> int:
         for index, arr_item in enumerate(self.array):
             if arr_item == item:
@@ -67,3 +137,82 @@ class ArrayR(Generic[T]):
         
         ret_str = ret_str[:-2] + "]"
         return ret_str
+
+
+
+class TestArrayR(unittest.TestCase):
+    """ Tests for the above class, run under every backend. """
+
+    def arrays(self, length: int):
+        """ Yields an array of the given length for each backend, inside a subtest. """
+        for backend in ArrayR.BACKENDS:
+            with self.subTest(backend=backend):
+                yield ArrayR(length, backend)
+
+    def test_init(self):
+        for array in self.arrays(3):
+            self.assertEqual(len(array), 3)
+            self.assertEqual(list(array), [None, None, None])
+        self.assertRaises(ValueError, ArrayR, 0)
+        self.assertRaises(ValueError, ArrayR, 3, "numpy")
+
+    def test_default_backend(self):
+        self.assertIsInstance(ArrayR(2).array, list)
+        original = ArrayR.BACKEND
+        ArrayR.BACKEND = "ctypes"
+        try:
+            self.assertNotIsInstance(ArrayR(2).array, list)
+        finally:
+            ArrayR.BACKEND = original
+
+    def test_from_iterable(self):
+        for backend in ArrayR.BACKENDS:
+            with self.subTest(backend=backend):
+                array = ArrayR.from_iterable((i * i for i in range(4)), backend)
+                self.assertEqual(list(array), [0, 1, 4, 9])
+                self.assertEqual(array.index(4), 2)
+                self.assertRaises(ValueError, array.index, 5)
+
+    def test_slice_assignment_keeps_length(self):
+        for array in self.arrays(4):
+            array[1:3] = ['b', 'c']
+            self.assertEqual(list(array), [None, 'b', 'c', None])
+            self.assertRaises(ValueError, array.__setitem__, slice(1, 3), ['x'])
+            self.assertRaises(ValueError, array.__setitem__, slice(1, 3), ['x', 'y', 'z'])
+            self.assertEqual(len(array), 4)
+
+    def test_copy_from(self):
+        for array in self.arrays(5):
+            array.copy_from([1, 2, 3], 0, 1)
+            self.assertEqual(list(array), [None, 1, 2, 3, None])
+            array.copy_from(array, 1, 2, 3) # overlapping, shifting right
+            self.assertEqual(list(array), [None, 1, 1, 2, 3])
+            array.copy_from(array, 2, 0, 3) # overlapping, shifting left
+            self.assertEqual(list(array), [1, 2, 3, 2, 3])
+            array.copy_from(['x'], 0, 4, 0)
+            self.assertEqual(list(array), [1, 2, 3, 2, 3])
+
+    def test_copy_from_out_of_bounds(self):
+        for array in self.arrays(3):
+            for source_start, start, count in ((0, 1, 3), (2, 0, 2), (-1, 0, 1), (0, -1, 1), (0, 0, -1)):
+                self.assertRaises(IndexError, array.copy_from, [1, 2, 3], source_start, start, count)
+            self.assertRaises(IndexError, array.copy_from, [1, 2, 3, 4])
+            self.assertEqual(list(array), [None, None, None])
+
+    def test_fill(self):
+        for array in self.arrays(4):
+            array.fill(0)
+            self.assertEqual(list(array), [0, 0, 0, 0])
+            array.fill(7, 1, 3)
+            self.assertEqual(list(array), [0, 7, 7, 0])
+            array.fill(9, 2, 2)
+            self.assertEqual(list(array), [0, 7, 7, 0])
+            for start, stop in ((3, 2), (-1, 2), (0, 5)):
+                self.assertRaises(IndexError, array.fill, 1, start, stop)
+            self.assertEqual(len(array), 4)
+
+
+if __name__ == '__main__':
+    testtorun = TestArrayR()
+    suite = unittest.TestLoader().loadTestsFromModule(testtorun)
+    unittest.TextTestRunner().run(suite)
@@ -0,0 +1,136 @@
+""" Growable ring buffer implementation of the Queue ADT.
+
+RingBuffer is a CircularQueue that never becomes full: when it runs out of
+room the backing array doubles, so append is O(1) amortised, and if
+shrinking is enabled the array halves again once three quarters of it are
+empty. Being a CircularQueue, it also provides peek_at, extend and drain,
+and works anywhere a CircularQueue is expected. Also defines UnitTests for
+the class.
+"""
+__docformat__ = 'reStructuredText'
+
+import unittest
+from data_structures.queue_adt import CircularQueue
+from data_structures.referential_array import ArrayR, T
+
+
+class RingBuffer(CircularQueue[T]):
+    """ Circular queue that grows (and optionally shrinks) its array as needed.
+
+    Attributes:
+         length, front, rear, array: as in CircularQueue
+         min_capacity (int): the array never shrinks below this size
+         shrink (bool): whether the array halves when it is at most a quarter full
+    """
+
+    def __init__(self, max_capacity: int = 1, shrink: bool = False) -> None:
+        """ Creates a ring buffer with room for max_capacity elements before its first resize. """
+        CircularQueue.__init__(self, max_capacity)
+        self.min_capacity = len(self.array)
+        self.shrink = shrink
+
+    def append(self, item: T) -> None:
+        """ Adds an element to the rear of the queue, growing the array if it is full.
+        :complexity: O(1) amortised, O(N) when the array has to grow
+        """
+        if len(self) == len(self.array):
+            self._resize(2 * len(self.array))
+        CircularQueue.append(self, item)
+
+    def serve(self) -> T:
+        """ Deletes and returns the element at the queue's front.
+        :complexity: O(1) amortised, O(N) when the array shrinks
+        :raises Exception: if the queue is empty
+        """
+        item = CircularQueue.serve(self)
+        self._shrink_if_sparse()
+        return item
+
+    def drain(self, count: int = None) -> ArrayR[T]:
+        """ Serves count elements (all of them by default) and returns them in an array, front first. """
+        result = CircularQueue.drain(self, count)
+        self._shrink_if_sparse()
+        return result
+
+    def is_full(self) -> bool:
+        """ A ring buffer is never full. """
+        return False
+
+    def _reserve(self, count: int) -> None:
+        """ Grows the array, by doubling, until count more elements fit. """
+        capacity = len(self.array)
+        while len(self) + count > capacity:
+            capacity *= 2
+        if capacity != len(self.array):
+            self._resize(capacity)
+
+    def _shrink_if_sparse(self) -> None:
+        """ Halves the array if shrinking is enabled and it is at most a quarter full. """
+        if self.shrink and len(self) <= len(self.array) // 4 and len(self.array) // 2 >= self.min_capacity:
+            self._resize(len(self.array) // 2)
+
+    def _resize(self, capacity: int) -> None:
+        """ Moves the elements, front first, to the start of a new array of the given capacity.
+        :complexity: O(N), done as at most two block moves
+        :pre: capacity >= len(self)
+        """
+        new_array = ArrayR(capacity)
+        first = min(len(self), len(self.array) - self.front)
+        new_array.copy_from(self.array, self.front, 0, first)
+        new_array.copy_from(self.array, 0, first, len(self) - first)
+
+        self.array = new_array
+        self.front = 0
+        self.rear = len(self) % capacity
+
+
+class TestRingBuffer(unittest.TestCase):
+    """ Tests for the above class."""
+    ITEMS = 100
+
+    def test_grows(self):
+        buffer = RingBuffer()
+        for i in range(self.ITEMS):
+            buffer.append(i)
+        self.assertFalse(buffer.is_full())
+        self.assertEqual(len(buffer), self.ITEMS)
+        self.assertEqual([buffer.serve() for _ in range(self.ITEMS)], list(range(self.ITEMS)))
+
+    def test_grows_while_wrapped(self):
+        buffer = RingBuffer(4)
+        buffer.extend([0, 1, 2, 3])
+        buffer.serve()
+        buffer.serve()
+        buffer.extend(range(4, 10))
+        self.assertEqual([buffer.peek_at(i) for i in range(len(buffer))], list(range(2, 10)))
+
+    def test_drain(self):
+        buffer = RingBuffer(3)
+        buffer.extend(range(self.ITEMS))
+        drained = buffer.drain(10)
+        self.assertEqual([drained[i] for i in range(10)], list(range(10)))
+        self.assertEqual(buffer.peek_at(), 10)
+        self.assertRaises(Exception, buffer.drain, self.ITEMS)
+
+    def test_shrink(self):
+        buffer = RingBuffer(2, shrink=True)
+        buffer.extend(range(self.ITEMS))
+        grown = len(buffer.array)
+        for i in range(self.ITEMS - 1):
+            self.assertEqual(buffer.serve(), i)
+        self.assertLess(len(buffer.array), grown)
+        self.assertGreaterEqual(len(buffer.array), buffer.min_capacity)
+        self.assertEqual(buffer.serve(), self.ITEMS - 1)
+
+    def test_no_shrink_by_default(self):
+        buffer = RingBuffer()
+        buffer.extend(range(self.ITEMS))
+        grown = len(buffer.array)
+        buffer.drain()
+        self.assertEqual(len(buffer.array), grown)
+
+
+if __name__ == '__main__':
+    testtorun = TestRingBuffer()
+    suite = unittest.TestLoader().loadTestsFromModule(testtorun)
+    unittest.TextTestRunner().run(suite)
@@ -80,3 +80,19 @@ class SortedList(ABC, Generic[T]):
     def add(self, item: ListItem) -> None:
         """ Add new element to the list. """
         pass
+
+    def add_pair(self, value: T, key: K) -> None:
+        """ Add a value with its sorting key. Subclasses may store them without a ListItem. """
+        self.add(ListItem(value, key))
+
+    def key_at(self, index: int) -> K:
+        """ Return the key of the element at a given position. """
+        return self[index].key
+
+    def value_at(self, index: int) -> T:
+        """ Return the value of the element at a given position. """
+        return self[index].value
+
+    def delete_value_at_index(self, index: int) -> T:
+        """ Delete the element at a given position and return its value only. """
+        return self.delete_at_index(index).value
@@ -54,32 +54,90 @@ class ArrayStack(Stack[T]):
     Attributes:
          length (int): number of elements in the stack (inherited)
          array (ArrayR[T]): array storing the elements of the queue
+         growable (bool): whether the array doubles instead of the stack becoming full
 
     ArrayR cannot create empty arrays. So MIN_CAPACITY used to avoid this.
     """
     MIN_CAPACITY = 1
 
-    def __init__(self, max_capacity: int) -> None:
+    def __init__(self, max_capacity: int, growable: bool = False) -> None:
         """ Initialises the length and the array with the given capacity.
             If max_capacity is 0, the array is created with MIN_CAPACITY.
+            If growable, max_capacity is only the initial size of the array.
         """
         Stack.__init__(self)
-        self.array = ArrayR(max(self.MIN_CAPACITY, max_capacity))
+        self.array = self._new_array(max(self.MIN_CAPACITY, max_capacity))
+        self.growable = growable
 
     def is_full(self) -> bool:
         """ True if the stack is full and no element can be pushed. """
-        return len(self) == len(self.array)
+        return not self.growable and len(self) == len(self.array)
 
     def push(self, item: T) -> None:
         """ Pushes an element to the top of the stack.
+        :complexity: O(1), O(1) amortised if growable
         :pre: stack is not full
         :raises Exception: if the stack is full
         """
-        if self.is_full():
-            raise Exception("Stack is full")
+        self._reserve(1)
         self.array[len(self)] = item
         self.length += 1
 
+    def push_many(self, items, count: int = None) -> None:
+        """ Pushes the first count of items (all of them by default) in order, so the last one ends on top.
+        items can be any sliceable sequence, such as an ArrayR, or any other iterable.
+        The elements are copied in as one block move.
+        :complexity: O(count)
+        :pre: stack has room for all the elements
+        :raises Exception: if the stack does not have room for all of them
+        """
+        if not hasattr(items, '__getitem__') or not hasattr(items, '__len__'):
+            items = list(items)
+        count = len(items) if count is None else count
+        self._reserve(count)
+        self.array.copy_from(items, 0, len(self), count)
+        self.length += count
+
+    def pop_many(self, count: int) -> ArrayR[T]:
+        """ Pops the top count elements and returns them in an array, in the order they were pushed
+        (the former top is last), so push_many() of the result restores the stack.
+        The elements are copied out as one block move.
+        :complexity: O(count)
+        :pre: 0 < count <= len(self)
+        :raises Exception: if the stack has fewer than count elements, or none at all
+        """
+        if self.is_empty() or not 0 < count <= len(self):
+            raise Exception("Stack does not have enough elements")
+        self.length -= count
+        result = self._new_array(count)
+        result.copy_from(self.array, self.length, 0, count)
+        return result
+
+    def __iter__(self):
+        """ Iterates over the elements from the top down, without popping them.
+        :complexity: O(1) per element
+        """
+        for index in range(len(self) - 1, -1, -1):
+            yield self.array[index]
+
+    def _reserve(self, count: int) -> None:
+        """ Makes sure count more elements fit in the stack, doubling the array as needed if growable.
+        :raises Exception: if they do not fit
+        """
+        if len(self) + count > len(self.array):
+            if not self.growable:
+                raise Exception("Stack is full")
+            capacity = len(self.array)
+            while capacity < len(self) + count:
+                capacity *= 2
+            new_array = self._new_array(capacity)
+            new_array.copy_from(self.array, count=len(self))
+            self.array = new_array
+
+    def _new_array(self, length: int) -> ArrayR[T]:
+        """ Creates an array of the kind that backs this stack. """
+        return ArrayR(length)
+
     def pop(self) -> T:
         """ Pops the element at the top of the stack.
         :pre: stack is not empty
@@ -183,6 +241,31 @@ class TestStack(unittest.TestCase):
             self.assertEqual(len(stack), 0)
             self.assertTrue(stack.is_empty())
 
+    def test_push_many_and_pop_many(self):
+        self.roomy_stack.push_many(ArrayR.from_iterable(range(10, 20)), 3)
+        self.assertEqual(len(self.roomy_stack), self.ROOMY + 3)
+        self.assertEqual(self.roomy_stack.peek(), 12)
+        popped = self.roomy_stack.pop_many(4)
+        self.assertEqual(list(popped), [4, 10, 11, 12])
+        self.roomy_stack.push_many(popped)
+        self.assertEqual(list(self.roomy_stack), [12, 11, 10, 4, 3, 2, 1, 0])
+        self.assertRaises(Exception, self.roomy_stack.pop_many, 9)
+        self.assertRaises(Exception, self.roomy_stack.push_many, range(self.CAPACITY))
+
+    def test_iter_top_down(self):
+        self.assertEqual(list(self.large_stack), list(range(self.LARGE - 1, -1, -1)))
+        self.assertEqual(len(self.large_stack), self.LARGE)
+        self.assertEqual(list(self.empty_stack), [])
+
+    def test_growable(self):
+        stack = ArrayStack(0, growable=True)
+        for i in range(100):
+            stack.push(i)
+        stack.push_many(range(100, 1000))
+        self.assertFalse(stack.is_full())
+        self.assertEqual(len(stack), 1000)
+        self.assertEqual(list(stack.pop_many(1000)), list(range(1000)))
+
 if __name__ == '__main__':
     testtorun = TestStack()
     suite = unittest.TestLoader().loadTestsFromModule(testtorun)
@@ -0,0 +1,213 @@
+""" Typed arrays of numbers, and stack and queue variants storing them.
+
+ArrayT has the ArrayR interface but stores raw machine numbers in an
+array.array ('d' for C doubles by default, 'q' for 64-bit integers, or any
+other array typecode) instead of references to boxed Python floats and
+ints. Each slot takes 8 bytes instead of an 8-byte reference plus a 24 to
+32-byte number object, and the storage supports the buffer protocol, so it
+can be handed to NumPy without copying (see ArrayT.to_numpy).
+
+TypedArrayStack and TypedCircularQueue are ArrayStack and CircularQueue
+backed by an ArrayT, for numeric payloads such as HP tracks or sort keys.
+Also defines UnitTests for the classes.
+"""
+__docformat__ = 'reStructuredText'
+
+import unittest
+from array import array
+from data_structures.referential_array import ArrayR
+from data_structures.stack_adt import ArrayStack
+from data_structures.queue_adt import CircularQueue
+
+
+class ArrayT(ArrayR):
+    """ Fixed-length array of numbers of a single C type. New positions hold 0. """
+    DEFAULT_TYPECODE = 'd'
+
+    def __init__(self, length: int, typecode: str = None) -> None:
+        """ Creates an array of the given length, holding numbers of the given array typecode
+        :complexity: O(length) for best/worst case to initialise to 0
+        :pre: length > 0
+        :raises ValueError: if length <= 0 or typecode is not a valid array typecode
+        """
+        if length <= 0:
+            raise ValueError("Array length should be larger than 0.")
+        self.typecode = typecode or self.DEFAULT_TYPECODE
+        self.array = array(self.typecode, [0]) * length
+
+    @classmethod
+    def from_iterable(cls, iterable, typecode: str = None) -> 'ArrayT':
+        """ Creates an array holding the numbers of iterable, in order
+        :complexity: O(N) for best/worst case, N being the number of items
+        :pre: iterable has at least one item
+        """
+        values = array(typecode or cls.DEFAULT_TYPECODE, iterable)
+        if len(values) == 0:
+            raise ValueError("Array length should be larger than 0.")
+        result = cls(1, values.typecode)
+        result.array = values
+        return result
+
+    def copy_from(self, source, source_start: int = 0, start: int = 0, count: int = None) -> None:
+        """ Copies count numbers of source, from source_start on, into this array from start on.
+        Numbers of an ArrayT of another typecode are converted to this array's type.
+        :complexity: O(count), done as a single block move
+        :raises IndexError: if either range does not fit in its array
+        :raises TypeError: if source holds values that are not numbers of this array's type
+        :raises OverflowError: if a number does not fit in this array's type
+        """
+        if count is None:
+            count = len(source) - source_start
+        if count < 0 or source_start < 0 or start < 0 or \
+                source_start + count > len(source) or start + count > len(self.array):
+            raise IndexError("Copy range out of bounds")
+        if isinstance(source, ArrayT) and source.typecode == self.typecode:
+            block = source.array[source_start:source_start + count]
+        else:
+            block = array(self.typecode, source[source_start:source_start + count])
+        self.array[start:start + count] = block
+
+    def fill(self, value, start: int = 0, stop: int = None) -> None:
+        """ Sets every position from start up to (excluding) stop to value
+        :complexity: O(stop - start), done as a single block move
+        :raises IndexError: if the range does not fit in the array
+        """
+        stop = len(self.array) if stop is None else stop
+        if not 0 <= start <= stop <= len(self.array):
+            raise IndexError("Fill range out of bounds")
+        self.array[start:stop] = array(self.typecode, [value]) * (stop - start)
+
+    def memoryview(self, start: int = 0, stop: int = None) -> memoryview:
+        """ Returns a memoryview of positions start up to (excluding) stop, without copying.
+        The array cannot be resized while the view is alive.
+        :complexity: O(1)
+        """
+        return memoryview(self.array)[start:stop]
+
+    def to_numpy(self, start: int = 0, stop: int = None):
+        """ Returns a NumPy array sharing this array's memory. Requires NumPy.
+        :complexity: O(1)
+        """
+        import numpy
+        return numpy.frombuffer(self.memoryview(start, stop), dtype=self.array.typecode)
+
+    def itemsize(self) -> int:
+        """ Returns the number of bytes taken by each position. """
+        return self.array.itemsize
+
+
+class TypedArrayStack(ArrayStack):
+    """ ArrayStack of numbers stored in an ArrayT.
+
+    Attributes:
+         length (int): number of elements in the stack (inherited)
+         array (ArrayT): array storing the numbers of the stack
+    """
+
+    def __init__(self, max_capacity: int, typecode: str = None, growable: bool = False) -> None:
+        """ Initialises the length and the typed array with the given capacity. """
+        self.typecode = typecode
+        ArrayStack.__init__(self, max_capacity, growable)
+
+    def _new_array(self, length: int) -> ArrayT:
+        """ Creates a typed array with this stack's typecode. """
+        return ArrayT(length, self.typecode)
+
+    def memoryview(self) -> memoryview:
+        """ Returns the numbers in the stack, bottom first, as a memoryview without copying.
+        :complexity: O(1)
+        """
+        return self.array.memoryview(0, len(self))
+
+    def to_numpy(self):
+        """ Returns the numbers in the stack, bottom first, as a NumPy array without copying. Requires NumPy. """
+        return self.array.to_numpy(0, len(self))
+
+
+class TypedCircularQueue(CircularQueue):
+    """ CircularQueue of numbers stored in an ArrayT.
+
+    Attributes:
+         length, front, rear: as in CircularQueue
+         array (ArrayT): array storing the numbers of the queue
+    """
+
+    def __init__(self, max_capacity: int, typecode: str = None) -> None:
+        """ Initialises the queue with a typed array of the given capacity. """
+        CircularQueue.__init__(self, max_capacity)
+        self.array = ArrayT(max(self.MIN_CAPACITY, max_capacity), typecode)
+
+    def drain(self, count: int = None) -> ArrayT:
+        """ Serves count numbers (all of them by default) and returns them in a typed array, front first. """
+        count = len(self) if count is None else count
+        if self.is_empty() or not 0 < count <= len(self):
+            raise Exception("Queue does not have enough elements")
+
+        result = ArrayT(count, self.array.typecode)
+        first = min(count, len(self.array) - self.front)
+        result.copy_from(self.array, self.front, 0, first)
+        result.copy_from(self.array, 0, first, count - first)
+
+        self.length -= count
+        self.front = (self.front + count) % len(self.array)
+        return result
+
+
+class TestTypedArrays(unittest.TestCase):
+    """ Tests for the above classes."""
+    CAPACITY = 10
+
+    def test_array_defaults_to_zero(self):
+        typed = ArrayT(self.CAPACITY)
+        self.assertEqual(list(typed), [0.0] * self.CAPACITY)
+        self.assertEqual(typed.itemsize(), 8)
+        self.assertRaises(ValueError, ArrayT, 0)
+
+    def test_array_bulk(self):
+        typed = ArrayT.from_iterable(range(5), 'q')
+        typed.copy_from(typed, 0, 1, 4)
+        self.assertEqual(list(typed), [0, 0, 1, 2, 3])
+        typed.fill(7, 3)
+        self.assertEqual(list(typed), [0, 0, 1, 7, 7])
+        typed.copy_from([9, 8], 0, 0)
+        self.assertEqual(list(typed.memoryview(0, 3)), [9, 8, 1])
+        self.assertRaises(TypeError, typed.__setitem__, 0, 'x')
+
+    def test_copy_between_typecodes(self):
+        doubles = ArrayT(4)
+        doubles.copy_from(ArrayT.from_iterable(range(3), 'q'), 0, 1)
+        self.assertEqual(list(doubles), [0.0, 0.0, 1.0, 2.0])
+        integers = ArrayT(2, 'b')
+        integers.copy_from(ArrayT.from_iterable([5, -7], 'q'))
+        self.assertEqual(list(integers), [5, -7])
+        self.assertRaises(OverflowError, integers.copy_from, ArrayT.from_iterable([1000], 'q'))
+        self.assertRaises(TypeError, integers.copy_from, doubles, 0, 0, 2)
+
+    def test_stack(self):
+        stack = TypedArrayStack(self.CAPACITY)
+        for hp in (45.0, 39.5, 44.25):
+            stack.push(hp)
+        self.assertEqual(list(stack.memoryview()), [45.0, 39.5, 44.25])
+        self.assertEqual(stack.pop(), 44.25)
+        self.assertEqual(stack.peek(), 39.5)
+
+        growable = TypedArrayStack(1, 'q', growable=True)
+        growable.push_many(range(10))
+        self.assertIsInstance(growable.array, ArrayT)
+        self.assertEqual(list(growable.pop_many(3).memoryview()), [7, 8, 9])
+
+    def test_queue(self):
+        queue = TypedCircularQueue(4, 'q')
+        queue.extend([1, 2, 3])
+        queue.serve()
+        queue.extend([4, 5])
+        self.assertTrue(queue.is_full())
+        drained = queue.drain()
+        self.assertIsInstance(drained, ArrayT)
+        self.assertEqual(list(drained), [2, 3, 4, 5])
+
+
+if __name__ == '__main__':
+    testtorun = TestTypedArrays()
+    suite = unittest.TestLoader().loadTestsFromModule(testtorun)
+    unittest.TextTestRunner().run(suite)
@@ -0,0 +1,223 @@
+""" Unrolled (block-linked) implementation of the List ADT.
+
+Items are kept in a linked chain of blocks, each an ArrayR holding up to
+block_size items. Reaching a position walks the chain one block at a time
+and insert and delete_at_index only move items inside one block, so each
+operation costs O(N / block_size + block_size). The block size is kept near
+sqrt(N) by re-packing all items whenever the length has doubled or halved
+since the last re-pack, which keeps every operation O(sqrt(N)) and adds
+O(1) amortised work.
+"""
+__docformat__ = 'reStructuredText'
+
+from math import isqrt
+from data_structures.abstract_list import List, T
+from data_structures.referential_array import ArrayR
+
+
+class Block:
+    """ A node of an UnrolledList: an array of items and a link to the next block.
+
+    Attributes:
+         items (ArrayR[T]): the items of the block, positions count and above are unused
+         count (int): number of items in the block
+         next (Block): the following block, or None for the last one
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.items = ArrayR(capacity)
+        self.count = 0
+        self.next = None
+
+    def is_full(self) -> bool:
+        """ True if the block has no room left. """
+        return self.count >= len(self.items)
+
+
+class UnrolledList(List[T]):
+    """ List ADT implemented with a linked chain of array blocks.
+
+    Attributes:
+         length (int): number of items in the list (inherited)
+         head (Block): the first block, or None if the list is empty
+         block_size (int): capacity of new blocks, around sqrt(length)
+    """
+    MIN_BLOCK_SIZE = 8
+
+    def __init__(self) -> None:
+        """ UnrolledList object initialiser. """
+        List.__init__(self)
+        self.head = None
+        self.block_size = self.MIN_BLOCK_SIZE
+        self.packed_length = 0 # length at the last re-pack
+
+    def __getitem__(self, index: int) -> T:
+        """ Magic method. Return the element at a given position.
+        :complexity: O(sqrt(N)) to walk to the block
+        :raises IndexError: if there is no such position
+        """
+        block, offset = self._locate(self._position(index))
+        return block.items[offset]
+
+    def __setitem__(self, index: int, item: T) -> None:
+        """ Magic method. Replace the element at a given position.
+        :complexity: O(sqrt(N)) to walk to the block
+        :raises IndexError: if there is no such position
+        """
+        block, offset = self._locate(self._position(index))
+        block.items[offset] = item
+
+    def __iter__(self):
+        """ Iterate over the items in order.
+        :complexity: O(1) per item
+        """
+        block = self.head
+        while block is not None:
+            for i in range(block.count):
+                yield block.items[i]
+            block = block.next
+
+    def insert(self, index: int, item: T) -> None:
+        """ Insert an item at a given position. Indices past the end append the item.
+        :complexity: O(sqrt(N)) amortised: walking to the block, then a block move inside it
+        """
+        index = max(0, min(index + len(self) if index < 0 else index, len(self)))
+        if self.head is None:
+            self.head = Block(self.block_size)
+
+        # the item goes before the one now at index, so at a block boundary it starts the next block.
+        # index == len(self) has no such item: the item is appended past the end of the last block.
+        block, offset = self._locate(index) if index < len(self) else self._last_block()
+        if block.is_full():
+            self._split(block)
+            if offset > block.count:
+                offset -= block.count
+                block = block.next
+
+        block.items.copy_from(block.items, offset, offset + 1, block.count - offset)
+        block.items[offset] = item
+        block.count += 1
+        self.length += 1
+        self._repack_if_needed()
+
+    def delete_at_index(self, index: int) -> T:
+        """ Delete the item at a given position.
+        :complexity: O(sqrt(N)) amortised: walking to the block, then a block move inside it
+        :raises IndexError: if there is no such position
+        """
+        previous, block, offset = self._locate_with_previous(self._position(index))
+        item = block.items[offset]
+        block.count -= 1
+        block.items.copy_from(block.items, offset + 1, offset, block.count - offset)
+        block.items[block.count] = None
+        self.length -= 1
+
+        if block.count == 0:
+            # unlink the empty block
+            if previous is None:
+                self.head = block.next
+            else:
+                previous.next = block.next
+        elif block.next is not None and block.count + block.next.count <= len(block.items) // 2:
+            # merge sparse neighbours so the number of blocks stays O(sqrt(N))
+            self._merge_next(block)
+        self._repack_if_needed()
+        return item
+
+    def index(self, item: T) -> int:
+        """ Find the position of a given item in the list.
+        :complexity: O(N)
+        :raises ValueError: if the item is not in the list
+        """
+        for i, list_item in enumerate(self):
+            if list_item == item:
+                return i
+        raise ValueError('Item not in list')
+
+    def clear(self) -> None:
+        """ Clear the list. """
+        UnrolledList.__init__(self)
+
+    def block_count(self) -> int:
+        """ Return the number of blocks in the chain. """
+        count = 0
+        block = self.head
+        while block is not None:
+            count += 1
+            block = block.next
+        return count
+
+    def _position(self, index: int) -> int:
+        """ Return the non-negative position of index.
+        :raises IndexError: if there is no such position
+        """
+        if not -len(self) <= index < len(self):
+            raise IndexError('Index out of range')
+        return index % len(self)
+
+    def _locate(self, position: int) -> tuple:
+        """ Return the block holding position and the offset of position in it. """
+        return self._locate_with_previous(position)[1:]
+
+    def _locate_with_previous(self, position: int) -> tuple:
+        """ Return the block before the one holding position (or None), that block and the offset in it. """
+        previous = None
+        block = self.head
+        while position >= block.count:
+            position -= block.count
+            previous = block
+            block = block.next
+        return previous, block, position
+
+    def _last_block(self) -> tuple:
+        """ Return the last block and the offset just past its last item. """
+        block = self.head
+        while block.next is not None:
+            block = block.next
+        return block, block.count
+
+    def _split(self, block: Block) -> None:
+        """ Move the second half of a full block to a new block linked right after it. """
+        new_block = Block(max(self.block_size, len(block.items)))
+        moved = block.count // 2
+        new_block.items.copy_from(block.items, block.count - moved, 0, moved)
+        block.items.fill(None, block.count - moved, block.count)
+        new_block.count = moved
+        block.count -= moved
+        new_block.next = block.next
+        block.next = new_block
+
+    def _merge_next(self, block: Block) -> None:
+        """ Move all items of the next block to the end of block and unlink the next block. """
+        following = block.next
+        block.items.copy_from(following.items, 0, block.count, following.count)
+        block.count += following.count
+        block.next = following.next
+
+    def _repack_if_needed(self) -> None:
+        """ Re-pack all items into blocks of about sqrt(N) once the length has doubled or halved since the last re-pack. """
+        if len(self) >= 2 * max(self.packed_length, self.MIN_BLOCK_SIZE ** 2) or \
+                (len(self) <= self.packed_length // 2 and self.block_size > self.MIN_BLOCK_SIZE):
+            self._repack()
+
+    def _repack(self) -> None:
+        """ Rebuild the chain with blocks of capacity 2 * sqrt(N), each filled to half capacity so
+        inserts do not split straight away.
+        :complexity: O(N)
+        """
+        self.block_size = max(self.MIN_BLOCK_SIZE, 2 * isqrt(len(self)))
+        fill = self.block_size // 2
+        items = ArrayR.from_iterable(self) if len(self) > 0 else None
+
+        self.head = None
+        tail = None
+        for start in range(0, len(self), fill):
+            block = Block(self.block_size)
+            block.count = min(fill, len(self) - start)
+            block.items.copy_from(items, start, 0, block.count)
+            if tail is None:
+                self.head = block
+            else:
+                tail.next = block
+            tail = block
+        self.packed_length = len(self)
@@ -1,4 +1,8 @@
 import abc
+import os
+import time
+import tracemalloc
+from functools import wraps
 
 
 class InvalidValueException(Exception):
@@ -24,6 +28,14 @@ class Decorator(abc.ABC):
     def get_attr_name(cls):
         return f"__{cls.__name__}__"
 
+    @classmethod
+    def get_saved_value(cls, test):
+        """
+        Returns the value passed to change_result for a test case that has run:
+        the value saved on its test method, or None if you did not apply the decorator.
+        """
+        return getattr(getattr(test, test._testMethodName), cls.get_attr_name(), None)
+
     @classmethod
     @abc.abstractmethod
     def change_result(cls, saved_value, results:dict, output:str, err):
@@ -132,3 +144,79 @@ class advanced(Decorator):
         """
         if saved_value is not None:
             results["name"] = "[ADV] {}".format(results["name"])
+
+
+class budget(Decorator):
+    """
+    Fails the test if it runs longer than `seconds` of wall time, or if the
+    memory it allocates peaks above `peak_kb` kilobytes (traced with tracemalloc).
+    Either limit may be left out. Tracing slows the test down, so when both are
+    given the time measured includes that overhead. All limits are multiplied by
+    the BUDGET_SCALE environment variable (default 1), for slower machines.
+
+    Usage: @budget(seconds=2, peak_kb=512)
+    """
+    SCALE = float(os.environ.get("BUDGET_SCALE", 1))
+    MEASURED_ATTR = "_budget_measured" # set on the test case to what its run measured
+
+    def __init__(self, seconds=None, peak_kb=None) -> None:
+        for name, limit in (("seconds", seconds), ("peak_kb", peak_kb)):
+            if limit is not None and (not isinstance(limit, (float, int)) or limit <= 0):
+                raise InvalidValueException(f"Budget {name} should be a positive float/int.")
+        if seconds is None and peak_kb is None:
+            raise InvalidValueException("Budget needs seconds and/or peak_kb.")
+        self.v = {"seconds": seconds, "peak_kb": peak_kb}
+
+    def __call__(self, func):
+        limits = self.v
+
+        @wraps(func)
+        def test(case, *args, **kwargs):
+            tracing = limits["peak_kb"] is not None
+            started_tracing = tracing and not tracemalloc.is_tracing()
+            if started_tracing:
+                tracemalloc.start()
+            if tracing:
+                before = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+            start = time.perf_counter()
+            try:
+                result = func(case, *args, **kwargs)
+            finally:
+                measured = {"seconds": time.perf_counter() - start}
+                if tracing:
+                    measured["peak_kb"] = (tracemalloc.get_traced_memory()[1] - before) / 1024
+                if started_tracing:
+                    tracemalloc.stop()
+                setattr(case, budget.MEASURED_ATTR, measured)
+
+            exceeded = [
+                f"{name} {value:.3f} > {limits[name] * budget.SCALE:.3f}"
+                for name, value in measured.items()
+                if limits[name] is not None and value > limits[name] * budget.SCALE
+            ]
+            if exceeded:
+                raise AssertionError("Over budget: " + ", ".join(exceeded))
+            return result
+
+        setattr(test, self.get_attr_name(), self.v)
+        return test
+
+    @classmethod
+    def get_saved_value(cls, test):
+        limits = super().get_saved_value(test)
+        if limits is None:
+            return None
+        return dict(limits, measured=getattr(test, cls.MEASURED_ATTR, None))
+
+    @classmethod
+    def change_result(cls, saved_value, results:dict, output:str, err):
+        """
+        Handles the `budget` field for results: the limits and what the test's run measured.
+        """
+        if saved_value is not None:
+            results["budget"] = {
+                "seconds": saved_value["seconds"] and saved_value["seconds"] * cls.SCALE,
+                "peak_kb": saved_value["peak_kb"] and saved_value["peak_kb"] * cls.SCALE,
+                "measured": saved_value.get("measured"),
+            }
@@ -4,8 +4,11 @@ from __future__ import print_function
 import sys
 import json
 import inspect
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
 
-from unittest import result
+from unittest import result, suite
 from unittest.signals import registerResult
 import ed_utils.decorators as decorators
 
@@ -53,9 +56,7 @@ class JSONTestResult(result.TestResult):
             "ok": True,
         }
         for dec in DECORATOR_CLASSES:
-            method = getattr(test, test._testMethodName)
-            val = getattr(method, dec.get_attr_name(), None)
-            dec.change_result(val, result, output, err)
+            dec.change_result(dec.get_saved_value(test), result, output, err)
         return result
 
     def processResult(self, test, err=None):
@@ -77,6 +78,30 @@ class JSONTestResult(result.TestResult):
         self.processResult(test, err)
 
 
+class JSONLinesTestResult(JSONTestResult):
+    """A JSONTestResult that writes each result to the stream as one line of
+    JSON as soon as its test finishes, with the test's wall time in seconds
+    ("duration", including setUp and tearDown) and the length of its captured
+    output ("output_size"). Results are not kept once written.
+
+    Used by JSONLinesTestRunner.
+    """
+    def __init__(self, stream, descriptions, verbosity, results):
+        super(JSONLinesTestResult, self).__init__(stream, descriptions, verbosity, results)
+        self.stream = stream
+
+    def startTest(self, test):
+        self._started_at = time.perf_counter()
+        super(JSONLinesTestResult, self).startTest(test)
+
+    def processResult(self, test, err=None):
+        result = self.buildResult(test, err)
+        result["duration"] = time.perf_counter() - self._started_at
+        result["output_size"] = len(self.getOutput() or "")
+        self.stream.write(json.dumps(result) + '\n')
+        self.stream.flush()
+
+
 class JSONTestRunner(object):
     """A test runner class that displays results in JSON form.
     """
@@ -105,6 +130,12 @@ class JSONTestRunner(object):
 
     def run(self, test):
         "Run the given test case or test suite."
+        result = self._runTests(test)
+        json.dump(self.json_data, self.stream, indent=4)
+        self.stream.write('\n')
+        return result
+
+    def _runTests(self, test):
         result = self._makeResult()
         registerResult(result)
         result.failfast = self.failfast
@@ -118,7 +149,130 @@ class JSONTestRunner(object):
             stopTestRun = getattr(result, 'stopTestRun', None)
             if stopTestRun is not None:
                 stopTestRun()
+        return result
+
+
+class JSONLinesTestRunner(JSONTestRunner):
+    """A test runner that streams results as JSON lines, one per test as it
+    finishes, instead of a single JSON document at the end.
+    """
+    resultclass = JSONLinesTestResult
+
+    def _makeResult(self):
+        return self.resultclass(self.stream, self.descriptions, self.verbosity, None)
+
+    def run(self, test):
+        "Run the given test case or test suite."
+        return self._runTests(test)
+
+
+_PARALLEL_TESTS = [] # the tests being sharded, inherited by the forked workers
+
+
+def _flatten(test):
+    """Yields the individual test cases of a (nested) test suite, in run order."""
+    if isinstance(test, suite.TestSuite):
+        for t in test:
+            yield from _flatten(t)
+    else:
+        yield test
+
+
+def _shard(tests, jobs):
+    """Splits the indices of tests into at most jobs shards.
+
+    Tests of the same class stay together so setUpClass runs once per class,
+    and each class goes to the shard with the fewest tests so far.
+    """
+    by_class = {}
+    for i, test in enumerate(tests):
+        by_class.setdefault(type(test), []).append(i)
+    shards = [[] for _ in range(min(jobs, len(by_class)))]
+    for indices in sorted(by_class.values(), key=len, reverse=True):
+        min(shards, key=len).extend(indices)
+    return [sorted(shard) for shard in shards]
+
+
+class _ShardTestResult(JSONTestResult):
+    """A JSONTestResult that tags every result with the index of its test."""
+    def __init__(self, stream, descriptions, verbosity, results, indices):
+        super(_ShardTestResult, self).__init__(stream, descriptions, verbosity, results)
+        self.indices = {id(_PARALLEL_TESTS[i]): i for i in indices}
+        self.first = indices[0]
+
+    def index_of(self, test):
+        # errors outside a test, e.g. in setUpClass, go with the shard's first test
+        return self.indices.get(id(test), self.first)
+
+    def processResult(self, test, err=None):
+        self.results.append((self.index_of(test), self.buildResult(test, err)))
+
+
+def _run_shard(indices, descriptions, verbosity, failfast, buffer):
+    """Runs _PARALLEL_TESTS[i] for i in indices in a worker process.
+
+    Returns (index, result) pairs, plus (index, traceback) pairs for the
+    errors and failures, since test cases themselves are not sent back.
+    """
+    shard_result = _ShardTestResult(None, descriptions, verbosity, [], indices)
+    shard_result.failfast = failfast
+    shard_result.buffer = buffer
+    shard_result.startTestRun()
+    try:
+        suite.TestSuite(_PARALLEL_TESTS[i] for i in indices)(shard_result)
+    finally:
+        shard_result.stopTestRun()
+    return (
+        shard_result.results,
+        [(shard_result.index_of(test), trace) for test, trace in shard_result.errors],
+        [(shard_result.index_of(test), trace) for test, trace in shard_result.failures],
+        shard_result.testsRun,
+    )
+
+
+class ParallelJSONTestRunner(JSONTestRunner):
+    """A JSONTestRunner that shards the test cases across jobs worker processes.
+
+    The results are merged back into the order the tests would have run in
+    serially, so the JSON is the same as JSONTestRunner's. Needs fork, as the
+    workers run the tests they inherited; elsewhere, or with a single job,
+    the tests run serially.
+    """
+    def __init__(self, jobs=2, **kwargs):
+        super(ParallelJSONTestRunner, self).__init__(**kwargs)
+        self.jobs = jobs
+
+    def run(self, test):
+        "Run the given test case or test suite."
+        if self.jobs <= 1 or "fork" not in multiprocessing.get_all_start_methods():
+            return super(ParallelJSONTestRunner, self).run(test)
+
+        global _PARALLEL_TESTS
+        _PARALLEL_TESTS = list(_flatten(test))
+        shards = _shard(_PARALLEL_TESTS, self.jobs)
+        merged, errors, failures = [], [], []
+        run_result = self._makeResult()
+        try:
+            with ProcessPoolExecutor(max_workers=max(len(shards), 1),
+                                     mp_context=multiprocessing.get_context("fork")) as pool:
+                futures = [
+                    pool.submit(_run_shard, shard, self.descriptions, self.verbosity, self.failfast, self.buffer)
+                    for shard in shards
+                ]
+                for future in futures:
+                    shard_results, shard_errors, shard_failures, tests_run = future.result()
+                    merged.extend(shard_results)
+                    errors.extend(shard_errors)
+                    failures.extend(shard_failures)
+                    run_result.testsRun += tests_run
+        finally:
+            tests, _PARALLEL_TESTS = _PARALLEL_TESTS, []
+
+        # sorted() is stable, so results sharing an index keep their order
+        self.json_data["testcases"].extend(r for _, r in sorted(merged, key=lambda pair: pair[0]))
+        run_result.errors = [(tests[i], trace) for i, trace in sorted(errors, key=lambda pair: pair[0])]
+        run_result.failures = [(tests[i], trace) for i, trace in sorted(failures, key=lambda pair: pair[0])]
 
         json.dump(self.json_data, self.stream, indent=4)
         self.stream.write('\n')
-        return result
+        return run_result
@@ -1,7 +1,17 @@
+import io
+import multiprocessing
+import os
+import sys
+import traceback
 from functools import wraps
 from threading import Thread
 from queue import Queue
 
+try:
+    import resource
+except ImportError: # not available on Windows
+    resource = None
+
 
 def do_stuff(q1, a, k, method):
     try:
@@ -10,6 +20,79 @@ def do_stuff(q1, a, k, method):
         q1.put(e)
 
 
+def run_in_process(conn, a, k, method, cpu_seconds, memory_mb):
+    """
+    Body of the forked test process: applies the resource limits, runs the
+    test with stdout captured, and sends back ("ok", result, output) or
+    ("error", exception, output). Never returns.
+    """
+    output = io.StringIO()
+    sys.stdout = output
+    try:
+        if resource is not None and cpu_seconds is not None:
+            resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds + 1))
+        if resource is not None and memory_mb is not None:
+            limit = memory_mb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        message = ("ok", method(*a, **k))
+    except BaseException as e:
+        e.remote_traceback = traceback.format_exc()
+        message = ("error", e)
+    try:
+        try:
+            conn.send(message + (output.getvalue(),))
+        except Exception:
+            # the result or exception could not be pickled, send what it looked like instead
+            kind, value = message
+            conn.send((kind, value if kind == "ok" and value is None else RuntimeError(repr(value)), output.getvalue()))
+    finally:
+        os._exit(0)
+
+
+def process_timeout(sec=3, cpu_seconds=None, memory_mb=None):
+    """
+    Like timeout, but runs the test in a forked process that is terminated
+    when the time runs out, so a stuck test stops using CPU. cpu_seconds and
+    memory_mb set RLIMIT_CPU and RLIMIT_AS in that process. The test's
+    output is printed again in this process; anything else it changes stays
+    in the child. Falls back to the thread timeout where fork is unavailable.
+    """
+    def timeout_dec(func):
+        if "fork" not in multiprocessing.get_all_start_methods():
+            return timeout(sec)(func)
+
+        @wraps(func)
+        def test(*args, **kwargs):
+            context = multiprocessing.get_context("fork")
+            receiver, sender = context.Pipe(duplex=False)
+            p = context.Process(target=run_in_process, args=[sender, args, kwargs, func, cpu_seconds, memory_mb], daemon=True)
+            p.start()
+            sender.close()
+            try:
+                if not receiver.poll(sec):
+                    p.terminate()
+                    p.join(1)
+                    if p.is_alive():
+                        p.kill()
+                    raise TimeoutError(f"Timed out after {sec} seconds")
+                try:
+                    kind, value, output = receiver.recv()
+                except EOFError:
+                    # the process died without answering, e.g. killed for going over its CPU limit
+                    p.join()
+                    raise RuntimeError(f"Test process exited with code {p.exitcode}")
+            finally:
+                receiver.close()
+                p.join(1)
+
+            print(output, end="")
+            if kind == "error":
+                raise value
+            return value
+        return test
+    return timeout_dec
+
+
 def timeout(sec=3):
     def timeout_dec(func):
         @wraps(func)
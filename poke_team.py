@@ -1,9 +1,11 @@
 
 from pokemon import *
 import random
+from typing import Callable, Optional, Union
 from battle_mode import BattleMode
 from data_structures.array_sorted_list import ArraySortedList
-from data_structures.sorted_list_adt import ListItem
+from data_structures.sorted_list_adt import ListItem, SortedList
+from data_structures.array_min_heap import ArrayMinHeap
 from data_structures.stack_adt import ArrayStack
 from data_structures.queue_adt import CircularQueue
 from data_structures.bset import BSet
@@ -12,6 +14,10 @@ class PokeTeam:
     TEAM_LIMIT: int = 6 # team limit
     POKE_LIST: ArrayR = get_all_pokemon_types() # list of all Pokemon types
     CRITERION_LIST: list[str] = ["health", "defence", "battle_power", "speed", "level"] # criterion list
+    CRITERION_GETTERS: dict = {"health": Pokemon.get_health, "defence": Pokemon.get_defence, "battle_power": Pokemon.get_battle_power,
+                               "speed": Pokemon.get_speed, "level": Pokemon.get_level} # getter for each criterion
+    COMPILED_CRITERIA: dict = {} # cache of key functions built by compile_criterion()
+    CONTAINERS: dict = {BattleMode.SET: ArrayStack, BattleMode.ROTATE: CircularQueue, BattleMode.OPTIMISE: ArraySortedList} # default ADT for each battle mode
 
     def __init__(self):
         """
@@ -22,6 +28,7 @@ class PokeTeam:
         self.selected_pokemons: ArrayR = ArrayR(PokeTeam.TEAM_LIMIT) # the pokemons chosen for the trainer.
         self.health_records: ArrayR = ArrayR(PokeTeam.TEAM_LIMIT) # the pokemons' health records.
         self.list_reversed: bool = False # restricts the entry of data in a particular order.
+        self.criterion_key: Callable = None # key function of the criterion the OPTIMISE team is ordered by.
      
     def __getitem__(self, index: int) -> Pokemon:
         """
@@ -33,17 +40,17 @@ class PokeTeam:
         __returns__:
                      Pokemon: The Pokemon stored in position index.
         
-        __complexity__: BEST CASE: O(1), due to the self.team being a normal arrayR or an arraysortedlist. We can get access directly to the
+        __complexity__: BEST CASE: O(1), due to the self.team being a normal arrayR, an arraysortedlist or a queue. We can get access directly to the
                         elements with their indexes.
                         
-                        WORST CASE: O(N), due to the self.team being a stack or queue. We need to pop/serve out all N elements, and then directly 
+                        WORST CASE: O(N), due to the self.team being a stack. We need to pop out all N elements, and then directly 
                         access them with the functions' return value.
         
         __annotations__: Complexities are denoted by O(best case) | O(worst case)
         """
         
         # if self.team is neither of the ADT, it is a normal array.
-        if not isinstance(self.team, (ArrayStack, CircularQueue, ArraySortedList)): # O(isinstance): The complexity of the isinstance() method.
+        if not isinstance(self.team, (ArrayStack, CircularQueue, SortedList)): # O(isinstance): The complexity of the isinstance() method.
             return self.selected_pokemons[index] 
         
         # if self.team is an arraystack
@@ -52,10 +59,10 @@ class PokeTeam:
         
         # if self.team is an circularqueue
         elif isinstance(self.team, CircularQueue): # O(isinstance): The complexity of the isinstance() method.
-            return self._retrieve_queue_elements()[index] # Best = O(1), Worst = O(n)
+            return self.team.peek_at(index) # O(1)
         
-        # otherwise, it must be arraysortedlist
-        return self.team[index].value
+        # otherwise, it must be a sorted list (arraysortedlist or arrayminheap)
+        return self.team.value_at(index)
 
     def __len__(self) -> int:
         """
@@ -66,7 +73,7 @@ class PokeTeam:
         """
         
         # if the self.team is a normal array
-        if not isinstance(self.team, (ArrayStack, ArraySortedList, CircularQueue)):
+        if not isinstance(self.team, (ArrayStack, SortedList, CircularQueue)):
             return self.team_count
         
         # if it is an ADT
@@ -96,7 +103,7 @@ class PokeTeam:
         final_string: str = ""
         
         # Determining the Data Structure used for self.team
-        if isinstance(self.team, (ArrayStack, ArraySortedList, CircularQueue)): # O(isinstance): The complexity of the isinstance() method.
+        if isinstance(self.team, (ArrayStack, SortedList, CircularQueue)): # O(isinstance): The complexity of the isinstance() method.
         
             # If the self.team is an ArrayStack,
             if isinstance(self.team, ArrayStack): # O(isinstance): The complexity of the isinstance() method.
@@ -106,8 +113,8 @@ class PokeTeam:
             elif isinstance(self.team, CircularQueue): # O(isinstance): The complexity of the isinstance() method.
                 temp_array = self._retrieve_queue_elements() # Best = O(1), Worst = O(n)
             
-            # If the self.team is an ArraySortedList,
-            elif isinstance(self.team, ArraySortedList): # O(isinstance): The complexity of the isinstance() method.
+            # If the self.team is a SortedList (ArraySortedList or ArrayMinHeap),
+            elif isinstance(self.team, SortedList): # O(isinstance): The complexity of the isinstance() method.
                 temp_array = self.team
             
             length = len(self.team)
@@ -122,7 +129,7 @@ class PokeTeam:
         for index in range(length): # Best = O(1), Worst = O(n)
             
             # O(concatenation): Computation time to concatenate strings.
-            final_string += f"{index + 1}. {temp_array[index]}\n" if not isinstance(self.team, ArraySortedList) else f"{index + 1}. {temp_array[index].value}\n"
+            final_string += f"{index + 1}. {temp_array[index]}\n" if not isinstance(self.team, SortedList) else f"{index + 1}. {temp_array.value_at(index)}\n"
         
         # Returning string.
         return final_string  
@@ -162,11 +169,17 @@ class PokeTeam:
                 # try-catch to get the correct number
                 try:
                     
-                    input_num: int = int(input('Please enter your choice [1-77]')) 
-                    assert 1 <= input_num <= len(PokeTeam.POKE_LIST)
+                    choice: str = input('Please enter your choice [1-77]').strip()
+                    
+                    # a Pokemon can be chosen by name (O(1) hash table lookup) or by its number in the list.
+                    species: type = get_pokemon_by_name(choice)
+                    if species is None:
+                        input_num: int = int(choice)
+                        assert 1 <= input_num <= len(PokeTeam.POKE_LIST)
+                        species = self.POKE_LIST[input_num - 1]
                     
                     # if it successfully passes the checks, add it to selected_pokemons.
-                    self.selected_pokemons[self.team_count] = self.POKE_LIST[input_num - 1]()
+                    self.selected_pokemons[self.team_count] = species()
                     self.health_records[self.team_count] = self.selected_pokemons[self.team_count].get_health()
                     self.team_count += 1
                                    
@@ -175,7 +188,7 @@ class PokeTeam:
                     
                 # if the input data type is incorrect
                 except ValueError:
-                    print('Please enter a number between 1-77 only.')
+                    print('Please enter a number between 1-77 or a Pokemon name only.')
                 
                 # if the input range is incorrect
                 except AssertionError:
@@ -219,13 +232,38 @@ class PokeTeam:
             self.health_records[i] = self.selected_pokemons[i].get_health()
             self.team_count += 1
 
-    def regenerate_team(self, battle_mode: BattleMode, criterion: str = None) -> None:
+    def choose_species(self, *species: type) -> None:
+        """
+        __description__: Chooses one new Pokemon of each given species, in order, e.g. a one-Pokemon team for
+                         species-against-species battles.
+
+        __params__:
+                    species (type): The Pokemon classes to choose, at least one and at most TEAM_LIMIT.
+
+        __raises__:
+                    ValueError: If no species or more than TEAM_LIMIT species are given.
+
+        __complexity__: BEST CASE: O(1), for a single species.
+                        WORST CASE: O(N), for N species.
+        """
+        if not 0 < len(species) <= self.TEAM_LIMIT:
+            raise ValueError(f"Choose between 1 and {self.TEAM_LIMIT} species")
+
+        PokeTeam.__init__(self)
+
+        for pokemon_class in species: # O(1): a single species | O(N): N species.
+            self.selected_pokemons[self.team_count] = pokemon_class()
+            self.health_records[self.team_count] = self.selected_pokemons[self.team_count].get_health()
+            self.team_count += 1
+
+    def regenerate_team(self, battle_mode: BattleMode, criterion: str = None, container: type = None) -> None:
         """
         __description__: Regenerates health of all the pokemons the trainer chose.
 
         __params__:
                     battle_mode (BattleMode): The current battle mode that the trainers are fighting.
                     criterion (str, optional): An optional parameter used to order the pokemons inside an arraysortedlist.
+                    container (type, optional): The ADT to assemble the team into, see assemble_team().
         
         __complexity__: BEST CASE: O(1), if the number of pokemons are limited, and requires assembly of one pokemon to a team only.
                         WORST CASE: O(N) if the number of pokemons are N. Additional overhead may arrive from the computations of assemble_team().
@@ -236,14 +274,14 @@ class PokeTeam:
             pokemon.health = self.health_records[index]
         
         # assembling the team
-        self.assemble_team(battle_mode, criterion) # O(1): If the team assembled consists of one pokemon only. | O(N) for SET and ROTATE and O(N^2) for OPTIMISE.
+        self.assemble_team(battle_mode, criterion, container) # O(1): If the team assembled consists of one pokemon only. | O(N) for SET and ROTATE and O(N^2) for OPTIMISE.
 
-    def assign_team(self, criterion: str = None) -> None:
+    def assign_team(self, criterion: Optional[Union[str, tuple]] = None) -> None:
         """
         __description__: Assembles the team for ArraySortedList teams based on a given criterion.
 
         __params__:
-                    criterion (str, optional): The criterion used to order the elements in the team.
+                    criterion (str | tuple, optional): The criterion used to order the elements in the team, see compile_criterion().
         
         __complexity__: ADDING TO FRONT:
                             - BEST CASE: O(1) if the team has 0 elements, and only requires only one element to be added to the list.
@@ -263,24 +301,44 @@ class PokeTeam:
         __annotations__: Complexities are denoted by O(best case) | O(worst case).
         """
             
-        # iterate through the whole selected pokemons array.
-        for pokemon in self.selected_pokemons: # O(1): If the selected pokemons array contain no elements or 1 element | O(N): the selected pokemons array contains N pokemons.
+        # the criterion is compiled once, not re-dispatched for every pokemon.
+        self.criterion_key = PokeTeam.compile_criterion(criterion)
+        
+        # iterate through the selected pokemons.
+        for index in range(self.team_count): # O(1): If the selected pokemons array contain no elements or 1 element | O(N): the selected pokemons array contains N pokemons.
             
             # finds the key and adds the pokemon to the team.
-            key = self._get_criterion_key(pokemon, criterion)
-            
-            if self.list_reversed: 
-                self.team.add(ListItem(value=pokemon, key= 1 / key)) # O(1): adding the pokemon to an empty list | # O(N): adding pokemon to far left, and shuffling rest of the elements to the right.
-            else:
-                self.team.add(ListItem(value=pokemon, key= key)) # O(1): adding the pokemon to an empty list | # O(N): adding pokemon to far right, and shuffling rest of the elements to the left.
+            pokemon: Pokemon = self.selected_pokemons[index]
+            self.team.add_pair(pokemon, self.get_team_key(pokemon)) # O(1): adding the pokemon to an empty list | # O(N): adding pokemon to far left, and shuffling rest of the elements to the right.
+    
+    def get_team_key(self, pokemon: Pokemon) -> object:
+        """
+        __description__: Returns the key a pokemon is stored under in the OPTIMISE team, taking the current
+                         sorting order into account. Used whenever a pokemon is added back to the team.
+
+        __params__:
+                    pokemon (Pokemon): The pokemon to compute the key of.
+
+        __returns__:
+                    object: The key, a number for single criteria or a tuple for composite ones.
+        
+        __complexity__: BEST CASE: O(1), for a single criterion.
+                        WORST CASE: O(K), for a composite criterion of K names.
+        """
+        key_function: Callable = self.criterion_key or PokeTeam.compile_criterion(None)
+        key = key_function(pokemon)
+        return PokeTeam._reverse_key(key) if self.list_reversed else key
     
-    def assemble_team(self, battle_mode: BattleMode, criterion: str = None) -> None:
+    def assemble_team(self, battle_mode: BattleMode, criterion: str = None, container: type = None) -> None:
         """
         __description__: Assembles the teams for a given battle mode.
 
         __params__:
                     battle_mode (BattleMode): The current battle mode the trainer is fighting in.
-                    criterion (str, optional): The criteria used for ordering the teams in OPTIMISE.
+                    criterion (str | tuple, optional): The criteria used for ordering the teams in OPTIMISE.
+                    container (type, optional): The ADT class to hold the team, taking its capacity as the only argument.
+                                                Defaults to CONTAINERS[battle_mode]. For OPTIMISE, ArrayMinHeap makes
+                                                every round O(log N) for large teams.
         
         __complexity__: SET MODE: 
                             - BEST CASE: O(1), where the team count is 1 and there is only one pokemon in the team.
@@ -293,7 +351,7 @@ class PokeTeam:
                         OPTIMISE MODE:
                             - BEST CASE: O(1), where the team count is 1 and there is only one pokemon in the team.
                             - WORST CASE: O(N^2), where the team count is N and adding element to the left will result in N elements
-                              to shift to the right in O(N) time.
+                              to shift to the right in O(N) time. O(N log N) if the container is an ArrayMinHeap.
                         
                         OVERALL COMPLEXITY:
                             - BEST CASE: O(1) across all modes when only dealing with single Pokemon.
@@ -302,24 +360,26 @@ class PokeTeam:
         __annotations__: Complexities are denoted by O(best case) | O(worst case).
         """
         
+        # the ADT to hold the team
+        container = container or PokeTeam.CONTAINERS[battle_mode]
+        
         # if the battle mode is SET
         if battle_mode.value == 0:
-            self.team = ArrayStack(self.team_count) # O(1): Only one element to be stored | O(N): N number of pokemons to be stored.
+            self.team = container(self.team_count) # O(1): Only one element to be stored | O(N): N number of pokemons to be stored.
             
-            # the last appearing pokemon should pop out first.
-            for pokemon in self.selected_pokemons: # O(1): Only one iteration to be done | O(N): N number of iterations to be done.
-                self.team.push(pokemon)
+            # the last appearing pokemon should pop out first, all chosen pokemons are pushed as one block.
+            self.team.push_many(self.selected_pokemons, self.team_count) # O(1): Only one element to be pushed | O(N): N elements to be copied.
         
         # if the battle mode is ROTATE
         elif battle_mode.value == 1:
-            self.team = CircularQueue(self.team_count) # O(1): Only one element to be stored | O(N): N number of pokemons to be stored.
+            self.team = container(self.team_count) # O(1): Only one element to be stored | O(N): N number of pokemons to be stored.
             
             for index in range(self.team_count): # O(1): Only one iteration to be done | O(N): N number of iterations to be done.
                 self.team.append(self.selected_pokemons[index])
 
         # if the battle mode is OPTIMISE
         else:
-            self.team = ArraySortedList(self.team_count) # O(1): Only one element to be stored | O(N): N number of pokemons to be stored.
+            self.team = container(self.team_count) # O(1): Only one element to be stored | O(N): N number of pokemons to be stored.
             self.assign_team(criterion) # O(1): Only one element to be added | O(N^2): N elements added to the front of the team with N elements.
             
     def special(self, battle_mode: BattleMode) -> None:
@@ -373,109 +433,139 @@ class PokeTeam:
         # returning the final String.
         return final_string
         
-    def _get_criterion_key(cls, pokemon: Pokemon, criterion: str = None) -> float:
+    @classmethod
+    def compile_criterion(cls, criterion: Optional[Union[str, tuple]] = None) -> Callable[[Pokemon], object]:
         """
-        __description__: Finds the criterion key required to be added with the pokemon inside the
-                         arraysortedlist.
+        __description__: Compiles a criterion into a key function, once. A criterion is a name from CRITERION_LIST,
+                         optionally prefixed with "-" for descending order, or a tuple of such names for ties to be
+                         broken by the later names, e.g. ("speed", "-health"). Composite criteria produce tuple keys,
+                         which ArrayKeyedSortedList cannot store.
 
         __params__:
-                    pokemon (Pokemon): The pokemon to be added to the list.
-                    criterion (str, optional): The criterion required to order the list.
+                    criterion (str | tuple, optional): The criterion to compile. Defaults to "health".
 
         __raises__:
                     ValueError: If the incorrect criterion is given, it raises an error.
 
         __returns__:
-                    float: The value associated with the criterion key.
+                    Callable[[Pokemon], object]: A function returning the key of a pokemon.
+        
+        __complexity__: BEST CASE: O(1), the criterion is a single name compiled before and found in the cache.
+                        WORST CASE: O(K), for a composite criterion of K names, which are checked before the cache lookup.
         """
         
-        # if the criterion is based on health
-        if criterion == "health" or criterion is None:
-            return pokemon.get_health()
-            
-        # if the criterion is based on defence
-        elif criterion == "defence":
-            return pokemon.get_defence()
+        # compiled functions are cached, so sweeping criteria over many teams compiles each one once.
+        criterion = "health" if criterion is None else criterion
+        criterion = tuple(criterion) if isinstance(criterion, list) else criterion
         
-        # if the criterion is based on battle power
-        elif criterion == "battle_power":
-            return pokemon.get_battle_power()
-            
-        # if the criterion is based on speed
-        elif criterion == "speed":
-            return  pokemon.get_speed()
-            
-        # if the criterion is based on level
-        elif criterion == "level":
-            return pokemon.get_level()
-
-        # raise an error otherwise
+        # anything but a name or a tuple of names, e.g. a list inside a list, cannot be a cache key either.
+        if not isinstance(criterion, (str, tuple)) or isinstance(criterion, tuple) and \
+                not all(isinstance(name, str) for name in criterion):
+            raise ValueError('Invalid criterion')
+        if criterion in cls.COMPILED_CRITERIA:
+            return cls.COMPILED_CRITERIA[criterion]
+        
+        # a single name is its getter, or the negated getter for descending order.
+        if isinstance(criterion, str):
+            getter, sign = cls._criterion_getter(criterion)
+            key_function = getter if sign == 1 else lambda pokemon: -getter(pokemon)
+        
+        # composite criteria produce a tuple with one entry per name.
         else:
+            parts: tuple = tuple(cls._criterion_getter(name) for name in criterion) # O(K): K names in the criterion.
+            if len(parts) == 0:
+                raise ValueError('Invalid criterion')
+            key_function = lambda pokemon: tuple(sign * getter(pokemon) for getter, sign in parts)
+        
+        cls.COMPILED_CRITERIA[criterion] = key_function
+        return key_function
+    
+    @classmethod
+    def _criterion_getter(cls, name: str) -> tuple:
+        """
+        __description__: Returns the getter and the sign (1 or -1) for a single criterion name.
+
+        __raises__:
+                    ValueError: If the name, without its "-" prefix, is not in CRITERION_GETTERS.
+        """
+        if not isinstance(name, str):
+            raise ValueError('Invalid criterion')
+        
+        sign: int = -1 if name.startswith("-") else 1
+        getter: Callable = cls.CRITERION_GETTERS.get(name[1:] if sign == -1 else name)
+        if getter is None:
             raise ValueError('Invalid criterion')
+        return getter, sign
+    
+    @staticmethod
+    def _reverse_key(key: object) -> object:
+        """
+        __description__: Returns the key reversing the order of the given one: its inverse for numbers
+                         and the negation of every entry for composite keys.
+        """
+        return tuple(-entry for entry in key) if isinstance(key, tuple) else 1 / key
+    
+    def _get_criterion_key(self, pokemon: Pokemon, criterion: Optional[Union[str, tuple]] = None) -> object:
+        """
+        __description__: Finds the criterion key required to be added with the pokemon inside the
+                         arraysortedlist.
+
+        __params__:
+                    pokemon (Pokemon): The pokemon to be added to the list.
+                    criterion (str | tuple, optional): The criterion required to order the list.
+
+        __raises__:
+                    ValueError: If the incorrect criterion is given, it raises an error.
+
+        __returns__:
+                    object: The value associated with the criterion key.
+        """
+        return PokeTeam.compile_criterion(criterion)(pokemon)
     
     def _retrieve_stack_elements(self) -> ArrayR:
         """
-        __description__: Retrieves the elements within a stack, and pushes the elements back into the stack while
-                         retaining its order.
+        __description__: Retrieves the elements within a stack, top first, without popping them.
 
         __returns__:
-                     ArrayR: An array of elements popped from the stack.
+                     ArrayR: An array of the elements in the stack, in the order they would be popped.
                      
         __complexity__: BEST CASE: O(1), due to the stack being empty or containing minimal number of elements.
-                        WORST CASE: O(N), due to the stack containing N number of Pokemons to pop and push back.
+                        WORST CASE: O(N), due to the stack containing N number of Pokemons to copy.
 
         __annotations__: Complexities of each line will be denoted by O(best case) | O(worst case)
         """
         
-        # temporary array to store the Pokemon objects.
-        i: int = 0
-        temp_array: ArrayR = ArrayR(len(self.team)) if len(self.team) > 0 else None # O(1): If team has no elements, or has few elements. | O(N): if there N Pokemons in the stack.
-        
         # printing empty stack results.
-        if temp_array is None:
+        if len(self.team) == 0:
             print("The team is currently empty.")
+            return None
         
-        # tracking elements inside the stack, and storing them in a temporary array.
-        while not self.team.is_empty(): # O(1): If the team has no elements or has a few elements | O(N): If the team has N pokemons inside the stack.
-            temp_array[i] = self.team.pop()
-            i += 1
-        
-        # putting back elements into the stack in the same order.
-        for j in range(i-1,-1,-1): # O(1): If the team has no elements or has a few elements | O(N): If the team has N pokemons inside the stack.
-            self.team.push(temp_array[j]) 
-        
-        return temp_array
+        # copying elements inside the stack to a temporary array, top first, the stack itself is left untouched.
+        return ArrayR.from_iterable(self.team) # O(1): If the team has a few elements | O(N): If the team has N pokemons inside the stack.
     
     def _retrieve_queue_elements(self) -> ArrayR:
         """
-        __description__: Retrieves the elements within a queue, and appends the elements back into the queue while
-                         retaining its order.
+        __description__: Retrieves the elements within a queue, front first, without serving them.
 
         __returns__:
-                     ArrayR: An array of elements served from the queue.
+                     ArrayR: An array of the elements in the queue.
                      
         __complexity__: BEST CASE: O(1), due to the queue being empty or containing minimal number of elements.
-                        WORST CASE: O(N), due to the queue containing N number of Pokemons to serve and append back.
+                        WORST CASE: O(N), due to the queue containing N number of Pokemons to copy.
 
         __annotations__: Complexities of each line will be denoted by O(best case) | O(worst case)
         """
         
         # temporary array to store the Pokemon objects.
-        i: int = 0
         temp_array: ArrayR = ArrayR(len(self.team)) if len(self.team) > 0 else None # O(1): If team has no elements, or has few elements. | O(N): if there N Pokemons in the stack.
         
         # printing empty stack results.
         if temp_array is None:
             print("The team is currently empty.")
             
-        # tracking elements inside the queue, and storing them in a temporary array.
-        while not self.team.is_empty():
-            temp_array[i] = self.team.serve()
-            i += 1
-            
-        # putting back elements into the queue in the same order.
-        for j in range(i):
-            self.team.append(temp_array[j])
+        # copying elements inside the queue to a temporary array, the queue itself is left untouched.
+        for i in range(len(self.team)): # O(1): If the team has no elements or has a few elements | O(N): If the team has N pokemons inside the queue.
+            temp_array[i] = self.team.peek_at(i)
             
         return temp_array
 
@@ -560,7 +650,7 @@ class PokeTeam:
         
         # toggling the sorting order.
         for pokemon in temp_array: # O(1): if the size of the team was 1 | O(N): If the size of the team was N.
-            item = ListItem(value=pokemon.value, key=1/pokemon.key)
+            item = ListItem(value=pokemon.value, key=PokeTeam._reverse_key(pokemon.key))
             self.team.add(item) # O(log N): If the element was added in the back of the team. | O(N): If the element was added in the front and required shuffling of elements to the right.
         
 class Trainer:
@@ -617,6 +707,24 @@ class Trainer:
                 
             self.team_registered = True
 
+    def pick_species(self, *species: type) -> None:
+        """
+        __description__: Picks a team of one new Pokemon of each given species and registers them in the pokedex.
+
+        __params__:
+                    species (type): The Pokemon classes to pick, see PokeTeam.choose_species().
+
+        __raises__:
+                    ValueError: If no species or more than PokeTeam.TEAM_LIMIT species are given.
+
+        __complexity__: BEST CASE: O(1), for a single species.
+                        WORST CASE: O(N), for N species.
+        """
+        self.poketeam.choose_species(*species)
+        for index in range(self.poketeam.team_count): # O(1): a single species | O(N): N species.
+            self.register_pokemon(self.poketeam.selected_pokemons[index])
+        self.team_registered = True
+
     def get_team(self) -> PokeTeam:
         """
         __description__: Returns the PokeTeam of the trainer.
@@ -642,11 +750,9 @@ class Trainer:
         __params__:
                     pokemon (Pokemon): Pokemon seen in the battle or team.
         """
-        # checking if the pokemon type is already inside the bset or not.
-        if pokemon.get_poketype().value + 1 not in self.pokedex:
-            
-            # add if the type is unique.
-            self.pokedex.add(pokemon.get_poketype().value + 1) 
+        # poketype values are never negative, so the shifted value is a valid element and the checks can be skipped.
+        # adding a type that is already registered leaves the bset unchanged.
+        self.pokedex.add_unchecked(pokemon.get_poketype().value + 1)
 
     def get_pokedex_completion(self) -> float:
         """
@@ -655,14 +761,14 @@ class Trainer:
         __returns__:
                      float: The percentage of completion.
         
-        __complexity__: BEST CASE: O(1), due to the complexity being low if there are few types of pokemons to be processed.
-                        WORST CASE: O(N), due to the complexity being high if N is the number of poketypes in the battle and requires
-                        N iterations to be processed.
+        __complexity__: BEST CASE: O(N), where N is the number of poketypes. The size of the bset is a bit count of an integer
+                        with one bit per poketype, so it does not depend on how many pokemons were registered.
+                        WORST CASE: O(N), for the same reason.
         
         __annotations__: Complexities are denoted by O(best case) | O(worst case)
         """
         
-        return round( len(self.pokedex) / len(PokeType), 2 ) # O(1) if the number of types are few | O(N): If there are N number of types.
+        return round( len(self.pokedex) / len(PokeType), 2 ) # O(N): int.bit_count() on at most len(PokeType) bits.
 
     def get_trainer_team(self) -> object:
         """
@@ -1011,6 +1011,21 @@ def get_all_pokemon_types() -> ArrayR[Pokemon]:
             i += 1
     return all_pokemon
 
+POKEMON_BY_NAME: LinearProbeTable = None # lower-case species and class name -> Pokemon class
+
+def get_pokemon_by_name(name: str) -> type:
+    """
+    Returns the Pokemon class with the given species or class name, ignoring case, or None if there is none.
+    The name table is built on first use, after which each lookup is O(1).
+    """
+    global POKEMON_BY_NAME
+    if POKEMON_BY_NAME is None:
+        POKEMON_BY_NAME = LinearProbeTable(2 * len(get_all_pokemon_types()))
+        for cls in get_all_pokemon_types():
+            POKEMON_BY_NAME[cls.__name__.lower()] = cls
+            POKEMON_BY_NAME[cls().get_name().lower()] = cls
+    return POKEMON_BY_NAME.get(name.lower())
+
 
 if __name__ == '__main__':
     pass
\ No newline at end of file
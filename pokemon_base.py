@@ -1,6 +1,8 @@
+import os
 from abc import ABC
 from enum import Enum
 from data_structures.referential_array import ArrayR
+from data_structures.hash_table import LinearProbeTable
 from math import ceil
 
 class PokeType(Enum):
@@ -29,7 +31,8 @@ class TypeEffectiveness:
     """
     
     EFFECT_TABLE: ArrayR = None # 2D-array storing effectivness values.
-    FILE: str = "type_effectiveness.csv" # file to get the values.
+    FILE: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "type_effectiveness.csv") # file to get the values, next to this module.
+    TYPE_COLUMNS: LinearProbeTable = None # type name in the title row -> its column in EFFECT_TABLE.
     
     @classmethod
     def __generate_effectiveness_table(cls) -> None:
@@ -83,6 +86,9 @@ class TypeEffectiveness:
                         
                         # storing the inner array inside each element of effect table.
                         cls.EFFECT_TABLE[index1] = row_array
+
+                    # mapping each type name in the title row to its column, so lookups do not scan the row.
+                    cls.TYPE_COLUMNS = LinearProbeTable.from_pairs((name, column) for column, name in enumerate(cls.EFFECT_TABLE[0])) # O(N): N type names.
             
             # File has not been found.        
             except FileNotFoundError: 
@@ -105,20 +111,18 @@ class TypeEffectiveness:
         __returns__:
                     float: The effectiveness of the attack, as a float value between 0 and 4.
                     
-        __complexity__: BEST CASE: O(1), due to the fact that the effect table is already populated, and the target value to be found
-                        is present in the second row and first column in the 2d array.
-                        WORST CASE: O(N^2), due to the fact that the effect table is not populated, and the target value is present
-                        in the last row and the last column in the 2d array. Since the dominating term in the complexity is N^2, the
-                        overall tight upper bound of the function is O(N^2).
+        __complexity__: BEST CASE: O(1), due to the fact that the effect table is already populated, and both type names are found
+                        in the TYPE_COLUMNS hash table in constant time.
+                        WORST CASE: O(N^2), due to the fact that the effect table is not populated yet. Since the dominating term in the
+                        complexity is N^2, the overall tight upper bound of the function is O(N^2).
                         
         __annotations__: Complexities are represented by O(best case) | O(worst case)
         """
         cls.__generate_effectiveness_table() # O(1): table already populated. | O(N^2): table needs to be populated with each record.
         
         # finding the correct indexes to get the right effectiveness value.
-        title_row: ArrayR = cls.EFFECT_TABLE[0]
-        target_row: int = title_row.index(attack_type.name.title()) + 1 # O(1): If the value is in the first index | O(N) where the value is in the last index.
-        target_col: int = title_row.index(defend_type.name.title()) # O(1): If the value is in the first index | O(N) where the value is in the last index.
+        target_row: int = cls.TYPE_COLUMNS[attack_type.name.title()] + 1 # O(1): hash table lookup.
+        target_col: int = cls.TYPE_COLUMNS[defend_type.name.title()] # O(1): hash table lookup.
         
         # returning the effectiveness value.
         return float(cls.EFFECT_TABLE[target_row][target_col])
@@ -133,6 +137,8 @@ class Pokemon(ABC):
     """
     Represents a base Pokemon class with properties and methods common to all Pokemon.
     """
+    EVOLUTION_STAGES: LinearProbeTable = LinearProbeTable() # (species class, name) -> position of name in the evolution line.
+
     def __init__(self):
         """
         Initializes a new instance of the Pokemon class.
@@ -219,6 +225,15 @@ class Pokemon(ABC):
         """
         return self.evolution_line
 
+    def get_evolution_stage(self) -> int:
+        """
+        Returns the position of the Pokemon in its evolution line, 0 if it does not evolve.
+
+        Returns:
+            int: The evolution stage of the Pokemon.
+        """
+        return self._evolution_stage() if len(self.evolution_line) > 0 else 0
+
     def get_battle_power(self) -> int:
         """
         Returns the battle power of the Pokemon.
@@ -281,22 +296,36 @@ class Pokemon(ABC):
           reached the level required for evolution.
         """
         self.level += 1
-        if len(self.evolution_line) > 0 and self.evolution_line.index\
-            (self.name) != len(self.evolution_line)-1:
+        if len(self.evolution_line) > 0 and self._evolution_stage() != len(self.evolution_line)-1:
             self._evolve()
 
+    def _evolution_stage(self) -> int:
+        """
+        __description__: Returns the position of the Pokemon's name in its evolution line. Positions are cached per species
+                         in EVOLUTION_STAGES, so only the first lookup of each name scans the evolution line.
+
+        __complexity__: BEST CASE: O(1), due to the position being cached already.
+                        WORST CASE: O(N), due to the first lookup of a name scanning an evolution line of N names.
+        """
+        key: tuple = (type(self), self.name)
+        stage: int = Pokemon.EVOLUTION_STAGES.get(key)
+        if stage is None:
+            stage = self.evolution_line.index(self.name)
+            Pokemon.EVOLUTION_STAGES[key] = stage
+        return stage
+
     def _evolve(self) -> None:
         """
         __description__: Evolves the Pokemon to the next stage in its evolution line, and updates its attributes accordingly.
         
-        __complexity__: BEST CASE: O(1), due to the next evolution name being in the second index in the evolution line.
-                        WORST CASE: O(N), due to the next evolution name being in the second last index in the evolution line.
+        __complexity__: BEST CASE: O(1), due to the current stage being cached in EVOLUTION_STAGES.
+                        WORST CASE: O(N), due to the first lookup of the current name scanning an evolution line of N names.
         
         __annotations__: Complexities are represented by O(best case) | O(worst case)
         """
         
         # getting the current index of the evolution line.
-        next_index: int = self.get_evolution().index(self.get_name()) + 1 # O(1): If the name is in the second index | O(N) if the name is in the second last index
+        next_index: int = self._evolution_stage() + 1 # O(1): stage already cached | O(N): first lookup of this name
         
         # updating the attributes of the Pokemon.
         self.name = self.get_evolution()[next_index]
@@ -0,0 +1,9 @@
+"""
+Opt-in profiling of battles and the battle tower.
+
+profiling.phases times the phases of a battle (type effectiveness lookups,
+damage, container operations, levelling up, printing). Battle.profile()
+and BattleTower.profile() are shortcuts to it. profiling.capture records
+cProfile statistics per process, and profiling.memory traces the memory
+allocated by the battle loop. See ``python -m profiling --help``.
+"""
@@ -0,0 +1,70 @@
+"""
+Command line for the profiling package:
+
+    python -m profiling capture -o DIR [-m] TARGET [ARGS ...]
+    python -m profiling merge [-o FILE] [--top N] PATH [PATH ...]
+    python -m profiling memory [-n BATTLES] [--mode MODE]
+
+capture installs profiling.capture and runs a script (or a module, with -m),
+so every process it forks writes DIR/profile-<pid>.pstats. merge combines
+profiles, or the directories holding them, and prints the top functions.
+memory prints the allocations per battle region of profiling.memory.
+"""
+import argparse
+import os
+import runpy
+import sys
+
+from profiling import capture
+
+
+def main(argv: list = None) -> int:
+    p = argparse.ArgumentParser(prog="python -m profiling")
+    commands = p.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("capture", help="Run a script or module with cProfile capture on.")
+    run.add_argument("-o", "--output", help="Directory for the .pstats files.", default="profiles")
+    run.add_argument("-m", "--module", help="Run target as a module, like python -m.", action="store_true")
+    run.add_argument("target", help="The script or module to run.")
+    run.add_argument("args", help="Arguments for the target.", nargs=argparse.REMAINDER)
+
+    combine = commands.add_parser("merge", help="Combine .pstats files.")
+    combine.add_argument("paths", help=".pstats files, or directories of them.", nargs="+")
+    combine.add_argument("-o", "--output", help="Where to write the merged profile.")
+    combine.add_argument("--top", help="How many functions to print, by cumulative time.", type=int, default=20)
+    combine.add_argument("--sort", help="pstats sort key for printing.", default="cumulative")
+    memory = commands.add_parser("memory", help="Trace the memory of a run of battles.")
+    memory.add_argument("-n", "--battles", help="How many battles to run.", type=int, default=200)
+    memory.add_argument("--mode", help="The battle mode.", choices=["SET", "ROTATE", "OPTIMISE"], default="ROTATE")
+    args = p.parse_args(argv)
+
+    if args.command == "capture":
+        capture.install(args.output)
+        sys.argv = [args.target] + args.args
+        if args.module:
+            runpy.run_module(args.target, run_name="__main__", alter_sys=True)
+        else:
+            sys.path.insert(0, os.path.dirname(os.path.abspath(args.target)))
+            runpy.run_path(args.target, run_name="__main__")
+        return 0
+
+    if args.command == "memory":
+        from battle_mode import BattleMode
+        from profiling.memory import format_report, profile_battles
+        print(format_report(profile_battles(args.battles, BattleMode[args.mode])))
+        return 0
+
+    try:
+        stats = capture.merge(args.paths, args.output)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+    if args.output:
+        print(f"Merged profile written to {args.output}")
+    if args.top:
+        stats.sort_stats(args.sort).print_stats(args.top)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
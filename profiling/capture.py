@@ -0,0 +1,156 @@
+""" cProfile capture for the simulation entry points.
+
+install(DIR) wraps Battle.commence_battle and BattleTower.next_battle in
+cProfile, and profiled() does the same for any other block, such as a
+batch of battles. Each process collects into one profiler of its own, so
+the forked workers of a multi-process run each write their own file,
+DIR/profile-<pid>.pstats, when they exit. install() stores DIR in the
+CPROFILE_DIR environment variable, so processes started afterwards write
+to it too. The variable only names the output directory: setting it does
+not turn capture on. Nested entry points (a tower battle running a battle)
+are profiled once. merge() combines the files afterwards.
+
+From the command line, where capture calls install() before running the
+target:
+
+    python -m profiling capture -o profiles -- run_tests.py 3
+    python -m profiling merge -o merged.pstats profiles --top 20
+
+Importing battle.py or tower.py wraps nothing; only install() does.
+"""
+__docformat__ = 'reStructuredText'
+
+import atexit
+import cProfile
+import functools
+import glob
+import importlib
+import multiprocessing.util
+import os
+import pstats
+from contextlib import contextmanager
+from typing import Optional
+
+ENVIRONMENT_VARIABLE = 'CPROFILE_DIR' # names the output directory, install() is what turns capture on
+ENTRY_POINTS = (('battle', 'Battle', 'commence_battle'), ('tower', 'BattleTower', 'next_battle'))
+
+_profiler = None    # this process's profiler, created on first use
+_pid = None         # the process _profiler belongs to
+_depth = 0          # profiled calls currently running
+_fork_hooked = False  # whether _after_fork is registered
+
+
+def output_dir() -> Optional[str]:
+    """ Returns the directory profiles are written to, None if none was given (the current directory is used). """
+    return os.environ.get(ENVIRONMENT_VARIABLE) or None
+
+
+def output_path(pid: int = None) -> str:
+    """ Returns the file the profile of process pid (this one by default) is written to. """
+    return os.path.join(output_dir() or '.', f'profile-{pid or os.getpid()}.pstats')
+
+
+def _get_profiler() -> cProfile.Profile:
+    """ Returns this process's profiler, creating it and registering its dump at exit if needed. """
+    global _profiler, _pid, _fork_hooked
+    if not _fork_hooked:
+        os.register_at_fork(after_in_child=_after_fork)
+        _fork_hooked = True
+    if _pid != os.getpid():
+        _profiler, _pid = cProfile.Profile(), os.getpid()
+        atexit.register(dump)
+        # multiprocessing workers leave through os._exit, skipping atexit, but run these finalizers
+        multiprocessing.util.Finalize(None, dump, exitpriority=0)
+    return _profiler
+
+
+def _after_fork() -> None:
+    """ Drops the profiler inherited from the parent, the child gets its own on first use. """
+    global _profiler, _pid, _depth
+    if _profiler is not None:
+        _profiler.disable()
+    _profiler, _pid, _depth = None, None, 0
+
+
+def dump() -> Optional[str]:
+    """ Writes this process's profile, if it recorded anything, and returns its path. """
+    if _profiler is None or _pid != os.getpid():
+        return None
+    _profiler.create_stats()
+    if not _profiler.stats:
+        return None
+    os.makedirs(output_dir() or '.', exist_ok=True)
+    path = output_path()
+    _profiler.dump_stats(path)
+    return path
+
+
+@contextmanager
+def profiled():
+    """ Profiles the block into this process's profiler, unless a profiled call is already running. """
+    global _depth
+    profiler = _get_profiler()
+    _depth += 1
+    if _depth == 1:
+        profiler.enable()
+    try:
+        yield profiler
+    finally:
+        _depth -= 1
+        if _depth == 0:
+            profiler.disable()
+
+
+def captured(method):
+    """ Wraps a function so each call runs inside profiled(). """
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        with profiled():
+            return method(*args, **kwargs)
+    wrapper.__wrapped_for_capture__ = True
+    return wrapper
+
+
+def _entry_points():
+    """ Yields (class, method name, method as defined in the class) for each of ENTRY_POINTS. """
+    for module_name, class_name, method_name in ENTRY_POINTS:
+        cls = getattr(importlib.import_module(module_name), class_name)
+        yield cls, method_name, cls.__dict__[method_name]
+
+
+def install(directory: str = None) -> None:
+    """ Wraps the methods of ENTRY_POINTS with captured(), once, so their calls are profiled.
+    Profiles are written to directory if given, which is then stored in CPROFILE_DIR for
+    the processes this one starts, otherwise to CPROFILE_DIR, or the current directory.
+    """
+    if directory is not None:
+        os.environ[ENVIRONMENT_VARIABLE] = os.path.abspath(directory)
+    for cls, name, method in _entry_points():
+        if not getattr(method, '__wrapped_for_capture__', False):
+            setattr(cls, name, captured(method))
+
+
+def uninstall() -> None:
+    """ Restores the methods wrapped by install(). """
+    for cls, name, method in _entry_points():
+        if getattr(method, '__wrapped_for_capture__', False):
+            setattr(cls, name, method.__wrapped__)
+
+
+def merge(paths: list, output: str = None) -> pstats.Stats:
+    """ Combines .pstats files into one Stats, and writes it to output if given.
+    Directories in paths stand for the profile-*.pstats files inside them.
+    :raises ValueError: if there is no file to merge
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(glob.glob(os.path.join(path, 'profile-*.pstats'))))
+        else:
+            files.append(path)
+    if not files:
+        raise ValueError('No profiles to merge')
+    stats = pstats.Stats(*files)
+    if output is not None:
+        stats.dump_stats(output)
+    return stats
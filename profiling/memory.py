@@ -0,0 +1,235 @@
+""" Memory profiling of battles with tracemalloc.
+
+Inside a tracing() block, the battle loop's hot spots are replaced by
+wrappers recording, per region,
+
+- calls,
+- peak_bytes: the most memory any one call had allocated on top of what
+  was in use when it started,
+- transient_bytes: that high point summed over the calls, a lower bound
+  on the memory the region churns through (tracemalloc sees live memory
+  only, so an allocation freed before the next one is not added),
+- retained_bytes and retained_blocks: what the calls left allocated,
+  from tracemalloc and sys.getallocatedblocks(),
+- collections: garbage collections started while the region ran.
+
+The regions are Battle._battle_logic, the three Battle._update_*_mode
+helpers, the PokeTeam retrieval methods (__getitem__ and the
+_retrieve_*_elements copies) and PokeTeam.regenerate_team. A region
+running inside another is counted in both. mark() samples the memory in
+use, and profile_battles() marks after every battle to give the peak and
+steady state of N battles. As with profiling.phases, the original methods
+are put back on leaving the block.
+
+Usage: python -m profiling memory [-n BATTLES] [--mode MODE]
+"""
+__docformat__ = 'reStructuredText'
+
+import contextlib
+import functools
+import gc
+import os
+import random
+import statistics
+import sys
+import tracemalloc
+from array import array
+from contextlib import contextmanager
+
+from battle import Battle
+from battle_mode import BattleMode
+from data_structures.instrumentation import patch_methods
+from poke_team import PokeTeam, Trainer
+
+REGIONS = {
+    'battle_logic': (Battle, ('_battle_logic',)),
+    'update_set_mode': (Battle, ('_update_set_mode',)),
+    'update_rotate_mode': (Battle, ('_update_rotate_mode',)),
+    'update_optimise_mode': (Battle, ('_update_optimise_mode',)),
+    'retrieval': (PokeTeam, ('__getitem__', '_retrieve_stack_elements', '_retrieve_queue_elements')),
+    'regenerate_team': (PokeTeam, ('regenerate_team',)),
+}
+SEED = 1008
+
+
+class RegionMemory:
+    """ The memory counters of one region. """
+    FIELDS = ('calls', 'peak_bytes', 'transient_bytes', 'retained_bytes', 'retained_blocks', 'collections')
+
+    def __init__(self) -> None:
+        for field in self.FIELDS:
+            setattr(self, field, 0)
+
+    def as_dict(self) -> dict:
+        """ Returns the counters as a dict. """
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+
+class MemoryProfile:
+    """ The measurements of one tracing() block.
+
+    Attributes:
+         regions (dict): region name -> RegionMemory
+         samples (array): bytes in use at each mark()
+         peak_bytes (int): the most memory in use during the block, on top of what was in use when it started
+         collections (int): garbage collections started during the block
+    """
+
+    def __init__(self) -> None:
+        self.regions = {name: RegionMemory() for name in REGIONS}
+        self.samples = array('q') # a flat array, so sampling allocates no objects that would show up in the samples
+        self.peak_bytes = 0
+        self.collections = 0
+        self._start_bytes = 0
+
+    def mark(self) -> int:
+        """ Samples the bytes in use, above what was in use when the block started, and returns them.
+        The samples themselves are not counted.
+        """
+        sample = tracemalloc.get_traced_memory()[0] - self._start_bytes - sys.getsizeof(self.samples)
+        self.samples.append(sample)
+        return sample
+
+    def steady_state(self) -> dict:
+        """ Returns the mean bytes in use over the last half of the samples, and their growth per sample there
+        (least squares), which stays near 0 unless memory leaks. Both are 0 with fewer than 2 samples.
+        """
+        tail = self.samples[len(self.samples) // 2:]
+        if len(tail) < 2:
+            return {'bytes': 0, 'growth_per_sample': 0}
+        slope = statistics.linear_regression(range(len(tail)), tail).slope
+        return {'bytes': statistics.fmean(tail), 'growth_per_sample': slope}
+
+    def as_dict(self) -> dict:
+        """ Returns the regions' counters, the peak, the steady state and the garbage collections as a dict. """
+        return {
+            'regions': {name: region.as_dict() for name, region in self.regions.items()},
+            'peak_bytes': self.peak_bytes,
+            'steady_state': self.steady_state(),
+            'samples': len(self.samples),
+            'collections': self.collections,
+        }
+
+
+_profile = None     # the MemoryProfile of the active tracing() block, if any
+_running = []       # stack of [region name, bytes in use on entry, highest bytes in use seen]
+
+
+def _merge_peak(peak: int) -> None:
+    """ Folds a peak read from tracemalloc into the running region, or into the profile if none is running. """
+    if _running:
+        _running[-1][2] = max(_running[-1][2], peak)
+    else:
+        _profile.peak_bytes = max(_profile.peak_bytes, peak - _profile._start_bytes)
+
+
+def _traced(function, region: str):
+    """ Wraps a function so the memory it allocates is recorded under region. """
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        current, peak = tracemalloc.get_traced_memory()
+        _merge_peak(peak)
+        tracemalloc.reset_peak()
+        blocks = sys.getallocatedblocks()
+        frame = [region, current, current]
+        _running.append(frame)
+        try:
+            return function(*args, **kwargs)
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            _running.pop()
+            highest = max(frame[2], peak)
+            _merge_peak(highest)
+            counts = _profile.regions[region]
+            counts.calls += 1
+            counts.peak_bytes = max(counts.peak_bytes, highest - frame[1])
+            counts.transient_bytes += highest - frame[1]
+            counts.retained_bytes += current - frame[1]
+            counts.retained_blocks += sys.getallocatedblocks() - blocks
+    return wrapper
+
+
+def _count_collection(phase: str, info: dict) -> None:
+    """ gc callback charging each collection to the regions running. """
+    if phase != 'start' or _profile is None:
+        return
+    _profile.collections += 1
+    for region in {frame[0] for frame in _running}:
+        _profile.regions[region].collections += 1
+
+
+def _all_patches() -> dict:
+    """ Returns the tracing replacements for every region. """
+    patches = {}
+    for region, (cls, names) in REGIONS.items():
+        for name in names:
+            attribute = cls.__dict__[name]
+            if isinstance(attribute, staticmethod):
+                attribute = staticmethod(_traced(attribute.__func__, region))
+            else:
+                attribute = _traced(attribute, region)
+            patches.setdefault(cls, {})[name] = attribute
+    return patches
+
+
+@contextmanager
+def tracing():
+    """ Traces the memory of the regions while the block runs and yields the MemoryProfile it goes to.
+    Starts tracemalloc for the block if it is not already running.
+    :raises RuntimeError: if a tracing() block is already running
+    """
+    global _profile
+    if _profile is not None:
+        raise RuntimeError('Memory profiling is already enabled')
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    memory = MemoryProfile()
+    memory._start_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    gc.callbacks.append(_count_collection)
+    try:
+        with patch_methods(_all_patches()):
+            _profile = memory
+            try:
+                yield memory
+            finally:
+                _merge_peak(tracemalloc.get_traced_memory()[1])
+                _profile = None
+                _running.clear()
+    finally:
+        gc.callbacks.remove(_count_collection)
+        if started:
+            tracemalloc.stop()
+
+
+def profile_battles(count: int, battle_mode: BattleMode = BattleMode.ROTATE, seed: int = SEED) -> dict:
+    """ Runs count battles between the same two trainers, regenerating their teams before each one as the
+    BattleTower does, and returns the MemoryProfile as a dict, marked after every battle. Output goes to
+    os.devnull, so no buffer keeps it in memory.
+    """
+    random.seed(seed)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        trainer_1, trainer_2 = Trainer("Gary"), Trainer("Ash")
+        battle = Battle(trainer_1, trainer_2, battle_mode)
+        battle._create_teams()
+        with tracing() as memory:
+            for _ in range(count):
+                trainer_1.get_team().regenerate_team(battle_mode)
+                trainer_2.get_team().regenerate_team(battle_mode)
+                battle.commence_battle()
+                memory.mark()
+    return memory.as_dict()
+
+
+def format_report(report: dict) -> str:
+    """ Returns a profile_battles() report as a table. """
+    lines = [f"{'region':<22} | {'calls':>7} | {'peak B':>8} | {'transient B':>11} | {'retained B':>10} | "
+             f"{'blocks':>7} | {'GCs':>5}"]
+    for name, region in report['regions'].items():
+        lines.append(f"{name:<22} | {region['calls']:>7} | {region['peak_bytes']:>8} | {region['transient_bytes']:>11} | "
+                     f"{region['retained_bytes']:>10} | {region['retained_blocks']:>7} | {region['collections']:>5}")
+    steady = report['steady_state']
+    lines.append(f"\n{report['samples']} battles: peak {report['peak_bytes']} B, steady state {steady['bytes']:.0f} B "
+                 f"({steady['growth_per_sample']:+.1f} B per battle), {report['collections']} garbage collections")
+    return "\n".join(lines)
@@ -0,0 +1,130 @@
+""" Per-phase timing of battles.
+
+Inside a profile() block, the methods making up each phase of a battle are
+replaced by timing wrappers; on leaving the block the original methods are
+put back, so code run outside of it pays nothing at all. The phases are
+
+- effectiveness: TypeEffectiveness.get_effectiveness,
+- damage: Pokemon.attack and Pokemon.defend,
+- containers: every method of the team ADTs and of the BSet pokedex,
+- level_up: Pokemon.level_up, evolution included,
+- print: calls of print,
+- teams: picking, assembling and regenerating teams.
+
+Times are exclusive: a phase running inside another, such as the
+effectiveness lookup inside an attack or the print announcing an
+evolution, is taken out of the outer one, so the phases add up to at most
+the time spent in the block. The rest is reported as "other". A phase
+calling itself, e.g. a sorted list method using another, is one call.
+Times come from time.perf_counter_ns. Typical use:
+
+    with Battle.profile() as phases:
+        battle.commence_battle()
+    print(phases.as_dict())
+"""
+__docformat__ = 'reStructuredText'
+
+import builtins
+import functools
+import time
+from contextlib import contextmanager
+from types import FunctionType
+
+from data_structures.instrumentation import ADT_CLASSES, patch_methods
+from data_structures.bset import BSet
+from poke_team import PokeTeam, Trainer
+from pokemon_base import Pokemon, TypeEffectiveness
+
+PHASES = ('effectiveness', 'damage', 'containers', 'level_up', 'print', 'teams')
+
+
+class PhaseProfile:
+    """ The timings recorded by one profile() block.
+
+    Attributes:
+         calls (dict): phase -> number of calls
+         ns (dict): phase -> exclusive time in nanoseconds
+         total_ns (int): time spent in the block, in nanoseconds, set when it ends
+    """
+
+    def __init__(self) -> None:
+        self.calls = dict.fromkeys(PHASES, 0)
+        self.ns = dict.fromkeys(PHASES, 0)
+        self.total_ns = 0
+
+    def as_dict(self) -> dict:
+        """ Returns {phase: {"calls": ..., "ns": ...}} for every phase, plus "other" for the time outside
+        of the phases and "total" for the whole block.
+        """
+        result = {phase: {'calls': self.calls[phase], 'ns': self.ns[phase]} for phase in PHASES}
+        result['other'] = {'calls': 0, 'ns': self.total_ns - sum(self.ns.values())}
+        result['total'] = {'calls': 1, 'ns': self.total_ns}
+        return result
+
+
+_profile = None     # the PhaseProfile of the active profile() block, if any
+_running = []       # stack of [phase, ns spent in phases nested inside it]
+
+
+def is_enabled() -> bool:
+    """ True inside a profile() block. """
+    return _profile is not None
+
+
+def _timed(function, phase: str):
+    """ Wraps a function so the time spent in it is added to phase. """
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if _running and _running[-1][0] == phase:
+            return function(*args, **kwargs)
+        frame = [phase, 0]
+        _running.append(frame)
+        start = time.perf_counter_ns()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            _running.pop()
+            if _running:
+                _running[-1][1] += elapsed
+            _profile.calls[phase] += 1
+            _profile.ns[phase] += elapsed - frame[1]
+    return wrapper
+
+
+def _all_patches() -> dict:
+    """ Returns the timing replacements for every phase. """
+    effectiveness = TypeEffectiveness.__dict__['get_effectiveness'].__func__
+    patches = {
+        TypeEffectiveness: {'get_effectiveness': classmethod(_timed(effectiveness, 'effectiveness'))},
+        Pokemon: {'attack': _timed(Pokemon.attack, 'damage'), 'defend': _timed(Pokemon.defend, 'damage'),
+                  'level_up': _timed(Pokemon.level_up, 'level_up')},
+        builtins: {'print': _timed(builtins.print, 'print')},
+        PokeTeam: {'assemble_team': _timed(PokeTeam.assemble_team, 'teams'),
+                   'regenerate_team': _timed(PokeTeam.regenerate_team, 'teams')},
+        Trainer: {'pick_team': _timed(Trainer.pick_team, 'teams')},
+    }
+    for cls in ADT_CLASSES + (BSet,):
+        patches[cls] = {name: _timed(attribute, 'containers')
+                        for name, attribute in vars(cls).items() if isinstance(attribute, FunctionType)}
+    return patches
+
+
+@contextmanager
+def profile():
+    """ Times the phases of whatever runs in the block and yields the PhaseProfile they go to.
+    :raises RuntimeError: if a profile() block is already running
+    """
+    global _profile
+    if _profile is not None:
+        raise RuntimeError('Phase profiling is already enabled')
+    phases = PhaseProfile()
+    with patch_methods(_all_patches()):
+        _profile = phases
+        start = time.perf_counter_ns()
+        try:
+            yield phases
+        finally:
+            phases.total_ns = time.perf_counter_ns() - start
+            _profile = None
+            _running.clear()
@@ -1,9 +1,48 @@
 import argparse
+import os
 import re
+import sys
 import unittest
 from io import StringIO
 
-from ed_utils.json_test_runner import JSONTestRunner
+from benchmarks.registry import THRESHOLD
+from ed_utils.json_test_runner import JSONLinesTestRunner, JSONTestRunner, ParallelJSONTestRunner
+
+
+def run_bench(args) -> int:
+    """ Runs the benchmark suite, writes the results and compares them with the baseline,
+    recording them as the baseline instead if there is none yet. Returns 1 if a benchmark regressed past the threshold, 0 otherwise.
+    """
+    from benchmarks import registry, suite
+
+    results = registry.run_benchmarks(
+        [args.task] if args.task else None,
+        report=lambda name, seconds: print(f"{name:<30} {seconds * 1000:>10.3f} ms"),
+    )
+    registry.write_results(results, args.bench_output)
+    print(f"\nResults written to {args.bench_output}")
+
+    if args.update_baseline or not os.path.exists(args.baseline):
+        registry.write_results(results, args.baseline)
+        print(f"Baseline {'updated' if args.update_baseline else 'recorded'}: {args.baseline}")
+        return 0
+
+    regressions = registry.compare(results, registry.load_results(args.baseline), args.threshold)
+    for name, base, seconds, ratio in regressions:
+        print(f"REGRESSION {name}: {base * 1000:.3f} ms -> {seconds * 1000:.3f} ms ({ratio:.2f}x)")
+    if not regressions:
+        print(f"No regressions beyond {args.threshold:.0%} of {args.baseline}")
+    return 1 if regressions else 0
+
+
+def run_complexity(args) -> int:
+    """ Checks the documented complexities, of the cases named by the task argument or all of them.
+    Returns 1 if a case grows faster than documented, 0 otherwise.
+    """
+    from benchmarks import complexity
+
+    return complexity.main([args.task] if args.task else [])
+
 
 if __name__ == "__main__":
 
@@ -31,8 +70,70 @@ if __name__ == "__main__":
         help="Use if running on Ed.",
         action="store_true",
     )
+    p.add_argument(
+        "-j",
+        "--jobs",
+        help=(
+            "Run the tests in this many worker processes. "
+            "The results are printed as JSON, the same as with --for_ed."
+        ),
+        type=int,
+        default=1,
+    )
+    p.add_argument(
+        "--jsonl",
+        help=(
+            "Print each test's result as a line of JSON as soon as it finishes, "
+            "with its duration in seconds and the size of its output."
+        ),
+        action="store_true",
+    )
+    p.add_argument(
+        "--bench",
+        help=(
+            "Run the benchmark suite instead of the tests. "
+            "The task argument, if given, selects benchmarks by name prefix, e.g. battle or adt.stack."
+        ),
+        action="store_true",
+    )
+    p.add_argument(
+        "--complexity",
+        help=(
+            "Check the complexities documented in docstrings against timings instead of running the tests. "
+            "The task argument, if given, names the case to check, e.g. Battle._battle_logic."
+        ),
+        action="store_true",
+    )
+    p.add_argument(
+        "--bench-output",
+        help="Where to write the benchmark results as JSON.",
+        default="benchmark_results.json",
+    )
+    p.add_argument(
+        "--baseline",
+        help="Benchmark results to compare against, recorded on this machine by the first --bench run or --update-baseline.",
+        default=os.path.join("benchmarks", "baseline.json"),
+    )
+    p.add_argument(
+        "--threshold",
+        help="Fraction by which a benchmark may be slower than the baseline, e.g. 0.25 for 25%%.",
+        type=float,
+        default=THRESHOLD,
+    )
+    p.add_argument(
+        "--update-baseline",
+        help="Store the benchmark results as the new baseline.",
+        action="store_true",
+    )
     args = p.parse_args()
 
+    if args.bench:
+        sys.exit(run_bench(args))
+    if args.complexity:
+        sys.exit(run_complexity(args))
+    if args.jsonl and args.jobs > 1:
+        p.error("--jsonl cannot be combined with --jobs")
+
     while not args.for_ed and args.task == '':
         try:
             task = input("Enter task [1 - 4], leave blank to run all tests: ")
@@ -57,7 +158,16 @@ if __name__ == "__main__":
                     marked_remove.add(t2)
             for t2 in marked_remove:
                 t._tests.remove(t2)
-    if args.for_ed:
+    if args.jsonl:
+        runner = JSONLinesTestRunner(stream=sys.stdout)
+        runner.run(suite)
+    elif args.jobs > 1:
+        f = StringIO("")
+        runner = ParallelJSONTestRunner(jobs=args.jobs, stream=f)
+        runner.run(suite)
+
+        print(f.getvalue())
+    elif args.for_ed:
         f = StringIO("")
         runner = JSONTestRunner(stream=f)
         runner.run(suite)
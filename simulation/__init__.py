@@ -0,0 +1,11 @@
+"""
+Tools for long-running battle simulations: overnight tower runs and Monte
+Carlo batches of seeded battles.
+
+simulation.metrics keeps counters and histograms of the battles fought and
+exports them in the Prometheus text format. simulation.results stores one
+fixed-width record per battle in a memory-mappable .npy file, and
+simulation.aggregate summarises battle streams in constant memory.
+simulation.driver puts them together as a command line, see
+``python -m simulation --help``.
+"""
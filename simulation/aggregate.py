@@ -0,0 +1,242 @@
+""" Streaming reducers over battle results.
+
+Each reducer takes results one at a time in constant memory and can be
+merged with the same reducer fed elsewhere, e.g. by another worker process
+(they pickle as they are), to give what one reducer fed everything would:
+
+- RunningStats: count, mean, variance (Welford's algorithm, merged with
+  Chan et al.'s pairwise update), min and max,
+- QuantileSketch: quantiles with a relative error bound, in the manner of
+  DDSketch: values are counted in logarithmic buckets of width gamma, at
+  most max_buckets of them, the lowest buckets collapsing if there would
+  be more,
+- SpeciesWins: battles fought and won per species (Pokemon class),
+- BattleAggregate: the above for a battle stream, per BattleMode: rounds,
+  the winning team's remaining health, and species win rates. It takes
+  Battles as they finish, or records read back from simulation.results.
+"""
+__docformat__ = 'reStructuredText'
+
+import math
+from typing import Optional
+
+from battle_mode import BattleMode
+from simulation.results import DRAW, FIELDS, battle_record
+
+RELATIVE_ACCURACY = 0.01
+MAX_BUCKETS = 2048
+
+
+class RunningStats:
+    """ Count, mean, variance, min and max of a stream of numbers. """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0 # sum of squared differences from the mean
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: 'RunningStats') -> None:
+        """ Adds the values other has seen to these. """
+        if other.count == 0:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.mean += delta * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def variance(self) -> float:
+        """ Returns the sample variance, 0 for fewer than two values. """
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def as_dict(self) -> dict:
+        return {'count': self.count, 'mean': self.mean, 'variance': self.variance(),
+                'min': self.min if self.count else None, 'max': self.max if self.count else None}
+
+
+class QuantileSketch:
+    """ Quantiles of a stream of numbers, each within relative_accuracy of a true value of that rank as long
+    as no buckets collapsed. Zero and negative values are counted apart, as zeros and in mirrored buckets.
+    """
+
+    def __init__(self, relative_accuracy: float = RELATIVE_ACCURACY, max_buckets: int = MAX_BUCKETS) -> None:
+        """
+        :raises ValueError: if relative_accuracy is not between 0 and 1, or max_buckets is not positive
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError('relative_accuracy should be between 0 and 1')
+        if max_buckets <= 0:
+            raise ValueError('max_buckets should be positive')
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.max_buckets = max_buckets
+        self.positive = {} # bucket index -> count, bucket i holds (gamma^(i-1), gamma^i]
+        self.negative = {} # the same for -value
+        self.zeros = 0
+        self.count = 0
+
+    def _index(self, value: float) -> int:
+        return math.ceil(math.log(value) / self.log_gamma)
+
+    def _value(self, index: int) -> float:
+        """ The value reported for bucket index, within relative_accuracy of anything in it. """
+        return 2 * self.gamma ** index / (self.gamma + 1)
+
+    def add(self, value: float, count: int = 1) -> None:
+        self.count += count
+        if value > 0:
+            buckets, value = self.positive, value
+        elif value < 0:
+            buckets, value = self.negative, -value
+        else:
+            self.zeros += count
+            return
+        index = self._index(value)
+        buckets[index] = buckets.get(index, 0) + count
+        if len(buckets) > self.max_buckets:
+            self._collapse(buckets)
+
+    def _collapse(self, buckets: dict) -> None:
+        """ Folds the lowest buckets into the lowest one kept, leaving max_buckets. """
+        indices = sorted(buckets)
+        lowest = indices[-self.max_buckets]
+        for index in indices[:-self.max_buckets]:
+            buckets[lowest] += buckets.pop(index)
+
+    def merge(self, other: 'QuantileSketch') -> None:
+        """ Adds the values other has seen to these.
+        :raises ValueError: if other uses a different relative accuracy
+        """
+        if other.gamma != self.gamma:
+            raise ValueError('Cannot merge sketches of different relative accuracy')
+        for mine, theirs in ((self.positive, other.positive), (self.negative, other.negative)):
+            for index, count in theirs.items():
+                mine[index] = mine.get(index, 0) + count
+            if len(mine) > self.max_buckets:
+                self._collapse(mine)
+        self.zeros += other.zeros
+        self.count += other.count
+
+    def quantile(self, q: float) -> Optional[float]:
+        """ Returns the q-quantile (0 <= q <= 1) of the values, None if there are none.
+        :raises ValueError: if q is out of range
+        """
+        if not 0 <= q <= 1:
+            raise ValueError('q should be between 0 and 1')
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for index in sorted(self.negative, reverse=True):
+            seen += self.negative[index]
+            if seen > rank:
+                return -self._value(index)
+        seen += self.zeros
+        if seen > rank:
+            return 0.0
+        for index in sorted(self.positive):
+            seen += self.positive[index]
+            if seen > rank:
+                return self._value(index)
+        return self._value(max(self.positive))
+
+    def as_dict(self, quantiles: tuple = (0.5, 0.9, 0.99)) -> dict:
+        return {'count': self.count, **{f'p{round(q * 100)}': self.quantile(q) for q in quantiles}}
+
+
+class SpeciesWins:
+    """ Battles fought and won per species. A species is counted once per team it is in, however many
+    times the team holds it, so a species in both teams is counted for each.
+    """
+
+    def __init__(self) -> None:
+        self.battles = {}
+        self.wins = {}
+
+    def add(self, species: list, won: bool) -> None:
+        """ Counts one battle for a team of species (names), won or not. Repeated names count once. """
+        for name in dict.fromkeys(species):
+            self.battles[name] = self.battles.get(name, 0) + 1
+            if won:
+                self.wins[name] = self.wins.get(name, 0) + 1
+
+    def merge(self, other: 'SpeciesWins') -> None:
+        for name, count in other.battles.items():
+            self.battles[name] = self.battles.get(name, 0) + count
+        for name, count in other.wins.items():
+            self.wins[name] = self.wins.get(name, 0) + count
+
+    def win_rates(self) -> dict:
+        """ Returns species name -> fraction of its battles won, highest first. """
+        rates = {name: self.wins.get(name, 0) / battles for name, battles in self.battles.items()}
+        return dict(sorted(rates.items(), key=lambda item: (-item[1], item[0])))
+
+
+class BattleAggregate:
+    """ Rounds, the winning team's remaining health, draws and species win rates of a stream of battles,
+    per BattleMode name.
+    """
+
+    def __init__(self, relative_accuracy: float = RELATIVE_ACCURACY, max_buckets: int = MAX_BUCKETS) -> None:
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.rounds = {}
+        self.remaining_hp = {}
+        self.draws = {}
+        self.species = SpeciesWins()
+
+    def _add_mode(self, mode: str) -> None:
+        if mode not in self.rounds:
+            self.rounds[mode] = RunningStats()
+            self.remaining_hp[mode] = QuantileSketch(self.relative_accuracy, self.max_buckets)
+            self.draws[mode] = 0
+
+    def add_record(self, record: tuple) -> None:
+        """ Adds a record of simulation.results (species are not recorded there). """
+        values = dict(zip(FIELDS, record))
+        mode = BattleMode(values['mode']).name
+        self._add_mode(mode)
+        self.rounds[mode].add(values['rounds'])
+        if values['winner'] == DRAW:
+            self.draws[mode] += 1
+        else:
+            self.remaining_hp[mode].add(values['hp_1'] if values['winner'] == 1 else values['hp_2'])
+
+    def add_battle(self, battle, winner) -> None:
+        """ Adds a Battle after commence_battle() returned winner. """
+        self.add_record(battle_record(0, battle, winner))
+        for trainer in (battle.trainer_1, battle.trainer_2):
+            team = trainer.get_team()
+            self.species.add([type(team.selected_pokemons[i]).__name__ for i in range(team.team_count)],
+                             winner is trainer)
+
+    def merge(self, other: 'BattleAggregate') -> None:
+        """ Adds the battles other has seen to these. """
+        for mode, stats in other.rounds.items():
+            self._add_mode(mode)
+            self.rounds[mode].merge(stats)
+            self.remaining_hp[mode].merge(other.remaining_hp[mode])
+            self.draws[mode] += other.draws[mode]
+        self.species.merge(other.species)
+
+    def as_dict(self) -> dict:
+        """ Returns the summary per mode and the species win rates. """
+        return {
+            'modes': {mode: {'battles': self.rounds[mode].count, 'draws': self.draws[mode],
+                             'rounds': self.rounds[mode].as_dict(), 'remaining_hp': self.remaining_hp[mode].as_dict()}
+                      for mode in sorted(self.rounds)},
+            'species_win_rates': self.species.win_rates(),
+        }
@@ -0,0 +1,260 @@
+""" The simulation command line, run as ``python -m simulation``:
+
+    simulate  N seeded battles in one BattleMode, written to a .npy result file
+    tower     seeded BattleTower runs, every tower battle written to a .npy result file
+    matrix    one-on-one battles of every species against every other, written to a CSV file
+
+Battle output is discarded. Work is split into chunks that run in --workers
+processes; results are written in order as each chunk finishes, merged
+into SimulationMetrics and BattleAggregate, and summarised at the end with
+the battles per second. Battle i of simulate is seeded with --seed + i, so
+the results do not depend on the number of workers. --metrics FILE
+rewrites a Prometheus text file after every chunk, and --metrics-port
+serves the same at http://127.0.0.1:PORT/metrics.
+"""
+import argparse
+import contextlib
+import csv
+import multiprocessing
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from battle import Battle
+from battle_mode import BattleMode
+from poke_team import PokeTeam, Trainer
+from simulation.aggregate import BattleAggregate, RunningStats
+from simulation.metrics import SimulationMetrics, start_http_server
+from simulation.results import ResultWriter, battle_record
+from tower import BattleTower
+
+SEED = 1008
+CHUNK_BATTLES = 500 # battles per chunk of simulate
+CHUNK_TOWERS = 5 # towers per chunk of tower
+
+
+@contextlib.contextmanager
+def _quiet():
+    """ Discards what is printed in the block. """
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def _map(function, tasks: list, workers: int):
+    """ Yields function(task) for each task in order, from workers processes if workers > 1. """
+    if workers <= 1:
+        yield from map(function, tasks)
+        return
+    context = multiprocessing.get_context("fork") if "fork" in multiprocessing.get_all_start_methods() else None
+    with ProcessPoolExecutor(workers, mp_context=context) as pool:
+        yield from pool.map(function, tasks)
+
+
+def _fight(battle: Battle, metrics: SimulationMetrics) -> object:
+    """ Runs battle, records it in metrics and returns the winner. """
+    start = time.perf_counter()
+    winner = battle.commence_battle()
+    metrics.record_battle(battle, winner, time.perf_counter() - start)
+    return winner
+
+
+def simulate_chunk(task: tuple) -> tuple:
+    """ Fights the battles seeded start to stop - 1 and returns their records, metrics snapshot and aggregate. """
+    start, stop, mode, criterion = task
+    metrics, aggregate, records = SimulationMetrics(), BattleAggregate(), []
+    with _quiet():
+        for seed in range(start, stop):
+            random.seed(seed)
+            battle = Battle(Trainer("Trainer 1"), Trainer("Trainer 2"), BattleMode[mode], criterion)
+            battle._create_teams()
+            winner = _fight(battle, metrics)
+            aggregate.add_battle(battle, winner)
+            records.append(battle_record(seed, battle, winner))
+    return records, metrics.snapshot(), aggregate
+
+
+def tower_chunk(task: tuple) -> tuple:
+    """ Runs the towers seeded start to stop - 1 and returns the records of their battles, the metrics snapshot,
+    the aggregate and the RunningStats of the player's wins per tower.
+    """
+    start, stop, mode, lives, enemies = task
+    metrics, aggregate, records, wins = SimulationMetrics(), BattleAggregate(), [], RunningStats()
+    with _quiet():
+        for seed in range(start, stop):
+            random.seed(seed)
+            tower = BattleTower()
+            tower.BATTLE_MODE = BattleMode[mode]
+            trainer = Trainer("Player")
+            trainer.pick_team(BattleTower.SELECTION_MODE)
+            trainer.get_team().assemble_team(tower.BATTLE_MODE)
+            tower.set_my_trainer(trainer)
+            if lives is not None:
+                tower.my_lives = lives
+            tower.generate_enemy_trainers(enemies)
+            while tower.battles_remaining():
+                began = time.perf_counter()
+                winner = tower.next_battle()[0]
+                battle = tower.last_battle
+                metrics.record_battle(battle, winner, time.perf_counter() - began)
+                aggregate.add_battle(battle, winner)
+                records.append(battle_record(seed, battle, winner))
+            wins.add(tower.enemies_defeated())
+    return records, metrics.snapshot(), aggregate, wins
+
+
+def _single_pokemon_trainer(name: str, species: type, battle_mode: BattleMode) -> Trainer:
+    """ Returns a trainer whose team is one new pokemon of species. """
+    trainer = Trainer(name)
+    trainer.pick_species(species)
+    trainer.get_team().assemble_team(battle_mode)
+    return trainer
+
+
+def matrix_row(task: tuple) -> tuple:
+    """ Fights species row against every species, one on one, and returns the row's name, its scores (1 for a
+    win, 0.5 for a draw, 0 for a loss) and the metrics snapshot.
+    """
+    row, mode = task
+    species = list(PokeTeam.POKE_LIST)
+    metrics, scores = SimulationMetrics(), []
+    with _quiet():
+        for opponent in species:
+            battle = Battle(_single_pokemon_trainer("Row", species[row], BattleMode[mode]),
+                            _single_pokemon_trainer("Column", opponent, BattleMode[mode]), BattleMode[mode])
+            winner = _fight(battle, metrics)
+            scores.append(0.5 if winner is None else float(winner is battle.trainer_1))
+    return species[row].__name__, scores, metrics.snapshot()
+
+
+class _Run:
+    """ What the subcommands share: the merged metrics and their export, and the throughput summary. """
+
+    def __init__(self, args) -> None:
+        self.args = args
+        self.metrics = SimulationMetrics()
+        self.server = start_http_server(self.metrics, args.metrics_port) if args.metrics_port else None
+        self.started = time.perf_counter()
+
+    def chunk_done(self, snapshot: dict) -> None:
+        self.metrics.merge(snapshot)
+        if self.args.metrics:
+            self.metrics.write_textfile(self.args.metrics)
+
+    def finish(self, command: str) -> None:
+        elapsed = time.perf_counter() - self.started
+        battles = sum(counts["battles"] for counts in self.metrics.modes.values())
+        print(f"{command}: {battles} battles in {elapsed:.2f} s, {battles / elapsed:.1f} battles/s "
+              f"({self.args.workers} worker{'s' if self.args.workers != 1 else ''})")
+        print(f"Results written to {self.args.output}")
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+
+
+def _print_aggregate(aggregate: BattleAggregate) -> None:
+    summary = aggregate.as_dict()
+    for mode, stats in summary["modes"].items():
+        rounds, hp = stats["rounds"], stats["remaining_hp"]
+        print(f"{mode}: {stats['battles']} battles, {stats['draws']} draws, rounds mean {rounds['mean']:.2f} "
+              f"(sd {rounds['variance'] ** 0.5:.2f}), winner's remaining HP p50 {hp['p50'] or 0:.1f} "
+              f"p90 {hp['p90'] or 0:.1f}")
+    top = list(summary["species_win_rates"].items())[:5]
+    if top:
+        print("Best species: " + ", ".join(f"{name} {rate:.0%}" for name, rate in top))
+
+
+def simulate(args) -> int:
+    run = _Run(args)
+    aggregate = BattleAggregate()
+    tasks = [(start, min(start + CHUNK_BATTLES, args.seed + args.battles), args.mode, args.criterion)
+             for start in range(args.seed, args.seed + args.battles, CHUNK_BATTLES)]
+    with ResultWriter(args.output) as writer:
+        for records, snapshot, part in _map(simulate_chunk, tasks, args.workers):
+            for record in records:
+                writer.append(record)
+            aggregate.merge(part)
+            run.chunk_done(snapshot)
+    run.finish("simulate")
+    _print_aggregate(aggregate)
+    return 0
+
+
+def tower(args) -> int:
+    run = _Run(args)
+    aggregate, wins = BattleAggregate(), RunningStats()
+    tasks = [(start, min(start + CHUNK_TOWERS, args.seed + args.towers), args.mode, args.lives, args.enemies)
+             for start in range(args.seed, args.seed + args.towers, CHUNK_TOWERS)]
+    with ResultWriter(args.output) as writer:
+        for records, snapshot, part, part_wins in _map(tower_chunk, tasks, args.workers):
+            for record in records:
+                writer.append(record)
+            aggregate.merge(part)
+            wins.merge(part_wins)
+            run.chunk_done(snapshot)
+    run.finish("tower")
+    print(f"{wins.count} towers, battles won per tower: mean {wins.mean:.2f}, min {wins.min}, max {wins.max}")
+    _print_aggregate(aggregate)
+    return 0
+
+
+def matrix(args) -> int:
+    run = _Run(args)
+    names = [species.__name__ for species in PokeTeam.POKE_LIST]
+    rates = {}
+    with open(args.output, "w", newline="") as file:
+        out = csv.writer(file)
+        out.writerow(["species"] + names)
+        for name, scores, snapshot in _map(matrix_row, [(row, args.mode) for row in range(len(names))], args.workers):
+            out.writerow([name] + scores)
+            file.flush()
+            rates[name] = sum(scores) / len(scores)
+            run.chunk_done(snapshot)
+    run.finish("matrix")
+    top = sorted(rates.items(), key=lambda item: (-item[1], item[0]))[:5]
+    print("Best species: " + ", ".join(f"{name} {rate:.0%}" for name, rate in top))
+    return 0
+
+
+def _positive_int(text: str) -> int:
+    """ argparse type for counts that must be at least 1. """
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {text!r}")
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def main(argv: list = None) -> int:
+    p = argparse.ArgumentParser(prog="python -m simulation")
+    commands = p.add_subparsers(dest="command", required=True)
+    modes = [mode.name for mode in BattleMode]
+
+    def common(command, output: str, mode: str):
+        command.add_argument("--mode", help="The battle mode.", choices=modes, default=mode)
+        command.add_argument("-o", "--output", help="Where to write the results.", default=output)
+        command.add_argument("-w", "--workers", help="Worker processes.", type=_positive_int, default=1)
+        command.add_argument("--metrics", help="Prometheus text file to rewrite after every chunk.")
+        command.add_argument("--metrics-port", help="Serve the metrics over HTTP on this port.", type=int)
+
+    run = commands.add_parser("simulate", help="Fight seeded battles.")
+    run.add_argument("-n", "--battles", help="How many battles.", type=_positive_int, default=1000)
+    run.add_argument("--criterion", help="Team order criterion for OPTIMISE.", choices=PokeTeam.CRITERION_LIST,
+                     default="health")
+    run.add_argument("--seed", help="Seed of the first battle.", type=int, default=SEED)
+    common(run, "results.npy", "SET")
+
+    towers = commands.add_parser("tower", help="Run seeded battle towers.")
+    towers.add_argument("-n", "--towers", help="How many towers.", type=_positive_int, default=10)
+    towers.add_argument("--lives", help="The player's lives, random by default.", type=_positive_int)
+    towers.add_argument("--enemies", help="Enemy trainers per tower.", type=_positive_int, default=10)
+    towers.add_argument("--seed", help="Seed of the first tower.", type=int, default=SEED)
+    common(towers, "tower.npy", BattleTower.BATTLE_MODE.name)
+
+    species = commands.add_parser("matrix", help="Fight every species against every other, one on one.")
+    common(species, "matrix.csv", "SET")
+
+    args = p.parse_args(argv)
+    return {"simulate": simulate, "tower": tower, "matrix": matrix}[args.command](args)
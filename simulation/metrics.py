@@ -0,0 +1,171 @@
+""" Prometheus-format metrics for battle simulations.
+
+SimulationMetrics counts, per BattleMode, the battles completed, draws,
+evolutions and time spent battling, and keeps a histogram of the rounds
+per battle. Recording is a few dict updates with no locking: every process
+keeps its own SimulationMetrics, and workers send snapshot() to the parent,
+which merge()s them. The parent can then
+
+- write_textfile(path): write the exposition text to a file atomically
+  (written beside it, then os.replace'd), for node_exporter's textfile
+  collector or a plain look at progress,
+- start_http_server(metrics, port): serve it at /metrics from a daemon
+  thread, using only http.server.
+
+Typical use, per battle:
+
+    start = time.perf_counter()
+    winner = battle.commence_battle()
+    metrics.record_battle(battle, winner, time.perf_counter() - start)
+"""
+__docformat__ = 'reStructuredText'
+
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PREFIX = 'pokemon'
+ROUND_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200) # upper bounds of the rounds histogram, +Inf is added
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# name, type, help and the per-mode field of the counters and gauges rendered
+_SERIES = (
+    ('battles_total', 'counter', 'Battles completed.', 'battles'),
+    ('draws_total', 'counter', 'Battles ending in a draw.', 'draws'),
+    ('evolutions_total', 'counter', 'Pokemon evolutions during battles.', 'evolutions'),
+    ('battle_seconds_total', 'counter', 'Time spent in battles, in seconds.', 'seconds'),
+)
+
+
+def _new_mode() -> dict:
+    return {'battles': 0, 'draws': 0, 'evolutions': 0, 'seconds': 0.0,
+            'rounds_sum': 0, 'rounds_buckets': [0] * (len(ROUND_BUCKETS) + 1)}
+
+
+class SimulationMetrics:
+    """ Counters and the rounds histogram of the battles of a simulation, per BattleMode name.
+
+    Attributes:
+         modes (dict): mode name -> dict of battles, draws, evolutions, seconds, rounds_sum and rounds_buckets
+         started (float): time.time() when recording started, the earliest over merged snapshots
+    """
+
+    def __init__(self) -> None:
+        self.modes = {}
+        self.started = time.time()
+
+    def _mode(self, mode: str) -> dict:
+        counts = self.modes.get(mode)
+        if counts is None:
+            counts = self.modes[mode] = _new_mode()
+        return counts
+
+    def record(self, mode: str, rounds: int, draw: bool = False, evolutions: int = 0, seconds: float = 0.0) -> None:
+        """ Records one battle fought in mode (a BattleMode name). """
+        counts = self._mode(mode)
+        counts['battles'] += 1
+        counts['draws'] += draw
+        counts['evolutions'] += evolutions
+        counts['seconds'] += seconds
+        counts['rounds_sum'] += rounds
+        bucket = 0
+        while bucket < len(ROUND_BUCKETS) and rounds > ROUND_BUCKETS[bucket]:
+            bucket += 1
+        counts['rounds_buckets'][bucket] += 1
+
+    def record_battle(self, battle, winner, seconds: float = 0.0) -> None:
+        """ Records a Battle after commence_battle() returned winner, using its rounds and evolutions. """
+        self.record(battle.battle_mode.name, battle.rounds, winner is None, battle.evolutions, seconds)
+
+    def snapshot(self) -> dict:
+        """ Returns a copy of the metrics as plain data, to send to another process and merge() there. """
+        return {
+            'started': self.started,
+            'modes': {mode: dict(counts, rounds_buckets=list(counts['rounds_buckets']))
+                      for mode, counts in list(self.modes.items())},
+        }
+
+    def merge(self, snapshot: dict) -> None:
+        """ Adds a snapshot() of another SimulationMetrics to these. """
+        self.started = min(self.started, snapshot['started'])
+        for mode, other in snapshot['modes'].items():
+            counts = self._mode(mode)
+            for field in ('battles', 'draws', 'evolutions', 'seconds', 'rounds_sum'):
+                counts[field] += other[field]
+            counts['rounds_buckets'] = [a + b for a, b in zip(counts['rounds_buckets'], other['rounds_buckets'])]
+
+    def render(self, now: float = None) -> str:
+        """ Returns the metrics in the Prometheus text exposition format. battles_per_second is, per mode, the
+        battles completed over the seconds spent battling in that mode, so with merged workers it is the rate
+        of one worker. wall_battles_per_second is all battles over the wall time since started, up to now
+        (the current time by default).
+        """
+        snapshot = self.snapshot()
+        modes = sorted(snapshot['modes'].items())
+        elapsed = max((time.time() if now is None else now) - snapshot['started'], 1e-9)
+        lines = []
+        for name, kind, help_text, field in _SERIES:
+            lines.append(f'# HELP {PREFIX}_{name} {help_text}')
+            lines.append(f'# TYPE {PREFIX}_{name} {kind}')
+            lines.extend(f'{PREFIX}_{name}{{mode="{mode}"}} {_number(counts[field])}' for mode, counts in modes)
+
+        lines.append(f'# HELP {PREFIX}_battles_per_second Battles completed per second spent battling.')
+        lines.append(f'# TYPE {PREFIX}_battles_per_second gauge')
+        lines.extend(f'{PREFIX}_battles_per_second{{mode="{mode}"}} '
+                     f'{_number(counts["battles"] / counts["seconds"] if counts["seconds"] else 0)}'
+                     for mode, counts in modes)
+        lines.append(f'# HELP {PREFIX}_wall_battles_per_second Battles completed per second of wall time.')
+        lines.append(f'# TYPE {PREFIX}_wall_battles_per_second gauge')
+        lines.append(f'{PREFIX}_wall_battles_per_second {_number(sum(c["battles"] for _, c in modes) / elapsed)}')
+
+        lines.append(f'# HELP {PREFIX}_battle_rounds Rounds per battle.')
+        lines.append(f'# TYPE {PREFIX}_battle_rounds histogram')
+        for mode, counts in modes:
+            cumulative = 0
+            for bound, count in zip(ROUND_BUCKETS + ('+Inf',), counts['rounds_buckets']):
+                cumulative += count
+                lines.append(f'{PREFIX}_battle_rounds_bucket{{mode="{mode}",le="{bound}"}} {cumulative}')
+            lines.append(f'{PREFIX}_battle_rounds_sum{{mode="{mode}"}} {counts["rounds_sum"]}')
+            lines.append(f'{PREFIX}_battle_rounds_count{{mode="{mode}"}} {counts["battles"]}')
+        return '\n'.join(lines) + '\n'
+
+    def write_textfile(self, path: str) -> None:
+        """ Writes render() to path atomically: readers see the old file or the new one, never a partial one. """
+        temporary = f'{path}.{os.getpid()}.tmp'
+        with open(temporary, 'w') as file:
+            file.write(self.render())
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, path)
+
+
+def _number(value) -> str:
+    """ Formats a sample value, integers without a decimal point. """
+    if isinstance(value, float) and not value.is_integer():
+        return repr(value)
+    return str(int(value))
+
+
+def start_http_server(metrics: SimulationMetrics, port: int = 8000, host: str = '127.0.0.1') -> ThreadingHTTPServer:
+    """ Serves metrics.render() at http://host:port/metrics from a daemon thread and returns the server.
+    Port 0 picks a free port, see server.server_address. Stop it with server.shutdown().
+    """
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] not in ('/metrics', '/'):
+                self.send_error(404)
+                return
+            body = metrics.render().encode()
+            self.send_response(200)
+            self.send_header('Content-Type', CONTENT_TYPE)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
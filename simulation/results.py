@@ -0,0 +1,219 @@
+""" Columnar result store for batch simulations.
+
+Battle results are fixed-width records of
+
+    seed (int64), mode (uint8), criterion (uint8), winner (int8),
+    rounds (uint32), survivors (uint16), hp_1 (float64), hp_2 (float64)
+
+packed little-endian without padding, 33 bytes each. mode is the
+BattleMode value, criterion the index in PokeTeam.CRITERION_LIST (255 for
+composite criteria), winner 1 or 2 for the trainer who won and 0 for a
+draw, survivors the pokemons of both teams still alive, hp_1 and hp_2 the
+health they have left per team.
+
+ResultWriter appends records to a .npy file (a one-dimensional structured
+array, in NumPy's format version 1.0) a chunk at a time, and rewrites the
+length in the fixed-size header after each chunk, so the file is valid
+whenever the writer is not mid-flush and a run can be resumed by opening
+it with append=True. ResultReader memory-maps the file and unpacks records
+only as they are read, so multi-gigabyte result sets are never loaded as a
+whole. With NumPy installed, numpy.load(path, mmap_mode='r') or
+ResultReader.to_numpy() gives the same records as a structured array.
+"""
+__docformat__ = 'reStructuredText'
+
+import ast
+import mmap
+import os
+import struct
+from collections import namedtuple
+
+try:
+    import numpy
+except ImportError: # optional, only needed by ResultReader.to_numpy()
+    numpy = None
+
+from poke_team import PokeTeam
+
+RECORD = struct.Struct('<qBBbIHdd')
+FIELDS = ('seed', 'mode', 'criterion', 'winner', 'rounds', 'survivors', 'hp_1', 'hp_2')
+DESCR = [('seed', '<i8'), ('mode', '|u1'), ('criterion', '|u1'), ('winner', '|i1'), ('rounds', '<u4'),
+         ('survivors', '<u2'), ('hp_1', '<f8'), ('hp_2', '<f8')]
+BattleRecord = namedtuple('BattleRecord', FIELDS)
+
+MAGIC = b'\x93NUMPY\x01\x00'
+HEADER_SIZE = 256 # magic, header length and header dict, so the data starts 64-byte aligned
+CHUNK_RECORDS = 4096
+OTHER_CRITERION = 255
+DRAW = 0
+
+
+def _header(count: int) -> bytes:
+    """ Returns the .npy header of count records, padded to HEADER_SIZE so it can be rewritten in place. """
+    text = "{'descr': %r, 'fortran_order': False, 'shape': (%d,), }" % (DESCR, count)
+    padding = HEADER_SIZE - len(MAGIC) - 2 - len(text) - 1
+    return MAGIC + struct.pack('<H', HEADER_SIZE - len(MAGIC) - 2) + text.encode('latin1') + b' ' * padding + b'\n'
+
+
+def _read_count(header: bytes) -> int:
+    """ Returns the number of records in a header written by _header().
+    :raises ValueError: if header is not one
+    """
+    if header[:len(MAGIC)] != MAGIC or len(header) < HEADER_SIZE:
+        raise ValueError('Not a battle result file')
+    fields = ast.literal_eval(header[len(MAGIC) + 2:HEADER_SIZE].decode('latin1'))
+    if fields['descr'] != DESCR or fields['fortran_order']:
+        raise ValueError('Not a battle result file')
+    return fields['shape'][0]
+
+
+def battle_record(seed: int, battle, winner) -> tuple:
+    """ Returns the record of a Battle after commence_battle() returned winner. """
+    criterion = battle.criterion
+    criterion = PokeTeam.CRITERION_LIST.index(criterion) if criterion in PokeTeam.CRITERION_LIST else OTHER_CRITERION
+    if winner is None:
+        outcome = DRAW
+    else:
+        outcome = 1 if winner is battle.trainer_1 else 2
+
+    survivors, health = 0, []
+    for trainer in (battle.trainer_1, battle.trainer_2):
+        team, total = trainer.get_team(), 0.0
+        for index in range(team.team_count):
+            pokemon = team.selected_pokemons[index]
+            if pokemon.is_alive():
+                survivors += 1
+                total += pokemon.get_health()
+        health.append(total)
+    return (seed, battle.battle_mode.value, criterion, outcome, battle.rounds, survivors, health[0], health[1])
+
+
+class ResultWriter:
+    """ Appends battle records to a .npy file, chunk_records at a time. Use it as a context manager, or call
+    close(), to write the last partial chunk.
+
+    Attributes:
+         path (str): the file written
+         count (int): records appended so far, including those still buffered
+    """
+
+    def __init__(self, path: str, append: bool = False, chunk_records: int = CHUNK_RECORDS) -> None:
+        """
+        :param append: continue the records already in path instead of starting a new file
+        :raises ValueError: if chunk_records is not positive, or path holds something else when appending
+        """
+        if chunk_records <= 0:
+            raise ValueError('chunk_records should be positive')
+        self.path = path
+        self.chunk_bytes = chunk_records * RECORD.size
+        self.buffer = bytearray()
+        if append and os.path.exists(path):
+            self.file = open(path, 'r+b')
+            self.written = _read_count(self.file.read(HEADER_SIZE))
+            self.file.truncate(HEADER_SIZE + self.written * RECORD.size) # drop a torn partial record
+        else:
+            self.file = open(path, 'w+b')
+            self.written = 0
+            self.file.write(_header(0))
+
+    @property
+    def count(self) -> int:
+        return self.written + len(self.buffer) // RECORD.size
+
+    def append(self, record: tuple) -> None:
+        """ Appends a record, a tuple of the FIELDS in order. """
+        self.buffer += RECORD.pack(*record)
+        if len(self.buffer) >= self.chunk_bytes:
+            self.flush()
+
+    def append_battle(self, seed: int, battle, winner) -> None:
+        """ Appends the record of a Battle after commence_battle() returned winner. """
+        self.append(battle_record(seed, battle, winner))
+
+    def flush(self) -> None:
+        """ Writes the buffered records, then the new length into the header. """
+        if not self.buffer:
+            return
+        self.file.seek(HEADER_SIZE + self.written * RECORD.size)
+        self.file.write(self.buffer)
+        self.written += len(self.buffer) // RECORD.size
+        self.buffer.clear()
+        self.file.flush()
+        self.file.seek(0)
+        self.file.write(_header(self.written))
+        self.file.flush()
+
+    def close(self) -> None:
+        """ Flushes and closes the file. """
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+    def __enter__(self) -> 'ResultWriter':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ResultReader:
+    """ Memory-mapped, read-only access to a file written by ResultWriter. Records are unpacked on access,
+    as BattleRecord tuples.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        :raises ValueError: if path is not a battle result file
+        """
+        self.path = path
+        self.file = open(path, 'rb')
+        self.count = _read_count(self.file.read(HEADER_SIZE))
+        size = HEADER_SIZE + self.count * RECORD.size
+        self.map = mmap.mmap(self.file.fileno(), size, access=mmap.ACCESS_READ) if self.count else None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> BattleRecord:
+        """
+        :raises IndexError: if index is out of bounds
+        """
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError('Record index out of range')
+        return BattleRecord._make(RECORD.unpack_from(self.map, HEADER_SIZE + index * RECORD.size))
+
+    def __iter__(self):
+        """ Yields the records in order, start to end. """
+        for start in range(0, self.count, CHUNK_RECORDS):
+            stop = min(start + CHUNK_RECORDS, self.count)
+            chunk = self.map[HEADER_SIZE + start * RECORD.size:HEADER_SIZE + stop * RECORD.size]
+            yield from map(BattleRecord._make, RECORD.iter_unpack(chunk))
+
+    def column(self, name: str):
+        """ Yields one field of every record, e.g. column('rounds').
+        :raises ValueError: if name is not one of FIELDS
+        """
+        position = FIELDS.index(name)
+        for record in self:
+            yield record[position]
+
+    def to_numpy(self):
+        """ Returns the records as a read-only, memory-mapped NumPy structured array.
+        :raises ImportError: if NumPy is not installed
+        """
+        if numpy is None:
+            raise ImportError('to_numpy() needs NumPy')
+        return numpy.load(self.path, mmap_mode='r')
+
+    def close(self) -> None:
+        if self.map is not None:
+            self.map.close()
+        self.file.close()
+
+    def __enter__(self) -> 'ResultReader':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
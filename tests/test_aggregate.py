@@ -0,0 +1,121 @@
+import contextlib
+import io
+import multiprocessing
+import pickle
+import random
+import statistics
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+from battle import Battle
+from battle_mode import BattleMode
+from poke_team import Trainer
+from simulation.aggregate import BattleAggregate, QuantileSketch, RunningStats, SpeciesWins
+
+
+def aggregate_battles(seeds: list) -> BattleAggregate:
+    aggregate = BattleAggregate()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for seed in seeds:
+            random.seed(seed)
+            battle = Battle(Trainer("Gary"), Trainer("Ash"), list(BattleMode)[seed % 3])
+            battle._create_teams()
+            aggregate.add_battle(battle, battle.commence_battle())
+    return aggregate
+
+
+class TestRunningStats(unittest.TestCase):
+
+    def test_matches_statistics_and_merges(self):
+        rng = random.Random(1)
+        values = [rng.gauss(50, 10) for _ in range(1000)]
+        whole, first, second = RunningStats(), RunningStats(), RunningStats()
+        for i, value in enumerate(values):
+            whole.add(value)
+            (first if i < 300 else second).add(value)
+        first.merge(second)
+        for stats in (whole, first):
+            self.assertEqual(stats.count, 1000)
+            self.assertAlmostEqual(stats.mean, statistics.fmean(values))
+            self.assertAlmostEqual(stats.variance(), statistics.variance(values))
+            self.assertEqual((stats.min, stats.max), (min(values), max(values)))
+        empty = RunningStats()
+        empty.merge(RunningStats())
+        self.assertEqual(empty.as_dict()["min"], None)
+
+
+class TestQuantileSketch(unittest.TestCase):
+
+    def test_relative_accuracy(self):
+        rng = random.Random(2)
+        values = [rng.lognormvariate(3, 1.5) for _ in range(5000)] + [0.0] * 50 + [-5.0] * 50
+        values.sort()
+        sketch = QuantileSketch(0.01)
+        for value in values:
+            sketch.add(value)
+        for q in (0, 0.01, 0.25, 0.5, 0.9, 0.99, 1):
+            exact = values[int(q * (len(values) - 1))]
+            self.assertLessEqual(abs(sketch.quantile(q) - exact), 0.01 * abs(exact) + 1e-12, q)
+        self.assertIsNone(QuantileSketch().quantile(0.5))
+        self.assertRaises(ValueError, sketch.quantile, 1.5)
+
+    def test_merge_and_bounded_buckets(self):
+        rng = random.Random(3)
+        values = [rng.uniform(1, 10 ** 6) for _ in range(2000)]
+        whole, first, second = QuantileSketch(max_buckets=64), QuantileSketch(max_buckets=64), QuantileSketch(max_buckets=64)
+        for i, value in enumerate(values):
+            whole.add(value)
+            (first if i % 2 else second).add(value)
+        first.merge(second)
+        self.assertLessEqual(len(whole.positive), 64)
+        self.assertLessEqual(len(first.positive), 64)
+        self.assertEqual(first.count, 2000)
+        # collapsing only affects the lowest buckets, the upper quantiles stay accurate
+        exact = sorted(values)[int(0.99 * 1999)]
+        self.assertLessEqual(abs(first.quantile(0.99) - exact), 0.01 * exact)
+        self.assertRaises(ValueError, first.merge, QuantileSketch(0.05))
+
+
+class TestSpeciesWins(unittest.TestCase):
+
+    def test_repeated_species_counted_once_per_team(self):
+        wins = SpeciesWins()
+        wins.add(["Charmander", "Charmander", "Squirtle"], True)
+        wins.add(["Charmander", "Bulbasaur", "Bulbasaur"], False)
+        self.assertEqual(wins.battles, {"Charmander": 2, "Squirtle": 1, "Bulbasaur": 1})
+        self.assertEqual(wins.wins, {"Charmander": 1, "Squirtle": 1})
+        self.assertEqual(wins.win_rates(), {"Squirtle": 1.0, "Charmander": 0.5, "Bulbasaur": 0.0})
+
+
+class TestBattleAggregate(unittest.TestCase):
+
+    def test_battle_stream(self):
+        aggregate = aggregate_battles(range(30))
+        summary = aggregate.as_dict()
+        self.assertEqual(sorted(summary["modes"]), ["OPTIMISE", "ROTATE", "SET"])
+        self.assertEqual(sum(mode["battles"] for mode in summary["modes"].values()), 30)
+        for mode in summary["modes"].values():
+            self.assertEqual(mode["remaining_hp"]["count"] + mode["draws"], mode["battles"])
+            self.assertGreater(mode["remaining_hp"]["p50"], 0)
+        self.assertTrue(all(0 <= rate <= 1 for rate in summary["species_win_rates"].values()))
+        self.assertLessEqual(sum(aggregate.species.battles.values()), 30 * 2 * 6)
+        self.assertLessEqual(max(aggregate.species.battles.values()), 30 * 2)
+
+    @unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(), "needs fork")
+    def test_merge_across_processes(self):
+        with ProcessPoolExecutor(2, mp_context=multiprocessing.get_context("fork")) as pool:
+            parts = list(pool.map(aggregate_battles, [range(0, 10), range(10, 20)]))
+        merged = BattleAggregate()
+        for part in parts:
+            merged.merge(part)
+        serial = aggregate_battles(range(20)).as_dict()
+        self.assertEqual(merged.species.win_rates(), serial["species_win_rates"])
+        for name, mode in merged.as_dict()["modes"].items():
+            self.assertEqual(mode["battles"], serial["modes"][name]["battles"])
+            self.assertEqual(mode["remaining_hp"], serial["modes"][name]["remaining_hp"])
+            self.assertAlmostEqual(mode["rounds"]["variance"], serial["modes"][name]["rounds"]["variance"])
+        self.assertEqual(pickle.loads(pickle.dumps(merged)).as_dict(), merged.as_dict())
+
+
+if __name__ == '__main__':
+    unittest.main()
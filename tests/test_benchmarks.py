@@ -0,0 +1,54 @@
+import time
+import unittest
+
+from benchmarks import registry
+
+
+class TestBenchmarkRegistry(unittest.TestCase):
+
+    def test_suite_registers_every_area(self):
+        import benchmarks.suite
+        names = list(registry.BENCHMARKS)
+        for prefix in ("effectiveness.", "battle.set", "battle.rotate", "battle.optimise", "tower.", "adt."):
+            self.assertTrue(any(name.startswith(prefix) for name in names), prefix)
+
+    def test_duplicate_name_rejected(self):
+        registry.benchmark("test.duplicate")(lambda: (lambda: None))
+        try:
+            self.assertRaises(ValueError, registry.benchmark("test.duplicate"), lambda: (lambda: None))
+        finally:
+            del registry.BENCHMARKS["test.duplicate"]
+
+    def test_compare_against_baseline(self):
+        baseline = {"benchmarks": {"a": {"seconds": 1.0}, "b": {"seconds": 1.0}, "gone": {"seconds": 1.0}}}
+        results = {"benchmarks": {"a": {"seconds": 1.2}, "b": {"seconds": 1.5}, "new": {"seconds": 9.0}}}
+        self.assertEqual(registry.compare(results, baseline, 0.25), [("b", 1.0, 1.5, 1.5)])
+        self.assertEqual(len(registry.compare(results, baseline, 0.1)), 2)
+
+        results["benchmarks"]["b"]["threshold"] = 0.6
+        self.assertEqual(registry.compare(results, baseline, 0.25), [])
+        self.assertEqual(len(registry.compare(results, baseline, 0.1)), 1)
+
+    def test_repeats_run_long_enough(self):
+        runs = []
+
+        def setup():
+            return lambda: runs.append(time.sleep(0.01))
+        seconds, loops = registry.time_benchmark(setup, repeats=3)
+        self.assertGreaterEqual(seconds * loops, registry.MIN_SECONDS)
+        self.assertGreater(len(runs), 3 * loops)
+        self.assertGreaterEqual(seconds, 0.01)
+
+
+class TestMemoryBenchmark(unittest.TestCase):
+
+    def test_held_battles(self):
+        from battle_mode import BattleMode
+        from benchmarks.bench_memory import measure
+        one, many = measure(1, BattleMode.ROTATE), measure(20, BattleMode.ROTATE)
+        self.assertGreater(many["held"], one["held"])
+        self.assertGreaterEqual(many["peak"], many["held"])
+
+
+if __name__ == '__main__':
+    unittest.main()
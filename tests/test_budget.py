@@ -0,0 +1,51 @@
+import time
+import unittest
+from io import StringIO
+
+from ed_utils.decorators import budget
+from ed_utils.json_test_runner import JSONTestRunner
+
+
+class TestBudget(unittest.TestCase):
+
+    def run_budgeted(self, test_case: type):
+        runner = JSONTestRunner(stream=StringIO())
+        result = runner.run(unittest.defaultTestLoader.loadTestsFromTestCase(test_case))
+        return runner.json_data["testcases"], result
+
+    def test_over_budget_fails(self):
+        class Slow(unittest.TestCase):
+            @budget(seconds=0.01)
+            def test_slow(self):
+                time.sleep(0.05 * budget.SCALE)
+
+        (testcase,), result = self.run_budgeted(Slow)
+        self.assertFalse(testcase["passed"])
+        self.assertEqual(len(result.failures), 1)
+        self.assertIn("Over budget: seconds", result.failures[0][1])
+        self.assertEqual(testcase["budget"]["seconds"], 0.01 * budget.SCALE)
+        self.assertGreaterEqual(testcase["budget"]["measured"]["seconds"], 0.05 * budget.SCALE)
+
+    def test_budget_field(self):
+        limits = budget(seconds=5, peak_kb=1024)
+
+        class Cheap(unittest.TestCase):
+            @limits
+            def test_cheap(self):
+                self.assertEqual(len([0] * 10), 10)
+
+            def test_unbudgeted(self):
+                pass
+
+        (cheap, unbudgeted), result = self.run_budgeted(Cheap)
+        self.assertTrue(result.wasSuccessful())
+        self.assertEqual(cheap["budget"]["seconds"], 5 * budget.SCALE)
+        self.assertEqual(cheap["budget"]["peak_kb"], 1024 * budget.SCALE)
+        self.assertEqual(set(cheap["budget"]["measured"]), {"seconds", "peak_kb"})
+        self.assertNotIn("budget", unbudgeted)
+        # the measurement stays with the test run, not with the decorator's limits
+        self.assertEqual(limits.v, {"seconds": 5, "peak_kb": 1024})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+
+from benchmarks.complexity import CASES, MODELS, ComplexityCase, ComplexityResult, exceeds, fit_growth, parse_complexity
+from data_structures.array_min_heap import ArrayMinHeap
+from poke_team import PokeTeam
+
+SIZES = (250, 500, 1000, 2000, 4000, 8000)
+NOISE = (1.03, 0.98, 1.0, 1.02, 0.97, 1.01)
+
+
+class TestComplexityHarness(unittest.TestCase):
+
+    def test_fit_recovers_each_model(self):
+        for name, model in MODELS.items():
+            times = [3e-6 * model(n) * noise for n, noise in zip(SIZES, NOISE)]
+            self.assertEqual(fit_growth(SIZES, times), name)
+
+    def test_fit_ignores_constant_overhead(self):
+        times = [1e-3 + 1e-9 * n for n in SIZES]
+        self.assertEqual(fit_growth(SIZES, times), "1")
+
+    def test_parse_complexity(self):
+        self.assertEqual(parse_complexity("BEST CASE: O(1)\n WORST CASE: O(N^2), due to ..."), "n^2")
+        self.assertEqual(parse_complexity("WORST CASE: O(N*logN) if ..."), "n log n")
+        self.assertEqual(parse_complexity(":complexity: O(sqrt(N)) amortised"), "sqrt n")
+        self.assertIsNone(parse_complexity("WORST CASE: O(N * comp(concatenation))"))
+        self.assertIsNone(parse_complexity("No complexity here."))
+        self.assertIsNone(parse_complexity(None))
+        self.assertEqual(parse_complexity(PokeTeam._retrieve_stack_elements.__doc__), "n")
+        self.assertEqual(parse_complexity(ArrayMinHeap.add.__doc__), "log n")
+
+    def test_parse_bound_and_section(self):
+        docstring = "SET MODE:\n - BEST CASE: O(1)\n - WORST CASE: O(N)\nOPTIMISE MODE:\n - BEST CASE: O(1)\n - WORST CASE: O(N^2)"
+        self.assertEqual(parse_complexity(docstring, "BEST CASE"), "1")
+        self.assertEqual(parse_complexity(docstring, section="OPTIMISE MODE"), "n^2")
+        self.assertIsNone(parse_complexity(docstring, section="ROTATE MODE"))
+
+    def test_every_case_is_documented(self):
+        for case in CASES:
+            with self.subTest(case=case.name):
+                self.assertIn(case.documented, MODELS)
+        documented = {case.name: case.documented for case in CASES}
+        self.assertEqual(documented["PokeTeam.assemble_team[OPTIMISE]"], "n^2")
+        self.assertEqual(documented["TypeEffectiveness.get_effectiveness"], "1")
+        self.assertEqual(documented["Battle._update_set_mode"], "1")
+
+    def test_flags_growth_above_documented(self):
+        self.assertTrue(exceeds("n^2", "n"))
+        self.assertFalse(exceeds("n", "n^2"))
+        self.assertFalse(exceeds("n", "n"))
+
+        case = ComplexityCase("quadratic", PokeTeam._retrieve_stack_elements, setup=None, sizes=SIZES)
+        result = ComplexityResult(case, [1e-9 * n * n for n in SIZES])
+        self.assertEqual((result.documented, result.measured, result.flagged), ("n", "n^2", True))
+        result = ComplexityResult(case, [1e-9 * n for n in SIZES])
+        self.assertFalse(result.flagged)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+import contextlib
+import io
+import random
+import unittest
+
+from battle import Battle
+from battle_mode import BattleMode
+from data_structures.array_keyed_sorted_list import ArrayKeyedSortedList
+from data_structures.array_min_heap import ArrayMinHeap
+from data_structures.array_sorted_list import ArraySortedList
+from poke_team import PokeTeam, Trainer
+
+SEED = 29
+
+
+def make_team(criterion, container=None) -> PokeTeam:
+    random.seed(SEED)
+    team = PokeTeam()
+    team.choose_randomly()
+    team.assemble_team(BattleMode.OPTIMISE, criterion, container)
+    return team
+
+
+def drain(team: PokeTeam) -> list:
+    """ Serves every pokemon of an OPTIMISE team, in battle order. """
+    return [team.team.delete_value_at_index(0) for _ in range(len(team.team))]
+
+
+class CriteriaOrder:
+    """ Team orders every OPTIMISE container must produce. Subclasses set container. """
+    container = None
+
+    def test_single_criterion(self):
+        speeds = [pokemon.get_speed() for pokemon in drain(make_team("speed", self.container))]
+        self.assertEqual(len(speeds), PokeTeam.TEAM_LIMIT)
+        self.assertEqual(speeds, sorted(speeds))
+
+    def test_descending_criterion(self):
+        healths = [pokemon.get_health() for pokemon in drain(make_team("-health", self.container))]
+        self.assertEqual(healths, sorted(healths, reverse=True))
+
+    def test_composite_criterion(self):
+        keys = [(pokemon.get_speed(), -pokemon.get_health())
+                for pokemon in drain(make_team(("speed", "-health"), self.container))]
+        self.assertEqual(keys, sorted(keys))
+
+    def test_list_criterion_orders_as_tuple(self):
+        as_list = [pokemon.get_name() for pokemon in drain(make_team(["speed", "-health"], self.container))]
+        as_tuple = [pokemon.get_name() for pokemon in drain(make_team(("speed", "-health"), self.container))]
+        self.assertEqual(as_list, as_tuple)
+
+
+class TestSortedListCriteria(CriteriaOrder, unittest.TestCase):
+    container = ArraySortedList
+
+
+class TestMinHeapCriteria(CriteriaOrder, unittest.TestCase):
+    container = ArrayMinHeap
+
+
+class TestCompileCriterion(unittest.TestCase):
+
+    def test_list_normalised_and_cached(self):
+        key_function = PokeTeam.compile_criterion(["speed", "-health"])
+        self.assertIs(PokeTeam.compile_criterion(("speed", "-health")), key_function)
+        self.assertIs(PokeTeam.COMPILED_CRITERIA[("speed", "-health")], key_function)
+        self.assertIs(PokeTeam.compile_criterion("speed"), PokeTeam.compile_criterion("speed"))
+        self.assertIs(PokeTeam.compile_criterion(None), PokeTeam.compile_criterion("health"))
+
+    def test_keys(self):
+        pokemon = PokeTeam.POKE_LIST[0]()
+        self.assertEqual(PokeTeam.compile_criterion("speed")(pokemon), pokemon.get_speed())
+        self.assertEqual(PokeTeam.compile_criterion("-health")(pokemon), -pokemon.get_health())
+        self.assertEqual(PokeTeam.compile_criterion(("level", "-defence"))(pokemon),
+                         (pokemon.get_level(), -pokemon.get_defence()))
+
+    def test_invalid_criteria(self):
+        for criterion in ("speedy", "", "-", "--speed", (), [], ("speed", "bogus"), ("speed", 3), 3,
+                          ["speed", ["health"]], ("speed", ["health"]), {"speed"}):
+            with self.subTest(criterion=criterion):
+                self.assertRaises(ValueError, PokeTeam.compile_criterion, criterion)
+        self.assertNotIn(("speed", "bogus"), PokeTeam.COMPILED_CRITERIA)
+
+    def test_criterion_getter(self):
+        self.assertEqual(PokeTeam._criterion_getter("defence"), (PokeTeam.CRITERION_GETTERS["defence"], 1))
+        self.assertEqual(PokeTeam._criterion_getter("-level"), (PokeTeam.CRITERION_GETTERS["level"], -1))
+        self.assertRaises(ValueError, PokeTeam._criterion_getter, None)
+
+    def test_keyed_list_rejects_composite_keys(self):
+        self.assertEqual(len(make_team("speed", ArrayKeyedSortedList).team), PokeTeam.TEAM_LIMIT)
+        self.assertRaises(TypeError, make_team, ("speed", "-health"), ArrayKeyedSortedList)
+
+
+class TestTeamKey(unittest.TestCase):
+    CRITERION = ("speed", "-health")
+
+    def setUp(self) -> None:
+        random.seed(SEED)
+        self.battle = Battle(Trainer("Gary"), Trainer("Ash"), BattleMode.OPTIMISE, criterion=self.CRITERION)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.battle._create_teams()
+
+    def assert_sorted(self, team):
+        keys = [team.key_at(index) for index in range(len(team))]
+        self.assertEqual(keys, sorted(keys))
+
+    def test_team_key(self):
+        team = self.battle.trainer_1.get_team()
+        pokemon = team.team.value_at(0)
+        self.assertEqual(team.get_team_key(pokemon), (pokemon.get_speed(), -pokemon.get_health()))
+        team.special(BattleMode.OPTIMISE)
+        self.assertEqual(team.get_team_key(pokemon), (-pokemon.get_speed(), pokemon.get_health()))
+        self.assert_sorted(team.team)
+
+    def test_survivor_reinserted_with_its_key(self):
+        team_1, team_2 = self.battle.trainer_1.get_trainer_team(), self.battle.trainer_2.get_trainer_team()
+        self.battle.trainer_1.get_team().special(BattleMode.OPTIMISE)
+        survivor, fainted = team_1.delete_value_at_index(0), team_2.delete_value_at_index(0)
+        fainted.health = 0
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.battle._update_optimise_mode(survivor, fainted)
+
+        self.assertEqual((len(team_1), len(team_2)), (PokeTeam.TEAM_LIMIT, PokeTeam.TEAM_LIMIT - 1))
+        index = next(i for i in range(len(team_1)) if team_1.value_at(i) is survivor)
+        self.assertEqual(team_1.key_at(index), self.battle.trainer_1.get_team().get_team_key(survivor))
+        self.assertEqual(team_1.key_at(index), (-survivor.get_speed(), survivor.get_health()))
+        self.assert_sorted(team_1)
+
+
+if __name__ == '__main__':
+    unittest.main()
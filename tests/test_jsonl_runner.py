@@ -0,0 +1,38 @@
+import json
+import unittest
+from io import StringIO
+
+from ed_utils.json_test_runner import JSONLinesTestRunner
+
+
+class TestJSONLinesTestRunner(unittest.TestCase):
+
+    def test_one_line_per_test_as_it_finishes(self):
+        stream = StringIO()
+        seen = []
+
+        class Streamed(unittest.TestCase):
+            def test_a(self):
+                print("hello")
+
+            def test_b(self):
+                # test_a's line is written before test_b starts
+                seen.append(stream.getvalue().count("\n"))
+                self.fail("b")
+
+        runner = JSONLinesTestRunner(stream=stream)
+        result = runner.run(unittest.defaultTestLoader.loadTestsFromTestCase(Streamed))
+
+        self.assertEqual(seen, [1])
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual([line["passed"] for line in lines], [True, False])
+        self.assertEqual(lines[0]["output_size"], len("hello\n"))
+        self.assertEqual(lines[0]["feedback"], "hello\n")
+        self.assertTrue(all(line["duration"] >= 0 for line in lines))
+        self.assertEqual(runner.json_data["testcases"], [])
+        self.assertIsNone(result.results)
+        self.assertEqual(len(result.failures), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
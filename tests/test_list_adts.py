@@ -0,0 +1,118 @@
+import random
+import unittest
+
+from data_structures.array_list import ArrayList
+from data_structures.unrolled_list import UnrolledList
+
+
+class ListADTConformance:
+    """ Checks every concrete List ADT must pass. Subclasses set list_class. """
+    list_class = None
+
+    def make(self, items=()):
+        lst = self.list_class()
+        for item in items:
+            lst.append(item)
+        return lst
+
+    def contents(self, lst):
+        return [lst[i] for i in range(len(lst))]
+
+    def test_empty(self):
+        lst = self.make()
+        self.assertEqual(len(lst), 0)
+        self.assertTrue(lst.is_empty())
+        self.assertEqual(str(lst), '[]')
+        self.assertRaises(IndexError, lst.__getitem__, 0)
+        self.assertRaises(IndexError, lst.delete_at_index, 0)
+        self.assertRaises(ValueError, lst.index, 1)
+
+    def test_append_and_getitem(self):
+        lst = self.make(range(100))
+        self.assertEqual(len(lst), 100)
+        self.assertEqual(self.contents(lst), list(range(100)))
+        self.assertEqual(lst[-1], 99)
+        self.assertRaises(IndexError, lst.__getitem__, 100)
+        self.assertRaises(IndexError, lst.__getitem__, -101)
+
+    def test_setitem(self):
+        lst = self.make(range(10))
+        lst[3] = 'three'
+        lst[-1] = 'last'
+        self.assertEqual(lst[3], 'three')
+        self.assertEqual(lst[9], 'last')
+        self.assertRaises(IndexError, lst.__setitem__, 10, 0)
+
+    def test_insert(self):
+        lst = self.make([1, 3])
+        lst.insert(1, 2)
+        lst.insert(0, 0)
+        lst.insert(100, 4)
+        lst.insert(-1, 3.5)
+        self.assertEqual(self.contents(lst), [0, 1, 2, 3, 3.5, 4])
+        self.assertEqual(str(lst), '[0, 1, 2, 3, 3.5, 4]')
+
+    def test_delete_at_index(self):
+        lst = self.make(range(10))
+        self.assertEqual(lst.delete_at_index(0), 0)
+        self.assertEqual(lst.delete_at_index(-1), 9)
+        self.assertEqual(lst.delete_at_index(3), 4)
+        self.assertEqual(self.contents(lst), [1, 2, 3, 5, 6, 7, 8])
+
+    def test_index_and_remove(self):
+        lst = self.make('abcab')
+        self.assertEqual(lst.index('b'), 1)
+        lst.remove('b')
+        self.assertEqual(self.contents(lst), list('acab'))
+        self.assertRaises(ValueError, lst.remove, 'z')
+
+    def test_clear(self):
+        lst = self.make(range(50))
+        lst.clear()
+        self.assertTrue(lst.is_empty())
+        lst.append(7)
+        self.assertEqual(self.contents(lst), [7])
+
+    def test_random_operations_match_python_list(self):
+        rng = random.Random(1008)
+        lst = self.make()
+        expected = []
+        for _ in range(3000):
+            if expected and rng.random() < 0.4:
+                index = rng.randrange(len(expected))
+                self.assertEqual(lst.delete_at_index(index), expected.pop(index))
+            else:
+                index = rng.randint(0, len(expected))
+                lst.insert(index, index)
+                expected.insert(index, index)
+        self.assertEqual(self.contents(lst), expected)
+        while expected:
+            index = rng.randrange(len(expected))
+            self.assertEqual(lst.delete_at_index(index), expected.pop(index))
+        self.assertTrue(lst.is_empty())
+
+
+class TestArrayList(ListADTConformance, unittest.TestCase):
+    list_class = ArrayList
+
+    def test_growth_and_cleared_slots(self):
+        lst = self.make(range(5))
+        self.assertGreaterEqual(len(lst.array), 5)
+        lst.delete_at_index(0)
+        self.assertIsNone(lst.array[len(lst)])
+
+
+class TestUnrolledList(ListADTConformance, unittest.TestCase):
+    list_class = UnrolledList
+
+    def test_block_size_follows_length(self):
+        lst = self.make(range(10000))
+        self.assertGreaterEqual(lst.block_size, 100)
+        self.assertLessEqual(lst.block_count(), 4 * 100)
+        for _ in range(9990):
+            lst.delete_at_index(len(lst) // 2)
+        self.assertEqual(lst.block_size, UnrolledList.MIN_BLOCK_SIZE)
+
+
+if __name__ == '__main__':
+    unittest.main()
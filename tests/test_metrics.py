@@ -0,0 +1,108 @@
+import contextlib
+import io
+import multiprocessing
+import os
+import random
+import tempfile
+import unittest
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor
+
+from battle import Battle
+from battle_mode import BattleMode
+from poke_team import Trainer
+from pokemon import Abra, Aerodactyl
+from simulation.metrics import ROUND_BUCKETS, SimulationMetrics, start_http_server
+
+
+def fight(seed: int, battle_mode: BattleMode = BattleMode.SET) -> tuple:
+    """ Returns a seeded battle after fighting it, its winner and its output. """
+    random.seed(seed)
+    battle = Battle(Trainer("Gary"), Trainer("Ash"), battle_mode)
+    with contextlib.redirect_stdout(io.StringIO()) as output:
+        battle._create_teams()
+        winner = battle.commence_battle()
+    return battle, winner, output.getvalue()
+
+
+def worker_snapshot(seeds: list) -> dict:
+    metrics = SimulationMetrics()
+    for seed in seeds:
+        battle, winner, _ = fight(seed)
+        metrics.record_battle(battle, winner, 0.001)
+    return metrics.snapshot()
+
+
+class TestSimulationMetrics(unittest.TestCase):
+
+    def test_battle_rounds_and_evolutions(self):
+        for battle_mode in BattleMode:
+            battle, winner, output = fight(1008, battle_mode)
+            self.assertEqual(battle.rounds, output.count("OVER"), battle_mode)
+            self.assertEqual(battle.evolutions, output.count("has evolved"), battle_mode)
+
+    def test_evolution_stage(self):
+        abra = Abra()
+        self.assertEqual(abra.get_evolution_stage(), 0)
+        with contextlib.redirect_stdout(io.StringIO()):
+            abra.level_up()
+        self.assertEqual((abra.get_name(), abra.get_evolution_stage()), ("Kadabra", 1))
+        self.assertEqual(Aerodactyl().get_evolution_stage(), 0)
+
+    def test_histogram(self):
+        metrics = SimulationMetrics()
+        for rounds in (1, 3, 3, 1000):
+            metrics.record("SET", rounds)
+        metrics.record("ROTATE", 7, draw=True, evolutions=2, seconds=0.5)
+        text = metrics.render()
+        self.assertIn('pokemon_battle_rounds_bucket{mode="SET",le="1"} 1', text)
+        self.assertIn('pokemon_battle_rounds_bucket{mode="SET",le="5"} 3', text)
+        self.assertIn(f'pokemon_battle_rounds_bucket{{mode="SET",le="{ROUND_BUCKETS[-1]}"}} 3', text)
+        self.assertIn('pokemon_battle_rounds_bucket{mode="SET",le="+Inf"} 4', text)
+        self.assertIn('pokemon_battle_rounds_sum{mode="SET"} 1007', text)
+        self.assertIn('pokemon_draws_total{mode="ROTATE"} 1', text)
+        self.assertIn('pokemon_evolutions_total{mode="ROTATE"} 2', text)
+        self.assertIn('pokemon_battles_per_second{mode="ROTATE"} 2', text)
+        self.assertIn("# TYPE pokemon_battle_rounds histogram", text)
+
+    @unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(), "needs fork")
+    def test_merge_across_processes(self):
+        with ProcessPoolExecutor(2, mp_context=multiprocessing.get_context("fork")) as pool:
+            snapshots = list(pool.map(worker_snapshot, [[1, 2, 3], [4, 5]]))
+        merged = SimulationMetrics()
+        for snapshot in snapshots:
+            merged.merge(snapshot)
+
+        serial = SimulationMetrics()
+        serial.merge(worker_snapshot([1, 2, 3, 4, 5]))
+        serial.started = merged.started
+        self.assertEqual(merged.render(now=merged.started + 1), serial.render(now=merged.started + 1))
+        self.assertEqual(merged.modes["SET"]["battles"], 5)
+
+    def test_write_textfile(self):
+        metrics = SimulationMetrics()
+        metrics.record("OPTIMISE", 4)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "battles.prom")
+            metrics.write_textfile(path)
+            metrics.write_textfile(path)
+            self.assertEqual(os.listdir(directory), ["battles.prom"])
+            with open(path) as file:
+                self.assertIn('pokemon_battles_total{mode="OPTIMISE"} 1', file.read())
+
+    def test_http_endpoint(self):
+        metrics = SimulationMetrics()
+        metrics.record("SET", 2)
+        server = start_http_server(metrics, port=0)
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+            with urllib.request.urlopen(url) as response:
+                self.assertTrue(response.headers["Content-Type"].startswith("text/plain"))
+                self.assertIn('pokemon_battles_total{mode="SET"} 1', response.read().decode())
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import json
+import unittest
+from io import StringIO
+
+from ed_utils.decorators import number
+from ed_utils.json_test_runner import JSONTestRunner, ParallelJSONTestRunner
+
+
+def make_suite():
+    """ Builds a fresh suite of three classes, one of them failing, so none of it is discovered. """
+    class First(unittest.TestCase):
+        @number("1.1")
+        def test_a(self):
+            print("a")
+
+        def test_b(self):
+            pass
+
+    class Second(unittest.TestCase):
+        def test_c(self):
+            self.assertEqual(1, 2)
+
+        def test_d(self):
+            raise ValueError("d")
+
+    class Third(unittest.TestCase):
+        def test_e(self):
+            pass
+
+    loader = unittest.defaultTestLoader
+    return unittest.TestSuite(loader.loadTestsFromTestCase(case) for case in (First, Second, Third))
+
+
+class TestParallelJSONTestRunner(unittest.TestCase):
+
+    def run_json(self, runner):
+        stream = StringIO()
+        result = runner(stream=stream).run(make_suite())
+        return result, json.loads(stream.getvalue())
+
+    def test_same_json_as_serial(self):
+        _, serial = self.run_json(JSONTestRunner)
+        _, parallel = self.run_json(lambda **kwargs: ParallelJSONTestRunner(jobs=3, **kwargs))
+        self.assertEqual(parallel, serial)
+        self.assertEqual([case["passed"] for case in parallel["testcases"]], [True, True, False, False, True])
+        self.assertTrue(parallel["testcases"][0]["name"].startswith("1.1: "))
+
+    def test_result_counts(self):
+        result, _ = self.run_json(lambda **kwargs: ParallelJSONTestRunner(jobs=2, **kwargs))
+        self.assertEqual(result.testsRun, 5)
+        self.assertEqual([test._testMethodName for test, _ in result.failures], ["test_c"])
+        self.assertEqual([test._testMethodName for test, _ in result.errors], ["test_d"])
+        self.assertFalse(result.wasSuccessful())
+
+    def test_more_jobs_than_classes(self):
+        _, parallel = self.run_json(lambda **kwargs: ParallelJSONTestRunner(jobs=16, **kwargs))
+        self.assertEqual(len(parallel["testcases"]), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
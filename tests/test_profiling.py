@@ -0,0 +1,179 @@
+import builtins
+import contextlib
+import io
+import multiprocessing
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+import unittest
+
+from battle import Battle
+from battle_mode import BattleMode
+from poke_team import Trainer
+from pokemon_base import Pokemon
+from profiling import capture, memory
+from profiling.phases import PHASES, is_enabled, profile
+from tower import BattleTower
+
+
+def seeded_battle(seed: int = 1008) -> Battle:
+    random.seed(seed)
+    battle = Battle(Trainer("Gary"), Trainer("Ash"), BattleMode.OPTIMISE)
+    with contextlib.redirect_stdout(io.StringIO()):
+        battle._create_teams()
+    return battle
+
+
+class TestPhaseProfile(unittest.TestCase):
+
+    def test_disabled_leaves_classes_untouched(self):
+        attack, printer = vars(Pokemon)["attack"], builtins.print
+        with Battle.profile():
+            self.assertTrue(is_enabled())
+            self.assertIsNot(vars(Pokemon)["attack"], attack)
+        self.assertFalse(is_enabled())
+        self.assertIs(vars(Pokemon)["attack"], attack)
+        self.assertIs(builtins.print, printer)
+
+    def test_battle_phases(self):
+        battle = seeded_battle()
+        with Battle.profile() as phases, contextlib.redirect_stdout(io.StringIO()):
+            battle.commence_battle()
+        result = phases.as_dict()
+        self.assertEqual(set(result), set(PHASES) | {"other", "total"})
+        for phase in ("effectiveness", "damage", "containers", "print"):
+            self.assertGreater(result[phase]["calls"], 0, phase)
+        # every attack looks up one effectiveness
+        self.assertEqual(result["effectiveness"]["calls"] * 2, result["damage"]["calls"])
+        self.assertEqual(sum(result[phase]["ns"] for phase in PHASES) + result["other"]["ns"], result["total"]["ns"])
+        self.assertGreaterEqual(result["other"]["ns"], 0)
+
+    def test_same_outcome_as_unprofiled(self):
+        with contextlib.redirect_stdout(io.StringIO()) as plain:
+            winner = seeded_battle().commence_battle()
+        with Battle.profile(), contextlib.redirect_stdout(io.StringIO()) as profiled:
+            profiled_winner = seeded_battle().commence_battle()
+        self.assertEqual(getattr(winner, "name", None), getattr(profiled_winner, "name", None))
+        self.assertEqual(plain.getvalue(), profiled.getvalue())
+
+    def test_tower_teams_phase(self):
+        random.seed(1008)
+        tower = BattleTower()
+        with BattleTower.profile() as phases, contextlib.redirect_stdout(io.StringIO()):
+            tower.set_my_trainer(Trainer("Ash"))
+            tower.my_trainer.pick_team("Random")
+            tower.my_trainer.get_team().assemble_team(BattleTower.BATTLE_MODE)
+            tower.generate_enemy_trainers(5)
+            while tower.battles_remaining():
+                tower.next_battle()
+        self.assertGreater(phases.as_dict()["teams"]["calls"], 5)
+
+    def test_nested_profile_rejected(self):
+        with profile():
+            with self.assertRaises(RuntimeError):
+                with profile():
+                    pass
+        self.assertFalse(is_enabled())
+
+
+def profile_in_child(directory: str, battles: int) -> None:
+    os.environ[capture.ENVIRONMENT_VARIABLE] = directory
+    for seed in range(battles):
+        with capture.profiled(), contextlib.redirect_stdout(io.StringIO()):
+            seeded_battle(seed).commence_battle()
+
+
+@unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(), "needs fork")
+class TestCapture(unittest.TestCase):
+
+    def run_children(self, directory: str, count: int) -> list:
+        context = multiprocessing.get_context("fork")
+        children = [context.Process(target=profile_in_child, args=(directory, 2)) for _ in range(count)]
+        for child in children:
+            child.start()
+        for child in children:
+            child.join()
+        return [child.pid for child in children]
+
+    def test_one_file_per_process_and_merge(self):
+        with tempfile.TemporaryDirectory() as directory:
+            pids = self.run_children(directory, 2)
+            files = sorted(os.listdir(directory))
+            self.assertEqual(files, sorted(f"profile-{pid}.pstats" for pid in pids))
+
+            merged = os.path.join(directory, "merged.pstats")
+            stats = capture.merge([directory], merged)
+            self.assertTrue(os.path.exists(merged))
+            calls = {function[2]: value[1] for function, value in stats.stats.items()}
+            self.assertEqual(calls["commence_battle"], 4)
+
+    def test_merge_without_profiles(self):
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertRaises(ValueError, capture.merge, [directory])
+
+    def test_import_wraps_nothing(self):
+        # a fresh interpreter, with CPROFILE_DIR set, importing the entry points
+        code = ("import battle, tower; "
+                "print(vars(battle.Battle)['commence_battle'].__qualname__, "
+                "vars(tower.BattleTower)['next_battle'].__qualname__)")
+        environment = dict(os.environ, **{capture.ENVIRONMENT_VARIABLE: "profiles"})
+        output = subprocess.run([sys.executable, "-c", code], env=environment, capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))), check=True)
+        self.assertEqual(output.stdout.split(), ["Battle.commence_battle", "BattleTower.next_battle"])
+
+    def test_install_and_uninstall(self):
+        commence, next_battle = vars(Battle)["commence_battle"], vars(BattleTower)["next_battle"]
+        variable = capture.ENVIRONMENT_VARIABLE
+        saved = os.environ.get(variable)
+        try:
+            with tempfile.TemporaryDirectory() as directory:
+                capture.install(directory)
+                capture.install()
+                self.assertEqual(os.environ[variable], os.path.abspath(directory))
+                self.assertIs(vars(Battle)["commence_battle"].__wrapped__, commence)
+                self.assertIs(vars(BattleTower)["next_battle"].__wrapped__, next_battle)
+        finally:
+            capture.uninstall()
+            os.environ.pop(variable, None)
+            if saved is not None:
+                os.environ[variable] = saved
+        self.assertIs(vars(Battle)["commence_battle"], commence)
+        self.assertIs(vars(BattleTower)["next_battle"], next_battle)
+
+
+class TestMemoryProfile(unittest.TestCase):
+
+    def test_battle_regions(self):
+        report = memory.profile_battles(20, BattleMode.SET)
+        regions = report["regions"]
+        self.assertEqual(regions["regenerate_team"]["calls"], 40)
+        self.assertGreater(regions["battle_logic"]["calls"], 0)
+        self.assertEqual(regions["battle_logic"]["calls"], regions["update_set_mode"]["calls"])
+        self.assertEqual(regions["update_rotate_mode"]["calls"], 0)
+        self.assertEqual(report["samples"], 20)
+        for region in regions.values():
+            self.assertGreaterEqual(region["transient_bytes"], region["peak_bytes"])
+            self.assertLessEqual(region["peak_bytes"], report["peak_bytes"])
+        self.assertGreater(report["steady_state"]["bytes"], 0)
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_retrieval_and_restore(self):
+        battle = seeded_battle()
+        getitem = vars(type(battle.trainer_1.get_team()))["__getitem__"]
+        with memory.tracing() as traced:
+            battle.trainer_1.get_team()[0]
+            self.assertRaises(RuntimeError, memory.tracing().__enter__)
+        self.assertEqual(traced.regions["retrieval"].calls, 1)
+        self.assertIs(vars(type(battle.trainer_1.get_team()))["__getitem__"], getitem)
+
+    def test_steady_state_of_a_leak(self):
+        profile = memory.MemoryProfile()
+        profile.samples.extend(range(0, 1000, 10))
+        self.assertAlmostEqual(profile.steady_state()["growth_per_sample"], 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import contextlib
+import io
+import os
+import random
+import tempfile
+import unittest
+
+from battle import Battle
+from battle_mode import BattleMode
+from poke_team import Trainer
+from simulation import results
+from simulation.results import RECORD, BattleRecord, ResultReader, ResultWriter
+
+
+def records(count: int) -> list:
+    return [(seed, seed % 3, seed % 5, seed % 3 - 1, seed * 2, seed % 12, seed / 4, -seed / 8) for seed in range(count)]
+
+
+class TestResultStore(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "results.npy")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip_in_chunks(self):
+        expected = records(1000)
+        with ResultWriter(self.path, chunk_records=64) as writer:
+            for record in expected:
+                writer.append(record)
+            self.assertEqual(writer.count, 1000)
+        self.assertEqual(os.path.getsize(self.path), results.HEADER_SIZE + 1000 * RECORD.size)
+        with ResultReader(self.path) as reader:
+            self.assertEqual(len(reader), 1000)
+            self.assertEqual([tuple(record) for record in reader], expected)
+            self.assertEqual(reader[-1], BattleRecord(*expected[-1]))
+            self.assertEqual(sum(reader.column("rounds")), sum(record[4] for record in expected))
+            self.assertRaises(IndexError, reader.__getitem__, 1000)
+
+    def test_file_is_valid_after_each_chunk(self):
+        writer = ResultWriter(self.path, chunk_records=10)
+        for record in records(25):
+            writer.append(record)
+        with ResultReader(self.path) as reader:
+            self.assertEqual(len(reader), 20)
+        writer.close()
+        with ResultReader(self.path) as reader:
+            self.assertEqual(len(reader), 25)
+
+    def test_resume_with_append(self):
+        expected = records(30)
+        with ResultWriter(self.path) as writer:
+            for record in expected[:20]:
+                writer.append(record)
+        with open(self.path, "ab") as file:
+            file.write(b"torn")
+        with ResultWriter(self.path, append=True) as writer:
+            self.assertEqual(writer.count, 20)
+            for record in expected[20:]:
+                writer.append(record)
+        with ResultReader(self.path) as reader:
+            self.assertEqual([tuple(record) for record in reader], expected)
+
+    def test_empty_and_invalid_files(self):
+        ResultWriter(self.path).close()
+        with ResultReader(self.path) as reader:
+            self.assertEqual(list(reader), [])
+        with open(self.path, "wb") as file:
+            file.write(b"not a result file" * 20)
+        self.assertRaises(ValueError, ResultReader, self.path)
+
+    def test_battle_record(self):
+        random.seed(1008)
+        battle = Battle(Trainer("Gary"), Trainer("Ash"), BattleMode.ROTATE)
+        with contextlib.redirect_stdout(io.StringIO()):
+            battle._create_teams()
+            winner = battle.commence_battle()
+        seed, mode, criterion, outcome, rounds, survivors, hp_1, hp_2 = results.battle_record(7, battle, winner)
+        self.assertEqual((seed, mode, criterion, rounds), (7, BattleMode.ROTATE.value, 0, battle.rounds))
+        self.assertEqual(outcome, {None: 0, battle.trainer_1: 1, battle.trainer_2: 2}[winner])
+        remaining = len(battle.trainer_1.get_trainer_team()) + len(battle.trainer_2.get_trainer_team())
+        self.assertEqual(survivors, remaining)
+        self.assertEqual(hp_1 > 0, outcome == 1)
+        self.assertEqual(hp_2 > 0, outcome == 2)
+
+    @unittest.skipIf(results.numpy is None, "needs NumPy")
+    def test_numpy_reads_the_file(self):
+        with ResultWriter(self.path) as writer:
+            for record in records(10):
+                writer.append(record)
+        with ResultReader(self.path) as reader:
+            array = reader.to_numpy()
+            self.assertEqual(array.shape, (10,))
+            self.assertEqual(array["rounds"].tolist(), [record[4] for record in records(10)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import contextlib
+import csv
+import io
+import multiprocessing
+import os
+import tempfile
+import unittest
+
+from battle_mode import BattleMode
+from poke_team import PokeTeam, Trainer
+from simulation.driver import SEED, main, tower_chunk
+from simulation.results import ResultReader
+
+FORK = "fork" in multiprocessing.get_all_start_methods()
+
+
+class TestSimulationCommandLine(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.directory.name, name)
+
+    def run_main(self, *argv: str) -> str:
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            self.assertEqual(main(list(argv)), 0)
+        return output.getvalue()
+
+    def test_simulate(self):
+        output = self.run_main("simulate", "-n", "40", "--mode", "OPTIMISE", "--criterion", "speed",
+                               "-o", self.path("serial.npy"), "--metrics", self.path("battles.prom"))
+        self.assertIn("simulate: 40 battles", output)
+        self.assertIn("battles/s", output)
+        with ResultReader(self.path("serial.npy")) as reader:
+            self.assertEqual(len(reader), 40)
+            self.assertEqual(list(reader.column("seed")), list(range(1008, 1048)))
+            self.assertEqual(set(reader.column("criterion")), {PokeTeam.CRITERION_LIST.index("speed")})
+        with open(self.path("battles.prom")) as file:
+            self.assertIn('pokemon_battles_total{mode="OPTIMISE"} 40', file.read())
+
+    @unittest.skipUnless(FORK, "needs fork")
+    def test_workers_give_the_same_results(self):
+        self.run_main("simulate", "-n", "600", "-o", self.path("serial.npy"))
+        self.run_main("simulate", "-n", "600", "-w", "2", "-o", self.path("parallel.npy"))
+        with open(self.path("serial.npy"), "rb") as serial, open(self.path("parallel.npy"), "rb") as parallel:
+            self.assertEqual(serial.read(), parallel.read())
+
+    def test_tower(self):
+        output = self.run_main("tower", "-n", "3", "--lives", "2", "--enemies", "4", "-o", self.path("tower.npy"))
+        self.assertIn("3 towers", output)
+        with ResultReader(self.path("tower.npy")) as reader:
+            self.assertGreaterEqual(len(reader), 3 * 2)
+            self.assertEqual(set(reader.column("seed")), {1008, 1009, 1010})
+
+    def test_matrix(self):
+        output = self.run_main("matrix", "-o", self.path("matrix.csv"))
+        species = len(PokeTeam.POKE_LIST)
+        self.assertIn(f"matrix: {species * species} battles", output)
+        with open(self.path("matrix.csv"), newline="") as file:
+            rows = list(csv.reader(file))
+        self.assertEqual(len(rows), species + 1)
+        self.assertEqual(rows[0][1:], [row[0] for row in rows[1:]])
+        self.assertTrue(all(float(score) in (0.0, 0.5, 1.0) for row in rows[1:] for score in row[1:]))
+
+    def test_counts_must_be_positive(self):
+        for argv in (["simulate", "-w", "0"], ["simulate", "-w", "-2"], ["simulate", "-n", "0"],
+                     ["tower", "--lives", "0"], ["tower", "--enemies", "0"], ["matrix", "-w", "x"]):
+            with self.subTest(argv=argv), contextlib.redirect_stderr(io.StringIO()) as errors:
+                with self.assertRaises(SystemExit):
+                    main(argv)
+                self.assertIn("argument", errors.getvalue())
+
+    def test_lives_are_kept(self):
+        # with a single life, the tower ends at the player's first loss or draw
+        for seed in range(SEED, SEED + 5):
+            records, _, _, _ = tower_chunk((seed, seed + 1, "ROTATE", 1, 4))
+            outcomes = [record[3] for record in records]
+            self.assertNotIn(2, outcomes[:-1])
+            self.assertNotIn(0, outcomes[:-1])
+
+
+class TestPickSpecies(unittest.TestCase):
+
+    def test_single_pokemon_team(self):
+        species = PokeTeam.POKE_LIST[0]
+        trainer = Trainer("Row")
+        trainer.pick_species(species)
+        team = trainer.get_team()
+        self.assertEqual(team.team_count, 1)
+        self.assertIsInstance(team.selected_pokemons[0], species)
+        self.assertEqual(team.health_records[0], team.selected_pokemons[0].get_health())
+        self.assertTrue(trainer.team_registered)
+        self.assertEqual(len(trainer.pokedex), 1)
+
+        team.assemble_team(BattleMode.ROTATE)
+        self.assertEqual(len(team.team), 1)
+
+    def test_species_count_checked(self):
+        trainer = Trainer("Row")
+        self.assertRaises(ValueError, trainer.pick_species)
+        self.assertRaises(ValueError, trainer.pick_species, *[PokeTeam.POKE_LIST[0]] * (PokeTeam.TEAM_LIMIT + 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from ed_utils.decorators import number, visibility
+from ed_utils.decorators import number, visibility, budget
 from unittest.mock import patch
 import random
 from poke_team import *
@@ -37,6 +37,7 @@ class TestBattle(unittest.TestCase):
 
     @number("3.1")
     @visibility(visibility.VISIBILITY_SHOW)
+    @budget(seconds=0.5, peak_kb=512)
     def test_set_battle_result(self):
         winner, expected_winner = self.__test_set_battle()
         # Check winner (Ash's team)
@@ -44,6 +45,7 @@ class TestBattle(unittest.TestCase):
 
     @number("3.2")
     @visibility(visibility.VISIBILITY_SHOW)
+    @budget(seconds=0.5, peak_kb=512)
     def test_set_battle_pokedex_completion(self):
         _, _ = self.__test_set_battle()
         # Check trainer's Pokedex completion (2 decimal places)
@@ -53,6 +55,7 @@ class TestBattle(unittest.TestCase):
 
     @number("3.3")
     @visibility(visibility.VISIBILITY_SHOW)
+    @budget(seconds=0.5, peak_kb=512)
     def test_set_battle_team_structure(self):
         _, _ = self.__test_set_battle()
 
@@ -66,6 +69,7 @@ class TestBattle(unittest.TestCase):
 
     @number("3.4")
     @visibility(visibility.VISIBILITY_SHOW)
+    @budget(seconds=0.5, peak_kb=512)
     def test_rotate_battle_result(self):
         winner, expected_winner = self.__test_rotate_battle()
         # Check winner (Ash's team)
@@ -73,6 +77,7 @@ class TestBattle(unittest.TestCase):
 
     @number("3.5")
     @visibility(visibility.VISIBILITY_SHOW)
+    @budget(seconds=0.5, peak_kb=512)
     def test_rotate_battle_pokedex_completion(self):
         _, _ = self.__test_rotate_battle()
 
@@ -82,6 +87,7 @@ class TestBattle(unittest.TestCase):
 
     @number("3.6")
     @visibility(visibility.VISIBILITY_SHOW)
+    @budget(seconds=0.5, peak_kb=512)
     def test_rotate_battle_team_structure(self):
         _, _ = self.__test_rotate_battle()
 
@@ -97,6 +103,7 @@ class TestBattle(unittest.TestCase):
 
     @number("3.7")
     @visibility(visibility.VISIBILITY_SHOW)
+    @budget(seconds=0.5, peak_kb=512)
     def test_optimise_special(self):
         # Note: this should create a team in ascending order, where the criterion is their current health
         _ = self.__create_teams(BattleMode.OPTIMISE, "health")
@@ -107,12 +114,14 @@ class TestBattle(unittest.TestCase):
 
     @number("3.8")
     @visibility(visibility.VISIBILITY_SHOW)
+    @budget(seconds=0.5, peak_kb=512)
     def test_optimise_result(self):
         winner, expected_winner = self.__test_optimise_battle()
         self.assertEqual(expected_winner.get_name(), winner.get_name(), f"Optimise battle failed - {expected_winner.get_name()} should win")
 
     @number("3.9")
     @visibility(visibility.VISIBILITY_SHOW)
+    @budget(seconds=0.5, peak_kb=512)
     def test_optimise_pokedex_completion(self):
         _, _ = self.__test_optimise_battle()
         # Check trainer's Pokedex completion (2 decimal places)
@@ -121,6 +130,7 @@ class TestBattle(unittest.TestCase):
 
     @number("3.10")
     @visibility(visibility.VISIBILITY_SHOW)
+    @budget(seconds=0.5, peak_kb=512)
     def test_optimise_team_structure(self):
         _, _ = self.__test_optimise_battle()
 
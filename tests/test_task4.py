@@ -1,5 +1,5 @@
 import unittest
-from ed_utils.decorators import number, visibility
+from ed_utils.decorators import number, visibility, budget
 from unittest.mock import patch
 import random
 from poke_team import *
@@ -25,6 +25,7 @@ class TestTower(unittest.TestCase):
 
     @number("4.1")
     @visibility(visibility.VISIBILITY_SHOW)
+    @budget(seconds=2, peak_kb=2048)
     def test_tower(self):
         # Check number of enemies defeated
         self.assertEqual(self.bt.enemies_defeated(), 0, "Battle tower not set up correctly")
@@ -34,6 +35,7 @@ class TestTower(unittest.TestCase):
 
     @number("4.2")
     @visibility(visibility.VISIBILITY_SHOW)
+    @budget(seconds=2, peak_kb=2048)
     def test_regenerate_set(self):
         while self.bt.battles_remaining():
             self.bt.next_battle()
@@ -42,6 +44,7 @@ class TestTower(unittest.TestCase):
 
     @number("4.3")
     @visibility(visibility.VISIBILITY_SHOW)
+    @budget(seconds=2, peak_kb=2048)
     def test_regenerate_rotate(self):
         while self.bt.battles_remaining():
             self.bt.next_battle()
@@ -50,6 +53,7 @@ class TestTower(unittest.TestCase):
 
     @number("4.4")
     @visibility(visibility.VISIBILITY_SHOW)
+    @budget(seconds=2, peak_kb=2048)
     def test_regenerate_optimise(self):
         while self.bt.battles_remaining():
             self.bt.next_battle()
@@ -0,0 +1,52 @@
+import contextlib
+import io
+import time
+import unittest
+
+from ed_utils.timeout import process_timeout
+
+
+class TestProcessTimeout(unittest.TestCase):
+
+    def test_result_and_output(self):
+        @process_timeout(5)
+        def talk(x):
+            print("in the child")
+            return x * 2
+        relayed = io.StringIO()
+        with contextlib.redirect_stdout(relayed):
+            self.assertEqual(talk(21), 42)
+        self.assertEqual(relayed.getvalue(), "in the child\n")
+
+    def test_exception_is_raised_here(self):
+        @process_timeout(5)
+        def fail():
+            assert 1 == 2, "wrong"
+        with self.assertRaisesRegex(AssertionError, "wrong"):
+            fail()
+
+    def test_stuck_test_is_terminated(self):
+        @process_timeout(0.5)
+        def spin():
+            while True:
+                pass
+        start = time.perf_counter()
+        self.assertRaises(TimeoutError, spin)
+        self.assertLess(time.perf_counter() - start, 3)
+
+    def test_cpu_limit(self):
+        @process_timeout(10, cpu_seconds=1)
+        def spin():
+            while True:
+                pass
+        self.assertRaisesRegex(RuntimeError, "exited with code", spin)
+
+    def test_memory_limit(self):
+        @process_timeout(5, memory_mb=512)
+        def hog():
+            return len(bytearray(2 * 1024 ** 3))
+        self.assertRaises(MemoryError, hog)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,6 +7,7 @@ __date__: April 10 2024
 """
 from poke_team import Trainer
 from data_structures.queue_adt import CircularQueue
+from data_structures.ring_buffer import RingBuffer
 from typing import Tuple
 import random
 from battle_mode import *
@@ -29,7 +30,23 @@ class BattleTower:
         self.enemy_trainers: CircularQueue = None # stores all the enemy trainers lives
         self.enemy_trainers_lives: CircularQueue = None # stores all the enemy trainer's lives
         self.wins: int = 0 # stores all the my trainers wins against enemy lives.
+        self.last_battle: Battle = None # the battle fought by the last next_battle(), for its rounds and evolutions.
     
+    @staticmethod
+    def profile():
+        """
+        __description__: Times the phases of the tower battles run inside a with block, the same as Battle.profile(),
+                         so team generation and regeneration show up as "teams".
+
+        Usage:
+            with BattleTower.profile() as phases:
+                while tower.battles_remaining():
+                    tower.next_battle()
+            phases.as_dict()
+        """
+        from profiling.phases import profile
+        return profile()
+
     def set_my_trainer(self, trainer: Trainer) -> None:
         """
         __description__: Setting the trainer of the battle tower class.
@@ -51,8 +68,9 @@ class BattleTower:
                         ROTATE mode.
         """
         
-        self.enemy_trainers = CircularQueue(num_teams) # O(1): Few elements to be stored | O(N): N elements to be stored.
-        self.enemy_trainers_lives = CircularQueue(num_teams) # O(1): Few elements to be stored | O(N): N elements to be stored.
+        # ring buffers grow as trainers are appended, so the queues need not be sized up front.
+        self.enemy_trainers = RingBuffer() # O(1) amortised per append.
+        self.enemy_trainers_lives = RingBuffer() # O(1) amortised per append.
         
         # Iterating each time to randomly generate a enemy trainer.
         for i in range(1, num_teams+1):
@@ -96,6 +114,7 @@ class BattleTower:
         # getting battle information
         current_battle: Battle = Battle(self.my_trainer, current_enemy, self.BATTLE_MODE)
         battle_outcome: Trainer | None = current_battle.commence_battle()
+        self.last_battle = current_battle
         
         # if my trainer wins, update enemy live and wins.
         if battle_outcome == self.my_trainer: